@@ -101,6 +101,11 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--trace-startup",
+        action="store_true",
+        help="Write a trace of the startup to CONFIG/startup_trace.json",
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -196,6 +201,7 @@ def main() -> int:
         safe_mode=args.safe_mode,
         debug=args.debug,
         open_ui=args.open_ui,
+        trace_startup=args.trace_startup,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
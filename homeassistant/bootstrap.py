@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 from datetime import datetime, timedelta
+import importlib
 import logging
 import logging.handlers
 import os
@@ -23,10 +24,12 @@ from .const import (
     REQUIRED_NEXT_PYTHON_HA_RELEASE,
     REQUIRED_NEXT_PYTHON_VER,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
+    Platform,
 )
 from .exceptions import HomeAssistantError
 from .helpers import (
     area_registry,
+    config_per_platform,
     device_registry,
     entity,
     entity_registry,
@@ -36,8 +39,13 @@ from .helpers import (
     template,
 )
 from .helpers.dispatcher import async_dispatcher_send
+from .helpers.startup_trace import (
+    async_enable_startup_trace,
+    async_finish_startup_trace,
+)
 from .helpers.typing import ConfigType
 from .setup import (
+    DATA_IMPORT_TIME,
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
@@ -68,6 +76,7 @@ WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
 MAX_LOAD_CONCURRENTLY = 6
+MAX_PRE_IMPORT_CONCURRENTLY = 4
 
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 CORE_INTEGRATIONS = {"homeassistant", "persistent_notification"}
@@ -111,6 +120,8 @@ async def async_setup_hass(
 ) -> core.HomeAssistant | None:
     """Set up Home Assistant."""
     hass = core.HomeAssistant(runtime_config.config_dir)
+    if runtime_config.trace_startup:
+        async_enable_startup_trace(hass)
 
     async_enable_logging(
         hass,
@@ -536,6 +547,117 @@ async def async_setup_multi_components(
             )
 
 
+@core.callback
+def _get_yaml_platforms(
+    config: dict[str, Any], domains: set[str]
+) -> dict[str, set[str]]:
+    """Return the entity platforms set up from YAML, grouped by integration."""
+    platforms: dict[str, set[str]] = {}
+    for platform in Platform:
+        if platform.value not in domains:
+            continue
+        for p_name, _ in config_per_platform(config, platform.value):
+            if p_name is not None:
+                platforms.setdefault(p_name, set()).add(platform.value)
+    return platforms
+
+
+def _pre_import_integration(
+    integration: loader.Integration,
+    yaml_platforms: set[str],
+    with_entries: bool,
+    import_time: dict[str, dict[str, float]],
+) -> None:
+    """Import the modules of an integration that will be set up.
+
+    This is run in the executor.
+    """
+    platforms = set(yaml_platforms)
+    if with_entries and integration.file_path is not None:
+        with contextlib.suppress(OSError):
+            entity_platforms = {platform.value for platform in Platform}
+            platforms.update(
+                path.stem
+                for path in integration.file_path.iterdir()
+                if path.stem in entity_platforms
+            )
+
+    # Components which are already loaded are in the loader cache
+    components: dict[str, Any] = integration.hass.data[loader.DATA_COMPONENTS]
+    domain = integration.domain
+    module_names = {domain: integration.pkg_path}
+    for platform in sorted(platforms):
+        module_names[f"{domain}.{platform}"] = f"{integration.pkg_path}.{platform}"
+    times = import_time.setdefault(domain, {})
+    for cache_key, module_name in module_names.items():
+        if cache_key in components or module_name in sys.modules:
+            continue
+        start = monotonic()
+        try:
+            importlib.import_module(module_name)
+        except Exception as err:  # pylint: disable=broad-except
+            # The error is reported when the integration is set up
+            _LOGGER.debug("Unable to pre-import %s: %s", module_name, err)
+            return
+        times[module_name] = monotonic() - start
+
+
+@core.callback
+def _async_pre_import_integrations(
+    hass: core.HomeAssistant,
+    config: dict[str, Any],
+    integrations: dict[str, loader.Integration],
+) -> None:
+    """Start importing the modules of the integrations to set up.
+
+    Integrations are imported in the executor concurrently, but only
+    after the modules of all their dependencies have been imported.
+    Setting up an integration waits for its import, so its modules
+    are never imported by the event loop at the same time.
+
+    Integrations with requirements are not imported as their
+    requirements are only installed during setup.
+    """
+    import_time: dict[str, dict[str, float]] = hass.data.setdefault(
+        DATA_IMPORT_TIME, {}
+    )
+    yaml_platforms = _get_yaml_platforms(config, set(integrations))
+    entry_domains = set(hass.config_entries.async_domains())
+    semaphore = asyncio.Semaphore(MAX_PRE_IMPORT_CONCURRENTLY)
+    tasks: dict[str, asyncio.Task[None]] = hass.data.setdefault(
+        loader.DATA_PRE_IMPORTS, {}
+    )
+
+    async def _async_pre_import(integration: loader.Integration) -> None:
+        """Import an integration once its dependencies are imported."""
+        if dependencies := [
+            tasks[dep] for dep in integration.all_dependencies if dep in tasks
+        ]:
+            await asyncio.wait(dependencies)
+        async with semaphore:
+            await hass.async_add_executor_job(
+                _pre_import_integration,
+                integration,
+                yaml_platforms.get(integration.domain, set()),
+                integration.domain in entry_domains,
+                import_time,
+            )
+
+    for domain, integration in integrations.items():
+        if integration.requirements:
+            continue
+        tasks[domain] = hass.async_create_task(
+            _async_pre_import(integration), f"pre-import {domain}"
+        )
+
+
+@core.callback
+def _async_cancel_pre_imports(hass: core.HomeAssistant) -> None:
+    """Cancel the imports of integrations which were not set up."""
+    for task in hass.data.pop(loader.DATA_PRE_IMPORTS, {}).values():
+        task.cancel()
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -583,6 +705,10 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Import the integrations in the executor while the
+    # first stages are set up so setup does not wait on them
+    _async_pre_import_integrations(hass, config, integration_cache)
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -665,6 +791,8 @@ async def _async_set_up_integrations(
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
+    _async_cancel_pre_imports(hass)
+
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
@@ -675,6 +803,7 @@ async def _async_set_up_integrations(
 
     watch_task.cancel()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATIONS, {})
+    await async_finish_startup_trace(hass)
 
     _LOGGER.debug(
         "Integration setup times: %s",
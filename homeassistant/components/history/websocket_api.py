@@ -6,6 +6,8 @@ from collections.abc import Callable, Iterable, MutableMapping
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
+import math
+from operator import itemgetter
 from typing import Any, cast
 
 import voluptuous as vol
@@ -38,7 +40,7 @@ from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import EVENT_COALESCE_TIME, HISTORY_CHUNK_TIME, MAX_PENDING_HISTORY_STATES
 from .helpers import entities_may_have_state_changes_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -62,6 +64,79 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+def _bucket_states(
+    bucket_states: list[tuple[float, dict[str, Any]]],
+    first_non_numeric: dict[str, Any] | None,
+    last_state: dict[str, Any] | None,
+) -> list[dict[str, Any]]:
+    """Return at most two states of a bucket in time order.
+
+    A bucket with a non-numeric state keeps its first non-numeric state and
+    its last state, otherwise the lowest and highest state are kept.
+    """
+    if first_non_numeric is not None:
+        if first_non_numeric is last_state or last_state is None:
+            return [first_non_numeric]
+        return [first_non_numeric, last_state]
+    if not bucket_states:
+        return []
+    low = min(bucket_states, key=itemgetter(0))[1]
+    high = max(bucket_states, key=itemgetter(0))[1]
+    if low is high:
+        return [low]
+    return sorted((low, high), key=itemgetter(COMPRESSED_STATE_LAST_UPDATED))
+
+
+def _downsample_compressed_states(
+    states: list[dict[str, Any]], max_points: int
+) -> list[dict[str, Any]]:
+    """Reduce the compressed states of an entity to at most max_points states.
+
+    The first and last states are always kept. The states in between are
+    split into equal time buckets and at most two states are kept of each
+    bucket, see _bucket_states. States which are not finite numbers, such as
+    unavailable or NaN, count as non-numeric.
+    """
+    if len(states) <= max_points:
+        return states
+    first_state = states[0]
+    last_state = states[-1]
+    first_ts: float = first_state[COMPRESSED_STATE_LAST_UPDATED]
+    bucket_count = (max_points - 2) // 2
+    bucket_time = (
+        last_state[COMPRESSED_STATE_LAST_UPDATED] - first_ts
+    ) / bucket_count or 1.0
+    downsampled: list[dict[str, Any]] = [first_state]
+    bucket_states: list[tuple[float, dict[str, Any]]] = []
+    first_non_numeric: dict[str, Any] | None = None
+    previous_state: dict[str, Any] | None = None
+    bucket = 0
+    for state in states[1:-1]:
+        state_bucket = min(
+            int((state[COMPRESSED_STATE_LAST_UPDATED] - first_ts) // bucket_time),
+            bucket_count - 1,
+        )
+        if state_bucket != bucket:
+            downsampled.extend(
+                _bucket_states(bucket_states, first_non_numeric, previous_state)
+            )
+            bucket_states.clear()
+            first_non_numeric = None
+            bucket = state_bucket
+        try:
+            value = float(state[COMPRESSED_STATE_STATE])
+        except ValueError:
+            value = math.nan
+        if math.isfinite(value):
+            bucket_states.append((value, state))
+        elif first_non_numeric is None:
+            first_non_numeric = state
+        previous_state = state
+    downsampled.extend(_bucket_states(bucket_states, first_non_numeric, previous_state))
+    downsampled.append(last_state)
+    return downsampled
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
@@ -72,25 +147,27 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
-    return JSON_DUMP(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
     )
+    if max_points:
+        for entity_id, entity_states in states.items():
+            states[entity_id] = _downsample_compressed_states(
+                cast(list[dict[str, Any]], entity_states), max_points
+            )
+    return JSON_DUMP(messages.result_message(msg_id, states))
 
 
 @websocket_api.websocket_command(
@@ -103,6 +180,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=4)),
     }
 )
 @websocket_api.async_response
@@ -166,6 +244,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
@@ -276,24 +355,44 @@ async def _async_send_historical_states(
     no_attributes: bool,
     send_empty: bool,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    The time range is fetched in HISTORY_CHUNK_TIME windows and each
+    window is sent as its own message so only one window of states
+    is held in memory at a time.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    last_time_dt: dt | None = None
+    chunk_start_time = start_time
+    while True:
+        chunk_end_time = min(chunk_start_time + HISTORY_CHUNK_TIME, end_time)
+        final_chunk = chunk_end_time == end_time
+        (
+            chunk_last_time_ts,
+            chunk_last_time_dt,
+            payload,
+        ) = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            chunk_start_time,
+            chunk_end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty and final_chunk and last_time_dt is None,
+        )
+        if payload:
+            connection.send_message(payload)
+        if chunk_last_time_ts != 0:
+            last_time_dt = chunk_last_time_dt
+        if final_chunk or msg_id not in connection.subscriptions:
+            return last_time_dt
+        chunk_start_time = chunk_end_time
+        # The start time state was already sent with the first window
+        include_start_time_state = False
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
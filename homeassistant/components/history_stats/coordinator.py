@@ -82,6 +82,9 @@ class HistoryStatsUpdateCoordinator(DataUpdateCoordinator[HistoryStatsState]):
     def _async_add_events_listener(self, *_: Any) -> None:
         """Handle hass starting and start tracking events."""
         self._at_start_listener = None
+        # Changes before starting were not tracked, catch up with the current state
+        if state := self.hass.states.get(self._history_stats.entity_id):
+            self._history_stats.async_add_state(state)
         self._track_events_listener = async_track_state_change_event(
             self.hass, [self._history_stats.entity_id], self._async_update_from_event
         )
@@ -1,11 +1,15 @@
 """Manage the history_stats data."""
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 import datetime
+from itertools import islice
+import math
+from operator import attrgetter
 
 from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.event import EventStateChangedData
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.typing import EventType
@@ -15,6 +19,8 @@ from .helpers import async_calculate_period, floored_timestamp
 
 MIN_TIME_UTC = datetime.datetime.min.replace(tzinfo=dt_util.UTC)
 
+_LAST_CHANGED = attrgetter("last_changed")
+
 
 @dataclass
 class HistoryStatsState:
@@ -34,7 +40,13 @@ class HistoryState:
 
 
 class HistoryStats:
-    """Manage history stats."""
+    """Manage history stats.
+
+    The states of the entity are kept in a timeline which is loaded from the
+    database once and then extended with the state changed events. Moving the
+    period forward trims the timeline, the database is only queried again when
+    the period moves to a time the timeline does not cover.
+    """
 
     def __init__(
         self,
@@ -50,8 +62,11 @@ class HistoryStats:
         self.entity_id = entity_id
         self._period = (MIN_TIME_UTC, MIN_TIME_UTC)
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
-        self._history_current_period: list[HistoryState] = []
-        self._previous_run_before_start = False
+        self._timeline: list[HistoryState] = []
+        # The timeline holds all states from _timeline_start until _timeline_end,
+        # or until now when _timeline_end is None, and none if it is not loaded
+        self._timeline_start: float | None = None
+        self._timeline_end: float | None = None
         self._entity_states = set(entity_states)
         self._duration = duration
         self._start = start
@@ -82,78 +97,118 @@ class HistoryStats:
         utc_now = dt_util.utcnow()
         now_timestamp = floored_timestamp(utc_now)
 
+        new_state = event.data["new_state"] if event else None
+
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
-            self._history_current_period = []
-            self._previous_run_before_start = True
+            if new_state is not None:
+                self._async_add_to_timeline(new_state, current_period_end_timestamp)
+            # Only the current state is needed once the period starts
+            self._async_trim_timeline(now_timestamp)
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
-        #
-        # We avoid querying the database if the below did NOT happen:
-        #
-        # - The previous run happened before the start time
-        # - The start time changed
-        # - The period shrank in size
-        # - The previous period ended before now
-        #
-        if (
-            not self._previous_run_before_start
-            and current_period_start_timestamp == previous_period_start_timestamp
-            and (
-                current_period_end_timestamp == previous_period_end_timestamp
-                or (
-                    current_period_end_timestamp >= previous_period_end_timestamp
-                    and previous_period_end_timestamp <= now_timestamp
-                )
-            )
+
+        if not self._async_timeline_covers(
+            current_period_start_timestamp, current_period_end_timestamp
         ):
-            new_data = False
-            if event and (new_state := event.data["new_state"]) is not None:
-                if (
-                    current_period_start_timestamp
-                    <= floored_timestamp(new_state.last_changed)
-                    <= current_period_end_timestamp
-                ):
-                    self._history_current_period.append(
-                        HistoryState(
-                            new_state.state, new_state.last_changed.timestamp()
-                        )
-                    )
-                    new_data = True
-            if not new_data and current_period_end_timestamp < now_timestamp:
-                # If period has not changed and current time after the period end...
-                # Don't compute anything as the value cannot have changed
-                return self._state
-        else:
             await self._async_history_from_db(
-                current_period_start_timestamp, current_period_end_timestamp
+                current_period_start_timestamp,
+                current_period_end_timestamp,
+                now_timestamp,
             )
-            self._previous_run_before_start = False
+
+        new_data = new_state is not None and self._async_add_to_timeline(
+            new_state, current_period_end_timestamp
+        )
+        if (
+            not new_data
+            and self._state.seconds_matched is not None
+            and current_period_start_timestamp == previous_period_start_timestamp
+            and current_period_end_timestamp == previous_period_end_timestamp
+            and current_period_end_timestamp < now_timestamp
+        ):
+            # If period has not changed and current time after the period end...
+            # Don't compute anything as the value cannot have changed
+            return self._state
 
         seconds_matched, match_count = self._async_compute_seconds_and_changes(
             now_timestamp,
             current_period_start_timestamp,
             current_period_end_timestamp,
         )
+        self._async_trim_timeline(current_period_start_timestamp)
         self._state = HistoryStatsState(seconds_matched, match_count, self._period)
         return self._state
 
+    @callback
+    def async_add_state(self, state: State) -> None:
+        """Add a state the entity changed to without a state changed event."""
+        self._async_add_to_timeline(
+            state, floored_timestamp(dt_util.as_utc(self._period[1]))
+        )
+
+    @callback
+    def _async_timeline_covers(
+        self, start_timestamp: float, end_timestamp: float
+    ) -> bool:
+        """Return if the timeline holds all states of a period."""
+        return (
+            self._timeline_start is not None
+            and self._timeline_start <= start_timestamp
+            and (self._timeline_end is None or end_timestamp <= self._timeline_end)
+        )
+
+    @callback
+    def _async_add_to_timeline(self, state: State, end_timestamp: float) -> bool:
+        """Add the new state of a state changed event to the timeline.
+
+        Returns if the state was added.
+        """
+        if self._timeline_start is None or self._timeline_end is not None:
+            return False
+        last_changed = state.last_changed.timestamp()
+        if self._timeline and last_changed <= self._timeline[-1].last_changed:
+            # Already loaded from the database
+            return False
+        if floored_timestamp(state.last_changed) > end_timestamp:
+            # Changes after the period are only needed if the period moves over
+            # them, stop adding them and query the database when it does
+            self._timeline_end = end_timestamp
+            return False
+        self._timeline.append(HistoryState(state.state, last_changed))
+        return True
+
+    @callback
+    def _async_trim_timeline(self, start_timestamp: float) -> None:
+        """Remove the states before the state at the start of the period."""
+        idx = bisect_right(self._timeline, start_timestamp, key=_LAST_CHANGED)
+        if idx > 1 and self._timeline_start is not None:
+            del self._timeline[: idx - 1]
+            self._timeline_start = max(self._timeline_start, start_timestamp)
+
     async def _async_history_from_db(
         self,
         current_period_start_timestamp: float,
         current_period_end_timestamp: float,
+        now_timestamp: float,
     ) -> None:
-        """Update history data for the current period from the database."""
+        """Load the timeline for the current period from the database."""
         instance = get_instance(self.hass)
         states = await instance.async_add_executor_job(
             self._state_changes_during_period,
             current_period_start_timestamp,
             current_period_end_timestamp,
         )
-        self._history_current_period = [
+        self._timeline = [
             HistoryState(state.state, state.last_changed.timestamp())
             for state in states
         ]
+        self._timeline_start = current_period_start_timestamp
+        self._timeline_end = (
+            current_period_end_timestamp
+            if current_period_end_timestamp < now_timestamp
+            else None
+        )
 
     def _state_changes_during_period(
         self, start_ts: float, end_ts: float
@@ -173,22 +228,25 @@ class HistoryStats:
     def _async_compute_seconds_and_changes(
         self, now_timestamp: float, start_timestamp: float, end_timestamp: float
     ) -> tuple[float, int]:
-        """Compute the seconds matched and changes from the history list and first state."""
+        """Compute the seconds matched and changes from the timeline and first state."""
+        timeline = self._timeline
+        # The timeline starts with the state at the start of the period as
         # state_changes_during_period is called with include_start_time_state=True
-        # which is the default and always provides the state at the start
-        # of the period
+        # and trimming keeps it
+        first = max(bisect_right(timeline, start_timestamp, key=_LAST_CHANGED) - 1, 0)
         previous_state_matches = (
-            self._history_current_period
-            and self._history_current_period[0].state in self._entity_states
+            first < len(timeline) and timeline[first].state in self._entity_states
         )
         last_state_change_timestamp = start_timestamp
         elapsed = 0.0
         match_count = 1 if previous_state_matches else 0
 
         # Make calculations
-        for history_state in self._history_current_period:
+        for history_state in islice(timeline, first, None):
+            if math.floor(history_state.last_changed) > end_timestamp:
+                break
             current_state_matches = history_state.state in self._entity_states
-            state_change_timestamp = history_state.last_changed
+            state_change_timestamp = max(history_state.last_changed, start_timestamp)
 
             if previous_state_matches:
                 elapsed += state_change_timestamp - last_state_change_timestamp
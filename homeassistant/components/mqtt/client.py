@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterable, Iterator
+from datetime import datetime
 from functools import lru_cache
 from itertools import chain, groupby
 import logging
@@ -93,6 +95,8 @@ INITIAL_SUBSCRIBE_COOLDOWN = 1.0
 SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
+# Number of topics of which the matching subscriptions are cached
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
 
 MQTT_ENTRIES_NAMING_BLOG_URL = (
     "https://developers.home-assistant.io/blog/2023-057-21-change-naming-mqtt-entities/"
@@ -217,12 +221,111 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None] = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
 
 
+class _TopicNode:
+    """A level of the topic filters in a subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the topic level."""
+        self.children: dict[str, _TopicNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """Index subscriptions by the levels of their topic filter.
+
+    Matching a topic only visits the levels of the topic and the wildcards
+    next to them, instead of every subscription.
+    """
+
+    __slots__ = ("_root", "_count")
+
+    def __init__(self) -> None:
+        """Initialize the subscription trie."""
+        self._root = _TopicNode()
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions."""
+        return self._count
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over the subscriptions."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.subscriptions
+            nodes.extend(node.children.values())
+
+    def __contains__(self, topic: object) -> bool:
+        """Return if there are subscriptions with a topic filter."""
+        if not isinstance(topic, str):
+            return False
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+            node = child
+        node.subscriptions.append(subscription)
+        self._count += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription, raise ValueError if it was not added."""
+        path: list[tuple[_TopicNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                raise ValueError(f"{subscription} not in trie")
+            path.append((node, level))
+            node = child
+        node.subscriptions.remove(subscription)
+        self._count -= 1
+        # Prune the levels which no longer lead to a subscription
+        for parent, level in reversed(path):
+            if node.subscriptions or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching a topic."""
+        levels = topic.split("/")
+        last = len(levels)
+        # Wildcards on the first level do not match topics starting with $
+        normal = not topic.startswith("$")
+        matches: list[Subscription] = []
+        nodes = [(self._root, 0)]
+        while nodes:
+            node, index = nodes.pop()
+            children = node.children
+            wildcards = normal or index > 0
+            if wildcards and (child := children.get("#")) is not None:
+                matches.extend(child.subscriptions)
+            if index == last:
+                matches.extend(node.subscriptions)
+                continue
+            if (child := children.get(levels[index])) is not None:
+                nodes.append((child, index + 1))
+            if wildcards and (child := children.get("+")) is not None:
+                nodes.append((child, index + 1))
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -381,7 +484,10 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions = SubscriptionTrie()
+        self._matching_subscriptions = lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)(
+            self._match_subscriptions
+        )
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -403,6 +509,10 @@ class MQTT:
             UNSUBSCRIBE_COOLDOWN, self._async_perform_unsubscribes
         )
         self._pending_unsubscribes: set[str] = set()  # topic
+        # Messages received by the paho thread which the event loop has not
+        # handled yet. The loop is woken once for all messages in the buffer.
+        self._message_buffer: deque[mqtt.MQTTMessage] = deque()
+        self._message_batch_scheduled = False
 
         if self.hass.state == CoreState.running:
             self._ha_started.set()
@@ -484,8 +594,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions or topic in self._wildcard_subscriptions
         )
 
     async def async_publish(
@@ -581,7 +691,7 @@ class MQTT:
                 subscription
             )
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -634,9 +744,7 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -807,31 +915,64 @@ class MQTT:
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
         """Message received callback."""
-        self.loop.call_soon_threadsafe(self._mqtt_handle_message, msg)
+        self._message_buffer.append(msg)
+        if not self._message_batch_scheduled:
+            self._message_batch_scheduled = True
+            self.loop.call_soon_threadsafe(self._mqtt_handle_message_buffer)
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
-    def _matching_subscriptions(self, topic: str) -> list[Subscription]:
+    @callback
+    def _mqtt_handle_message_buffer(self) -> None:
+        """Handle the messages buffered by the paho thread."""
+        # Reset the flag before taking the messages, messages buffered
+        # afterwards schedule a new batch
+        self._message_batch_scheduled = False
+        buffer = self._message_buffer
+        if msgs := [buffer.popleft() for _ in range(len(buffer))]:
+            self._mqtt_handle_messages(msgs)
+
+    def _match_subscriptions(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic.
+
+        Called through _matching_subscriptions which caches the matches of
+        the most recent topics.
+        """
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscriptions.match(topic))
         return subscriptions
 
     @callback
-    def _mqtt_handle_message(self, msg: mqtt.MQTTMessage) -> None:
-        _LOGGER.debug(
-            "Received%s message on %s (qos=%s): %s",
-            " retained" if msg.retain else "",
-            msg.topic,
-            msg.qos,
-            msg.payload[0:8192],
-        )
+    def _mqtt_handle_messages(self, msgs: list[mqtt.MQTTMessage]) -> None:
+        """Handle a batch of received messages."""
+        self._mqtt_data.message_metrics.async_record_batch(len(msgs))
         timestamp = dt_util.utcnow()
+        for msg in msgs:
+            _LOGGER.debug(
+                "Received%s message on %s (qos=%s): %s",
+                " retained" if msg.retain else "",
+                msg.topic,
+                msg.qos,
+                msg.payload[0:8192],
+            )
+            # Not looked up once per batch, jobs of the batch may change the
+            # subscriptions
+            self._mqtt_handle_message(
+                msg, timestamp, self._matching_subscriptions(msg.topic)
+            )
+            self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
-        subscriptions = self._matching_subscriptions(msg.topic)
-
+    @callback
+    def _mqtt_handle_message(
+        self,
+        msg: mqtt.MQTTMessage,
+        timestamp: datetime,
+        subscriptions: list[Subscription],
+    ) -> None:
+        """Run the jobs of the subscriptions matching a message."""
+        # The subscriptions with the same encoding share the decoded payload
+        decoded_payloads: dict[str, str] = {}
         for subscription in subscriptions:
             if msg.retain:
                 retained_topics = self._retained_topics.setdefault(subscription, set())
@@ -842,9 +983,13 @@ class MQTT:
                 self._retained_topics[subscription].add(msg.topic)
 
             payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
+            if (encoding := subscription.encoding) is not None:
                 try:
-                    payload = msg.payload.decode(subscription.encoding)
+                    if (decoded := decoded_payloads.get(encoding)) is None:
+                        decoded = decoded_payloads[encoding] = msg.payload.decode(
+                            encoding
+                        )
+                    payload = decoded
                 except (AttributeError, UnicodeDecodeError):
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
@@ -865,7 +1010,6 @@ class MQTT:
                     timestamp,
                 ),
             )
-        self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
     def _mqtt_on_callback(
         self,
@@ -961,13 +1105,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
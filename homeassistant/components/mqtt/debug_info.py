@@ -233,11 +233,15 @@ def _info_for_trigger(
     return {"discovery_data": discovery_data, "trigger_key": trigger_key}
 
 
-def info_for_config_entry(hass: HomeAssistant) -> dict[str, list[Any]]:
-    """Get debug info for all entities and triggers."""
+def info_for_config_entry(hass: HomeAssistant) -> dict[str, Any]:
+    """Get debug info for all entities and triggers, and the received messages."""
 
     mqtt_data = get_mqtt_data(hass)
-    mqtt_info: dict[str, list[Any]] = {"entities": [], "triggers": []}
+    mqtt_info: dict[str, Any] = {
+        "entities": [],
+        "triggers": [],
+        "received_messages": mqtt_data.message_metrics.as_dict(),
+    }
 
     for entity_id in mqtt_data.debug_info_entities:
         mqtt_info["entities"].append(_info_for_entity(hass, entity_id))
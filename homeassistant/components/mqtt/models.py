@@ -8,7 +8,9 @@ from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 import datetime as dt
 from enum import StrEnum
+from functools import lru_cache
 import logging
+import time
 from typing import TYPE_CHECKING, Any, TypedDict
 
 import attr
@@ -19,6 +21,7 @@ from homeassistant.helpers import template
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.service_info.mqtt import ReceivePayloadType
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, TemplateVarsType
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -39,6 +42,13 @@ class PayloadSentinel(StrEnum):
 
 _LOGGER = logging.getLogger(__name__)
 
+# Period over which the rate of received messages is measured
+MESSAGE_RATE_WINDOW = 10
+# Number of recent payloads of which the decoded JSON is kept
+JSON_PAYLOAD_CACHE_SIZE = 16
+
+_NOT_JSON = object()
+
 ATTR_THIS = "this"
 
 PublishPayloadType = str | bytes | int | float | None
@@ -180,6 +190,15 @@ class MqttCommandTemplate:
         )
 
 
+@lru_cache(maxsize=JSON_PAYLOAD_CACHE_SIZE)
+def _decode_json_payload(payload: ReceivePayloadType) -> Any:
+    """Decode a received payload once for all value templates rendering it."""
+    try:
+        return json_loads(payload)
+    except JSON_DECODE_EXCEPTIONS:
+        return _NOT_JSON
+
+
 class MqttValueTemplate:
     """Class for rendering MQTT value template with possible json values."""
 
@@ -234,6 +253,15 @@ class MqttValueTemplate:
                 )
             values[ATTR_THIS] = self._template_state
 
+        # The entities subscribed to a topic render the same payload, it is
+        # decoded by the first of them. The templates are rendered in an
+        # immutable sandbox, so the decoded JSON can be shared.
+        parse_json = True
+        if not self._value_template.is_static and isinstance(payload, (str, bytes)):
+            parse_json = False
+            if (value_json := _decode_json_payload(payload)) is not _NOT_JSON:
+                values["value_json"] = value_json
+
         if default is PayloadSentinel.NONE:
             _LOGGER.debug(
                 "Rendering incoming payload '%s' with variables %s and %s",
@@ -244,7 +272,7 @@ class MqttValueTemplate:
             try:
                 rendered_payload = (
                     self._value_template.async_render_with_possible_json_value(
-                        payload, variables=values
+                        payload, variables=values, parse_json=parse_json
                     )
                 )
             except Exception as ex:
@@ -271,7 +299,7 @@ class MqttValueTemplate:
         try:
             rendered_payload = (
                 self._value_template.async_render_with_possible_json_value(
-                    payload, default, variables=values
+                    payload, default, variables=values, parse_json=parse_json
                 )
             )
         except Exception as ex:
@@ -289,6 +317,45 @@ class MqttValueTemplate:
         return rendered_payload
 
 
+class MessageMetrics:
+    """Metrics of the messages received from the broker."""
+
+    def __init__(self) -> None:
+        """Initialize the message metrics."""
+        self.messages = 0
+        self.batches = 0
+        self.largest_batch = 0
+        self.messages_per_second = 0.0
+        self._window_start = time.monotonic()
+        self._window_messages = 0
+
+    @callback
+    def async_record_batch(self, size: int) -> None:
+        """Record a batch of messages handed to the event loop."""
+        self.messages += size
+        self.batches += 1
+        self.largest_batch = max(self.largest_batch, size)
+        self._window_messages += size
+        now = time.monotonic()
+        if (elapsed := now - self._window_start) >= MESSAGE_RATE_WINDOW:
+            self.messages_per_second = self._window_messages / elapsed
+            self._window_start = now
+            self._window_messages = 0
+
+    @callback
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {
+            "messages": self.messages,
+            "batches": self.batches,
+            "average_batch_size": (
+                round(self.messages / self.batches, 1) if self.batches else 0
+            ),
+            "largest_batch_size": self.largest_batch,
+            "messages_per_second": round(self.messages_per_second, 1),
+        }
+
+
 class EntityTopicState:
     """Manage entity state write requests for subscribed topics."""
 
@@ -341,6 +408,7 @@ class MqttData:
     integration_unsubscribe: dict[str, CALLBACK_TYPE] = field(default_factory=dict)
     issues: dict[str, set[str]] = field(default_factory=dict)
     last_discovery: float = 0.0
+    message_metrics: MessageMetrics = field(default_factory=MessageMetrics)
     reload_dispatchers: list[CALLBACK_TYPE] = field(default_factory=list)
     reload_handlers: dict[str, Callable[[], Coroutine[Any, Any, None]]] = field(
         default_factory=dict
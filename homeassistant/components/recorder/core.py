@@ -103,6 +103,7 @@ from .tasks import (
     EntityIDPostMigrationTask,
     EventIdMigrationTask,
     EventsContextIDMigrationTask,
+    EventsTask,
     EventTask,
     EventTypeIDMigrationTask,
     ImportStatisticsTask,
@@ -142,6 +143,10 @@ DEFAULT_URL = "sqlite:///{hass_config_path}"
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
+# The maximum number of queued events we process
+# as a single batch in the recorder thread
+MAX_EVENTS_PER_BATCH = 1000
+
 SHUTDOWN_TASK = object()
 
 COMMIT_TASK = CommitTask()
@@ -839,6 +844,27 @@ class Recorder(threading.Thread):
                         self.queue_task(EventIdMigrationTask())
                         self.use_legacy_events_index = True
 
+            # Prime the table manager caches with the ids used by the
+            # most recent rows so the first writes after a restart
+            # do not need an extra query to find shared attributes,
+            # event data, and entity_ids that are already in the database.
+            table_managers: list[
+                StateAttributesManager | EventDataManager | StatesMetaManager
+            ] = [self.state_attributes_manager, self.event_data_manager]
+            if self.states_meta_manager.active:
+                table_managers.append(self.states_meta_manager)
+            for table_manager in table_managers:
+                try:
+                    table_manager.load_recent(session)
+                except SQLAlchemyError as err:
+                    # The caches fill up as rows are written
+                    _LOGGER.debug(
+                        "Unable to prime the %s cache: %s",
+                        type(table_manager).__name__,
+                        err,
+                    )
+                    session.rollback()
+
         # We must only set the db ready after we have set the table managers
         # to active if there is no data to migrate.
         #
@@ -865,7 +891,29 @@ class Recorder(threading.Thread):
 
         self.stop_requested = False
         while not self.stop_requested:
-            self._guarded_process_one_task_or_recover(queue_.get())
+            task = queue_.get()
+            if (
+                not isinstance(task, EventTask)
+                or not self.commit_interval
+                or queue_.empty()
+            ):
+                self._guarded_process_one_task_or_recover(task)
+                continue
+            # When events are backing up in the queue we take all
+            # of them at once so the ids for the states_meta,
+            # state_attributes, event_types and event_data tables
+            # can be resolved with one query per table
+            events = [task.event]
+            next_task: RecorderTask | None = None
+            while len(events) < MAX_EVENTS_PER_BATCH and not queue_.empty():
+                next_task = queue_.get_nowait()
+                if not isinstance(next_task, EventTask):
+                    break
+                events.append(next_task.event)
+                next_task = None
+            self._guarded_process_one_task_or_recover(EventsTask(events))
+            if next_task is not None:
+                self._guarded_process_one_task_or_recover(next_task)
 
     def _pre_process_startup_tasks(self, startup_tasks: list[RecorderTask]) -> None:
         """Pre process startup tasks."""
@@ -1012,13 +1060,62 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
         if event.event_type == EVENT_STATE_CHANGED:
-            self._process_state_changed_event_into_session(event)
+            self._process_state_changed_event_into_session(
+                event, self.state_attributes_manager.serialize_from_event(event)
+            )
         else:
             self._process_non_state_changed_event_into_session(event)
         # Commit if the commit interval is zero
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _process_events(self, events: list[Event]) -> None:
+        """Process a batch of events into the session."""
+        if not self.enabled:
+            return
+        assert self.event_session is not None
+        session = self.event_session
+        state_change_events: list[Event] = []
+        non_state_change_events: list[Event] = []
+        for event in events:
+            if event.event_type == EVENT_STATE_CHANGED:
+                state_change_events.append(event)
+            else:
+                non_state_change_events.append(event)
+
+        # The attributes are only serialized once per event and
+        # the ids of any attributes that are not in the cache
+        # are looked up with a single query
+        state_attributes_manager = self.state_attributes_manager
+        serialize_attributes = state_attributes_manager.serialize_from_event
+        shared_attrs_bytes_by_event = {
+            id(event): serialize_attributes(event) for event in state_change_events
+        }
+        state_attributes_manager.get_many(
+            {
+                (shared_attrs, StateAttributes.hash_shared_attrs_bytes(shared_bytes))
+                for shared_bytes in shared_attrs_bytes_by_event.values()
+                if shared_bytes
+                and not state_attributes_manager.get_pending(
+                    shared_attrs := shared_bytes.decode("utf-8")
+                )
+                and not state_attributes_manager.get_from_cache(shared_attrs)
+            },
+            session,
+        )
+        if state_change_events:
+            self.states_meta_manager.load(state_change_events, session)
+        if non_state_change_events:
+            self.event_type_manager.load(non_state_change_events, session)
+
+        for event in events:
+            if event.event_type == EVENT_STATE_CHANGED:
+                self._process_state_changed_event_into_session(
+                    event, shared_attrs_bytes_by_event[id(event)]
+                )
+            else:
+                self._process_non_state_changed_event_into_session(event)
+
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
         """Process any event into the session except state changed."""
         session = self.event_session
@@ -1065,8 +1162,13 @@ class Recorder(threading.Thread):
 
         self._add_to_session(session, dbevent)
 
-    def _process_state_changed_event_into_session(self, event: Event) -> None:
-        """Process a state_changed event into the session."""
+    def _process_state_changed_event_into_session(
+        self, event: Event, shared_attrs_bytes: bytes | None
+    ) -> None:
+        """Process a state_changed event into the session.
+
+        shared_attrs_bytes are the serialized attributes of the event.
+        """
         state_attributes_manager = self.state_attributes_manager
         states_meta_manager = self.states_meta_manager
         entity_removed = not event.data.get("new_state")
@@ -1087,9 +1189,7 @@ class Recorder(threading.Thread):
         if states_meta_manager.active:
             dbstate.entity_id = None
 
-        if entity_id is None or not (
-            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
-        ):
+        if entity_id is None or not shared_attrs_bytes:
             return
 
         assert self.event_session is not None
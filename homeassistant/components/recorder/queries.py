@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy import delete, distinct, func, lambda_stmt, select, union_all, update
 from sqlalchemy.sql.lambdas import StatementLambdaElement
@@ -51,6 +52,51 @@ def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def _select_recent_ids(id_column: Any, order_column: Any, limit: int) -> Select:
+    """Generate a select for the distinct ids used by the most recent rows.
+
+    This query is intentionally not a lambda statement as it is used inside
+    other lambda statements.
+    """
+    recent = select(id_column).order_by(order_column.desc()).limit(limit).subquery()
+    return select(distinct(recent.c[0]))
+
+
+def find_recent_shared_attributes(limit: int) -> StatementLambdaElement:
+    """Find the shared attributes used by the most recent states."""
+    return lambda_stmt(
+        lambda: select(
+            StateAttributes.attributes_id, StateAttributes.shared_attrs
+        ).where(
+            StateAttributes.attributes_id.in_(
+                _select_recent_ids(States.attributes_id, States.state_id, limit)
+            )
+        )
+    )
+
+
+def find_recent_shared_event_datas(limit: int) -> StatementLambdaElement:
+    """Find the shared event data used by the most recent events."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id, EventData.shared_data).where(
+            EventData.data_id.in_(
+                _select_recent_ids(Events.data_id, Events.event_id, limit)
+            )
+        )
+    )
+
+
+def find_recent_states_metadata_ids(limit: int) -> StatementLambdaElement:
+    """Find the metadata_ids and entity_ids used by the most recent states."""
+    return lambda_stmt(
+        lambda: select(StatesMeta.metadata_id, StatesMeta.entity_id).where(
+            StatesMeta.metadata_id.in_(
+                _select_recent_ids(States.metadata_id, States.state_id, limit)
+            )
+        )
+    )
+
+
 def find_event_type_ids(event_types: Iterable[str]) -> StatementLambdaElement:
     """Find an event_type id by event_type."""
     return lambda_stmt(
@@ -12,7 +12,7 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..const import SQLITE_MAX_BIND_VARS
 from ..db_schema import EventData
-from ..queries import get_shared_event_datas
+from ..queries import find_recent_shared_event_datas, get_shared_event_datas
 from ..util import chunked, execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -56,6 +56,18 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         }:
             self._load_from_hashes(hashes, session)
 
+    def load_recent(self, session: Session) -> None:
+        """Load the data_ids used by the most recent events into memory.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with session.no_autoflush:
+            for data_id, shared_data in execute_stmt_lambda_element(
+                session, find_recent_shared_event_datas(CACHE_SIZE), orm_rows=False
+            ):
+                self._id_map[shared_data] = cast(int, data_id)
+
     def get(self, shared_data: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_datas to the data_id.
 
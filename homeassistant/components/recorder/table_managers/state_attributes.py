@@ -13,7 +13,7 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..const import SQLITE_MAX_BIND_VARS
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import find_recent_shared_attributes, get_shared_attributes
 from ..util import chunked, execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -73,6 +73,18 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         }:
             self._load_from_hashes(hashes, session)
 
+    def load_recent(self, session: Session) -> None:
+        """Load the attributes_ids used by the most recent states into memory.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with session.no_autoflush:
+            for attributes_id, shared_attrs in execute_stmt_lambda_element(
+                session, find_recent_shared_attributes(CACHE_SIZE), orm_rows=False
+            ):
+                self._id_map[shared_attrs] = cast(int, attributes_id)
+
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
 
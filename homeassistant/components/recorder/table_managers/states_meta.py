@@ -10,7 +10,11 @@ from homeassistant.core import Event
 
 from ..const import SQLITE_MAX_BIND_VARS
 from ..db_schema import StatesMeta
-from ..queries import find_all_states_metadata_ids, find_states_metadata_ids
+from ..queries import (
+    find_all_states_metadata_ids,
+    find_recent_states_metadata_ids,
+    find_states_metadata_ids,
+)
 from ..util import chunked, execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -45,6 +49,18 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
             True,
         )
 
+    def load_recent(self, session: Session) -> None:
+        """Load the metadata_ids used by the most recent states into memory.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        with session.no_autoflush:
+            for metadata_id, entity_id in execute_stmt_lambda_element(
+                session, find_recent_states_metadata_ids(CACHE_SIZE), orm_rows=False
+            ):
+                self._id_map[entity_id] = cast(int, metadata_id)
+
     def get(self, entity_id: str, session: Session, from_recorder: bool) -> int | None:
         """Resolve entity_id to the metadata_id.
 
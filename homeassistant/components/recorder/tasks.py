@@ -281,6 +281,19 @@ class EventTask(RecorderTask):
         instance._process_one_event(self.event)
 
 
+@dataclass(slots=True)
+class EventsTask(RecorderTask):
+    """A batch of events that were waiting in the queue to be processed."""
+
+    events: list[Event]
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        # pylint: disable-next=[protected-access]
+        instance._process_events(self.events)
+
+
 @dataclass(slots=True)
 class KeepAliveTask(RecorderTask):
     """A keep alive to be sent."""
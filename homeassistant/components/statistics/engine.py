@@ -0,0 +1,243 @@
+"""Incrementally updated statistics of the samples of a statistics sensor."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+
+
+class StatisticsEngine:
+    """Keep the samples of a statistics sensor and their running statistics.
+
+    Adding a sample and removing the oldest sample update running sums, a
+    sorted copy of the values and monotonic deques of the extremes, so the
+    characteristics are available without a pass over all samples.
+
+    The sums for the mean and the variance are kept as integers of the values
+    scaled by a power of two, which makes them exact and their results equal to
+    the results of the statistics module. The other sums are recalculated once
+    as many samples as are buffered have been removed, which keeps the rounding
+    errors of the removals from accumulating.
+    """
+
+    def __init__(self, max_size: int | None) -> None:
+        """Initialize the statistics engine."""
+        self._max_size = max_size
+        self.states: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
+        self._sorted: list[float | bool] = []
+        # Candidates for the extremes with their sequence number and age
+        self._max: deque[tuple[float | bool, int, datetime]] = deque()
+        self._min: deque[tuple[float | bool, int, datetime]] = deque()
+        self._next_seq = 0
+        self._removed = 0
+        # The values scaled by 2**_scale are integers
+        self._scale = 0
+        self._sum = 0
+        self._sum_squares = 0
+        self._sum_differences: float = 0
+        self._sum_differences_nonnegative: float = 0
+        self._area_linear: float = 0
+        self._area_step: float = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.states)
+
+    def add(self, value: float | bool, age: datetime) -> None:
+        """Add a sample, removing the oldest sample if the buffer is full.
+
+        Raises ValueError if the sample is not finite, the running sums cannot
+        hold it.
+        """
+        if not math.isfinite(value):
+            raise ValueError(f"Sample is not finite: {value}")
+        if self._max_size is not None and len(self.states) >= self._max_size:
+            self.remove_oldest()
+        if self.states:
+            self._add_pair(self.states[-1], self.ages[-1], value, age, 1)
+        self.states.append(value)
+        self.ages.append(age)
+        scaled = self._scaled(value)
+        self._sum += scaled
+        self._sum_squares += scaled * scaled
+        insort(self._sorted, value)
+
+        seq = self._next_seq
+        self._next_seq += 1
+        # Equal values are kept, the front is the oldest of the extremes
+        while self._max and self._max[-1][0] < value:
+            self._max.pop()
+        self._max.append((value, seq, age))
+        while self._min and self._min[-1][0] > value:
+            self._min.pop()
+        self._min.append((value, seq, age))
+
+    def remove_oldest(self) -> None:
+        """Remove the oldest sample."""
+        value = self.states.popleft()
+        age = self.ages.popleft()
+        if not self.states:
+            self.clear()
+            return
+        self._add_pair(value, age, self.states[0], self.ages[0], -1)
+        scaled = self._scaled(value)
+        self._sum -= scaled
+        self._sum_squares -= scaled * scaled
+        del self._sorted[bisect_left(self._sorted, value)]
+
+        seq = self._next_seq - len(self.states) - 1
+        if self._max[0][1] == seq:
+            self._max.popleft()
+        if self._min[0][1] == seq:
+            self._min.popleft()
+
+        self._removed += 1
+        if self._removed >= len(self.states):
+            self._recalculate_pair_sums()
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self.states.clear()
+        self.ages.clear()
+        self._sorted.clear()
+        self._max.clear()
+        self._min.clear()
+        self._removed = 0
+        self._scale = 0
+        self._sum = 0
+        self._sum_squares = 0
+        self._sum_differences = 0
+        self._sum_differences_nonnegative = 0
+        self._area_linear = 0
+        self._area_step = 0
+
+    def _scaled(self, value: float | bool) -> int:
+        """Return a value as an integer scaled by 2**_scale."""
+        numerator, denominator = value.as_integer_ratio()
+        # The denominator of a float is a power of two
+        scale = denominator.bit_length() - 1
+        if scale > self._scale:
+            shift = scale - self._scale
+            self._sum <<= shift
+            self._sum_squares <<= 2 * shift
+            self._scale = scale
+        return numerator << (self._scale - scale)
+
+    def _add_pair(
+        self,
+        previous: float | bool,
+        previous_age: datetime,
+        value: float | bool,
+        age: datetime,
+        sign: int,
+    ) -> None:
+        """Add or subtract the terms of two consecutive samples."""
+        difference = value - previous
+        seconds = (age - previous_age).total_seconds()
+        self._sum_differences += sign * abs(difference)
+        self._sum_differences_nonnegative += sign * (
+            difference if value >= previous else value
+        )
+        self._area_linear += sign * 0.5 * (value + previous) * seconds
+        self._area_step += sign * previous * seconds
+
+    def _recalculate_pair_sums(self) -> None:
+        """Recalculate the sums over consecutive samples."""
+        self._removed = 0
+        states = self.states
+        ages = self.ages
+        self._sum_differences = 0
+        self._sum_differences_nonnegative = 0
+        self._area_linear = 0
+        self._area_step = 0
+        for idx in range(1, len(states)):
+            self._add_pair(states[idx - 1], ages[idx - 1], states[idx], ages[idx], 1)
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of the values."""
+        # Integer division is correctly rounded
+        return self._sum / (1 << self._scale)
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the values."""
+        return self._sum / (len(self.states) << self._scale)
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance of the values, requires two samples."""
+        count = len(self.states)
+        return (count * self._sum_squares - self._sum * self._sum) / (
+            count * (count - 1) << 2 * self._scale
+        )
+
+    @property
+    def standard_deviation(self) -> float:
+        """Return the sample standard deviation, requires two samples."""
+        return math.sqrt(self.variance)
+
+    @property
+    def median(self) -> float | bool:
+        """Return the median of the values."""
+        data = self._sorted
+        count = len(data)
+        if count % 2:
+            return data[count // 2]
+        return (data[count // 2 - 1] + data[count // 2]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile as statistics.quantiles, requires two samples.
+
+        The percentiles are the cut points of statistics.quantiles with n=100
+        and the exclusive method.
+        """
+        data = self._sorted
+        count = len(data)
+        interval = count + 1
+        # Rescale the percentile to the samples, clamped to 1 .. count - 1
+        idx = min(max(percentile * interval // 100, 1), count - 1)
+        delta = percentile * interval - idx * 100
+        return (data[idx - 1] * (100 - delta) + data[idx] * delta) / 100
+
+    @property
+    def value_max(self) -> float | bool:
+        """Return the largest value."""
+        return self._max[0][0]
+
+    @property
+    def value_min(self) -> float | bool:
+        """Return the smallest value."""
+        return self._min[0][0]
+
+    @property
+    def datetime_value_max(self) -> datetime:
+        """Return the age of the oldest sample with the largest value."""
+        return self._max[0][2]
+
+    @property
+    def datetime_value_min(self) -> datetime:
+        """Return the age of the oldest sample with the smallest value."""
+        return self._min[0][2]
+
+    @property
+    def sum_differences(self) -> float:
+        """Return the sum of the absolute differences of consecutive values."""
+        return self._sum_differences
+
+    @property
+    def sum_differences_nonnegative(self) -> float:
+        """Return the sum of the differences, counting a decrease as a reset."""
+        return self._sum_differences_nonnegative
+
+    @property
+    def area_linear(self) -> float:
+        """Return the area under the linearly interpolated values in seconds."""
+        return self._area_linear
+
+    @property
+    def area_step(self) -> float:
+        """Return the area under the values held until the next sample."""
+        return self._area_step
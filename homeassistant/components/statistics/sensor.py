@@ -1,12 +1,10 @@
 """Support for statistics for sensor values."""
 from __future__ import annotations
 
-from collections import deque
 from collections.abc import Callable
 import contextlib
 from datetime import datetime, timedelta
 import logging
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -56,6 +54,7 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .engine import StatisticsEngine
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -299,8 +298,9 @@ class StatisticsSensor(SensorEntity):
         self._unit_of_measurement: str | None = None
         self._available: bool = False
 
-        self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
-        self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        self._engine = StatisticsEngine(self._samples_max_buffer_size)
+        self.states = self._engine.states
+        self.ages = self._engine.ages
         self.attributes: dict[str, StateType] = {}
 
         self._state_characteristic_fn: Callable[
@@ -352,10 +352,9 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self._engine.add(new_state.state == "on", new_state.last_updated)
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                self._engine.add(float(new_state.state), new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -463,8 +462,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._engine.remove_oldest()
 
     def _next_to_purge_timestamp(self) -> datetime | None:
         """Find the timestamp when the next purge would occur."""
@@ -595,27 +593,14 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._engine.area_linear / age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._engine.area_step / age_range_seconds
         return None
 
     def _stat_average_timeless(self) -> StateType:
@@ -653,12 +638,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return self._engine.datetime_value_max
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return self._engine.datetime_value_min
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -673,17 +658,17 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            return self._engine.value_max - self._engine.value_min
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return self._engine.mean
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            return self._engine.median
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -693,35 +678,27 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            return self._engine.percentile(self._percentile)
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return self._engine.standard_deviation
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return self._engine.sum
         return None
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) >= 2:
-            diff_sum = sum(
-                abs(j - i) for i, j in zip(list(self.states), list(self.states)[1:])
-            )
-            return diff_sum
+            return self._engine.sum_differences
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) >= 2:
-            diff_sum_nn = sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:])
-            )
-            return diff_sum_nn
+            return self._engine.sum_differences_nonnegative
         return None
 
     def _stat_total(self) -> StateType:
@@ -729,27 +706,25 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return self._engine.value_max
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return self._engine.value_min
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return self._engine.variance
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
+            # The step area of the on states is the time they were on
+            on_seconds = self._engine.area_step
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return 100 / age_range_seconds * on_seconds
         return None
@@ -761,10 +736,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return round(self._engine.sum)
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - round(self._engine.sum)
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -774,5 +749,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * round(self._engine.sum)
         return None
@@ -39,6 +39,7 @@ from homeassistant.helpers.json import (
     json_dumps,
 )
 from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.startup_trace import async_get_startup_trace
 from homeassistant.helpers.typing import EventType
 from homeassistant.loader import (
     Integration,
@@ -47,12 +48,17 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.setup import (
+    DATA_IMPORT_TIME,
+    DATA_SETUP_TIME,
+    async_get_loaded_integrations,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
 from .const import ERR_NOT_FOUND
+from .http import async_get_metrics
 from .messages import construct_event_message, construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
@@ -73,6 +79,8 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_startup_trace)
+    async_reg(hass, handle_connection_metrics)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -307,20 +315,32 @@ def _forward_entity_changes(
     entity_ids: set[str],
     user: User,
     msg_id: int,
-    event: Event,
+    events: list[Event],
 ) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
+    """Forward entity state changed events to websocket.
+
+    All state changes of the same event loop iteration are sent as
+    a single message.
+    """
     # We have to lookup the permissions again because the user might have
     # changed since the subscription was created.
     permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
+    access_all_entities = permissions.access_all_entities(POLICY_READ)
+    forward = tuple(
+        event
+        for event in events
+        if (not entity_ids or event.data["entity_id"] in entity_ids)
+        and (
+            access_all_entities
+            or permissions.check_entity(event.data["entity_id"], POLICY_READ)
+        )
+    )
+    if not forward:
         return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+    if len(forward) == 1:
+        send_message(messages.cached_state_diff_message(msg_id, forward[0]))
+        return
+    send_message(messages.cached_state_diff_batch_message(msg_id, forward))
 
 
 @callback
@@ -339,7 +359,7 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+    connection.subscriptions[msg["id"]] = hass.bus.async_listen_batch(
         EVENT_STATE_CHANGED,
         callback(
             partial(
@@ -350,7 +370,6 @@ def handle_subscribe_entities(
                 msg["id"],
             )
         ),
-        run_immediately=True,
     )
     connection.send_result(msg["id"])
 
@@ -472,15 +491,44 @@ def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
-    connection.send_result(
-        msg["id"],
-        [
-            {"domain": integration, "seconds": timedelta.total_seconds()}
-            for integration, timedelta in cast(
-                dict[str, dt.timedelta], hass.data[DATA_SETUP_TIME]
-            ).items()
-        ],
-    )
+    import_time: dict[str, dict[str, float]] = hass.data.get(DATA_IMPORT_TIME, {})
+    setup_info: list[dict[str, Any]] = []
+    for integration, timedelta in cast(
+        dict[str, dt.timedelta], hass.data[DATA_SETUP_TIME]
+    ).items():
+        info: dict[str, Any] = {
+            "domain": integration,
+            "seconds": timedelta.total_seconds(),
+        }
+        if module_times := import_time.get(integration):
+            info["import_seconds"] = module_times
+        setup_info.append(info)
+    connection.send_result(msg["id"], setup_info)
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/startup_trace"})
+@decorators.require_admin
+def handle_integration_startup_trace(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle startup trace command."""
+    if (trace := async_get_startup_trace(hass)) is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_FOUND, "Startup trace is not enabled"
+        )
+        return
+    connection.send_result(msg["id"], trace.as_dict())
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "websocket_api/metrics"})
+@decorators.require_admin
+def handle_connection_metrics(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle connection metrics command."""
+    connection.send_result(msg["id"], async_get_metrics(hass).as_dict())
 
 
 @callback
@@ -48,4 +48,7 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
+# Data used to store the metrics of the connections
+DATA_METRICS: Final = f"{DOMAIN}.metrics"
+
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections import deque
 from collections.abc import Callable
+from dataclasses import dataclass, field
 import datetime as dt
 import logging
 from typing import TYPE_CHECKING, Any, Final
@@ -20,6 +21,7 @@ from homeassistant.util.json import json_loads
 from .auth import AuthPhase, auth_required_message
 from .const import (
     DATA_CONNECTIONS,
+    DATA_METRICS,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -50,6 +52,41 @@ class WebsocketAPIView(HomeAssistantView):
         return await WebSocketHandler(request.app["hass"], request).async_handle()
 
 
+@dataclass(slots=True)
+class WebSocketMetrics:
+    """Metrics of the websocket connections."""
+
+    handlers: set[WebSocketHandler] = field(default_factory=set)
+    closed_bytes_sent: int = 0
+    peak_queue_depth: int = 0
+
+    @callback
+    def async_remove_handler(self, handler: WebSocketHandler) -> None:
+        """Remove the handler of a closed connection."""
+        self.handlers.discard(handler)
+        self.closed_bytes_sent += handler.bytes_sent
+
+    @callback
+    def as_dict(self) -> dict[str, int]:
+        """Return the metrics of all connections."""
+        return {
+            "connections": len(self.handlers),
+            "bytes_sent": self.closed_bytes_sent
+            + sum(handler.bytes_sent for handler in self.handlers),
+            "queue_depth": sum(handler.queue_depth for handler in self.handlers),
+            "peak_queue_depth": self.peak_queue_depth,
+        }
+
+
+@callback
+def async_get_metrics(hass: HomeAssistant) -> WebSocketMetrics:
+    """Return the metrics of the websocket connections."""
+    metrics: WebSocketMetrics | None = hass.data.get(DATA_METRICS)
+    if metrics is None:
+        metrics = hass.data[DATA_METRICS] = WebSocketMetrics()
+    return metrics
+
+
 class WebSocketAdapter(logging.LoggerAdapter):
     """Add connection id to websocket messages."""
 
@@ -75,6 +112,8 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_bytes_sent",
+        "_peak_queue_depth",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -96,6 +135,8 @@ class WebSocketHandler:
         # an asyncio.Queue.
         self._message_queue: deque[str | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        self._bytes_sent = 0
+        self._peak_queue_depth = 0
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -115,6 +156,27 @@ class WebSocketHandler:
             return describe_request(request)
         return "finished connection"
 
+    @property
+    def bytes_sent(self) -> int:
+        """Return the size of the messages sent before compression.
+
+        The size is counted in characters, which equals the number of bytes
+        for ASCII messages.
+        """
+        return self._bytes_sent
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of messages waiting to be sent."""
+        if (message_queue := self._message_queue) is None:
+            return 0
+        return len(message_queue)
+
+    @property
+    def peak_queue_depth(self) -> int:
+        """Return the deepest the message queue has been."""
+        return self._peak_queue_depth
+
     async def _writer(self) -> None:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
@@ -149,6 +211,7 @@ class WebSocketHandler:
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
                     await send_str(message)
+                    self._bytes_sent += len(message)
                     continue
 
                 messages: list[str] = [message]
@@ -164,6 +227,7 @@ class WebSocketHandler:
                 if debug_enabled:
                     debug("%s: Sending %s", self.description, coalesced_messages)
                 await send_str(coalesced_messages)
+                self._bytes_sent += len(coalesced_messages)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -214,6 +278,8 @@ class WebSocketHandler:
             return
 
         message_queue.append(message)
+        if queue_size_before_add >= self._peak_queue_depth:
+            self._record_queue_depth(queue_size_before_add + 1)
         ready_future = self._ready_future
         if ready_future and not ready_future.done():
             ready_future.set_result(None)
@@ -230,6 +296,13 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _record_queue_depth(self, queue_depth: int) -> None:
+        """Record a new peak of the message queue depth."""
+        self._peak_queue_depth = queue_depth
+        metrics = async_get_metrics(self._hass)
+        metrics.peak_queue_depth = max(metrics.peak_queue_depth, queue_depth)
+
     @callback
     def _check_write_peak(self, _utc_time: dt.datetime) -> None:
         """Check that we are no longer above the write peak."""
@@ -325,6 +398,7 @@ class WebSocketHandler:
             connection = await auth.async_handle(auth_msg_data)
             self._connection = connection
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
+            async_get_metrics(hass).handlers.add(self)
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
 
             self._authenticated = True
@@ -440,7 +514,12 @@ class WebSocketHandler:
                     await wsock.close()
                 finally:
                     if disconnect_warn is None:
-                        debug("%s: Disconnected", self.description)
+                        debug(
+                            "%s: Disconnected after sending %s bytes, peak queue depth %s",
+                            self.description,
+                            self._bytes_sent,
+                            self._peak_queue_depth,
+                        )
                     else:
                         self._logger.warning(
                             "%s: Disconnected: %s", self.description, disconnect_warn
@@ -448,6 +527,7 @@ class WebSocketHandler:
 
                     if connection is not None:
                         hass.data[DATA_CONNECTIONS] -= 1
+                        async_get_metrics(hass).async_remove_handler(self)
                         self._connection = None
 
                     async_dispatcher_send(hass, SIGNAL_WEBSOCKET_DISCONNECTED)
@@ -121,6 +121,66 @@ def _cached_state_diff_message(event: Event) -> str:
     )
 
 
+def cached_state_diff_batch_message(iden: int, events: tuple[Event, ...]) -> str:
+    """Return an event message for a batch of state changed events.
+
+    All changes to the same entity are collapsed into a single
+    diff between the state the client knows and the latest state.
+
+    Connections that subscribed to the same entities receive the
+    same batch so the serialized message is shared between them.
+    """
+    return _cached_state_diff_batch_message(events).replace(
+        IDEN_JSON_TEMPLATE, str(iden), 1
+    )
+
+
+@lru_cache(maxsize=128)
+def _cached_state_diff_batch_message(events: tuple[Event, ...]) -> str:
+    """Cache and serialize the batch of events to json.
+
+    The IDEN_TEMPLATE is used which will be replaced
+    with the actual iden in cached_state_diff_batch_message
+    """
+    return message_to_json(
+        {"id": IDEN_TEMPLATE, "type": "event", "event": _state_diff_batch(events)}
+    )
+
+
+def _state_diff_batch(events: tuple[Event, ...]) -> dict[str, Any]:
+    """Merge state_changed events into a single minimal update."""
+    # entity_id -> (state known by the client, latest state)
+    changes: dict[str, tuple[State | None, State | None]] = {}
+    for event in events:
+        data = event.data
+        entity_id: str = data["entity_id"]
+        if entity_id in changes:
+            changes[entity_id] = (changes[entity_id][0], data["new_state"])
+        else:
+            changes[entity_id] = (data["old_state"], data["new_state"])
+
+    added: dict[str, dict[str, Any]] = {}
+    changed: dict[str, Any] = {}
+    removed: list[str] = []
+    for entity_id, (old_state, new_state) in changes.items():
+        if new_state is None:
+            if old_state is not None:
+                removed.append(entity_id)
+        elif old_state is None:
+            added[entity_id] = new_state.as_compressed_state()
+        else:
+            changed.update(_state_diff(old_state, new_state)[ENTITY_EVENT_CHANGE])
+
+    diff: dict[str, Any] = {}
+    if added:
+        diff[ENTITY_EVENT_ADD] = added
+    if changed:
+        diff[ENTITY_EVENT_CHANGE] = changed
+    if removed:
+        diff[ENTITY_EVENT_REMOVE] = removed
+    return diff
+
+
 def _state_diff_event(event: Event) -> dict:
     """Convert a state_changed event to the minimal version.
 
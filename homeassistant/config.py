@@ -61,7 +61,12 @@ from .helpers import (
 )
 from .helpers.entity_values import EntityValues
 from .helpers.typing import ConfigType
-from .loader import ComponentProtocol, Integration, IntegrationNotFound
+from .loader import (
+    ComponentProtocol,
+    Integration,
+    IntegrationNotFound,
+    async_wait_for_pre_import,
+)
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
@@ -915,6 +920,8 @@ async def async_process_component_config(  # noqa: C901
             _LOGGER.error("Platform error: %s - %s", domain, ex)
             continue
 
+        await async_wait_for_pre_import(hass, p_name)
+
         try:
             platform = p_integration.get_platform(domain)
         except LOAD_EXCEPTIONS:
@@ -21,6 +21,7 @@ import time
 from time import monotonic
 from typing import TYPE_CHECKING, Any, Generic, ParamSpec, Self, TypeVar, cast, overload
 from urllib.parse import urlparse
+import weakref
 
 import voluptuous as vol
 import yarl
@@ -134,6 +135,9 @@ TIMEOUT_EVENT_START = 15
 
 MAX_EXPECTED_ENTITY_IDS = 16384
 
+# Types of the attribute values of states that can share their attributes
+_SHAREABLE_ATTRIBUTE_TYPES = frozenset({str, int, float, bool, type(None)})
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -773,6 +777,8 @@ class HomeAssistant:
         # stage 1
         self.state = CoreState.stopping
         self.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        # Deliver pending batched events before the stage ends
+        self.bus._async_flush_batches()  # pylint: disable=protected-access
         try:
             async with self.timeout.async_timeout(STAGE_1_SHUTDOWN_TIMEOUT):
                 await self.async_block_till_done()
@@ -786,6 +792,7 @@ class HomeAssistant:
         # stage 2
         self.state = CoreState.final_write
         self.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        self.bus._async_flush_batches()  # pylint: disable=protected-access
         try:
             async with self.timeout.async_timeout(STAGE_2_SHUTDOWN_TIMEOUT):
                 await self.async_block_till_done()
@@ -799,6 +806,7 @@ class HomeAssistant:
         # stage 3
         self.state = CoreState.not_running
         self.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+        self.bus._async_flush_batches()  # pylint: disable=protected-access
 
         # Make a copy of running_tasks since a task can finish
         # while we are awaiting canceled tasks to get their result
@@ -977,17 +985,32 @@ _FilterableJobType = tuple[
     bool,  # run_immediately
 ]
 
+_FilterableBatchJobType = tuple[
+    HassJob[[list[Event]], Coroutine[Any, Any, None] | None],  # job
+    Callable[[Event], bool] | None,  # event_filter
+]
+
 
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = (
+        "_listeners",
+        "_match_all_listeners",
+        "_batch_listeners",
+        "_pending_batch",
+        "_batch_flush_handle",
+        "_hass",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        self._batch_listeners: dict[str, list[_FilterableBatchJobType]] = {}
+        self._pending_batch: list[tuple[Event, list[_FilterableBatchJobType]]] = []
+        self._batch_flush_handle: asyncio.Handle | None = None
         self._hass = hass
 
     @callback
@@ -996,7 +1019,10 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for key, batch_listeners in self._batch_listeners.items():
+            counts[key] = counts.get(key, 0) + len(batch_listeners)
+        return counts
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1041,6 +1067,20 @@ class EventBus:
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Bus:Handling %s", event)
 
+        if self._batch_listeners:
+            # Only listeners subscribed when the event is fired get it, copy
+            # the list as listeners may subscribe before the batch is flushed
+            batch_listeners = self._batch_listeners.get(event_type, [])
+            # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
+            if event_type != EVENT_HOMEASSISTANT_CLOSE and (
+                match_all_batch_listeners := self._batch_listeners.get(MATCH_ALL)
+            ):
+                batch_listeners = match_all_batch_listeners + batch_listeners
+            else:
+                batch_listeners = batch_listeners.copy()
+            if batch_listeners:
+                self._async_queue_batch_event(event, batch_listeners)
+
         if not listeners and not match_all_listeners:
             return
 
@@ -1064,6 +1104,59 @@ class EventBus:
             else:
                 self._hass.async_add_hass_job(job, event)
 
+    @callback
+    def _async_queue_batch_event(
+        self, event: Event, listeners: list[_FilterableBatchJobType]
+    ) -> None:
+        """Queue an event for the batch listeners.
+
+        All events queued in the same loop iteration are dispatched
+        together on the next iteration.
+        """
+        self._pending_batch.append((event, listeners))
+        if self._batch_flush_handle is None:
+            self._batch_flush_handle = self._hass.loop.call_soon(
+                self._async_flush_batches
+            )
+
+    @callback
+    def _async_flush_batches(self) -> None:
+        """Dispatch the queued events to the batch listeners.
+
+        This is also called directly during shutdown so events fired
+        in the last loop iteration are not lost.
+        """
+        if self._batch_flush_handle is not None:
+            self._batch_flush_handle.cancel()
+            self._batch_flush_handle = None
+        if not self._pending_batch:
+            return
+        pending = self._pending_batch
+        self._pending_batch = []
+        # Batch listeners that listen to multiple event types (MATCH_ALL)
+        # get all their events of this iteration in a single list,
+        # in the order they were fired
+        batches: dict[HassJob[[list[Event]], Any], list[Event]] = {}
+        for event, listeners in pending:
+            for job, event_filter in listeners:
+                if event_filter is not None:
+                    try:
+                        if not event_filter(event):
+                            continue
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception("Error in event filter")
+                        continue
+                if batch := batches.get(job):
+                    batch.append(event)
+                else:
+                    batches[job] = [event]
+
+        for job, batch in batches.items():
+            try:
+                self._hass.async_run_hass_job(job, batch)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running job: %s", job)
+
     def listen(
         self,
         event_type: str,
@@ -1116,6 +1209,66 @@ class EventBus:
             (HassJob(listener, f"listen {event_type}"), event_filter, run_immediately),
         )
 
+    @callback
+    def async_listen_batch(
+        self,
+        event_type: str,
+        listener: Callable[[list[Event]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[Event], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for batches of events of a specific type.
+
+        Events fired within the same event loop iteration are grouped and
+        the listener is called once with a list of the events, in the order
+        they were fired. This avoids scheduling a job per event when many
+        events are fired in a burst.
+
+        To listen to all events specify the constant ``MATCH_ALL``
+        as event_type.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines which events
+        are included in the batch. The listener is not called if no events
+        in the batch pass the filter.
+
+        This method must be run in the event loop.
+        """
+        if event_filter is not None and not is_callback(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        filterable_job: _FilterableBatchJobType = (
+            HassJob(listener, f"listen batch {event_type}"),
+            event_filter,
+        )
+        self._batch_listeners.setdefault(event_type, []).append(filterable_job)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_batch_listener(event_type, filterable_job)
+
+        return remove_listener
+
+    @callback
+    def _async_remove_batch_listener(
+        self, event_type: str, filterable_job: _FilterableBatchJobType
+    ) -> None:
+        """Remove a batch listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            self._batch_listeners[event_type].remove(filterable_job)
+
+            # delete event_type list if empty
+            if not self._batch_listeners[event_type]:
+                self._batch_listeners.pop(event_type)
+        except (KeyError, ValueError):
+            # KeyError is key event_type listener did not exist
+            # ValueError if listener did not exist within event_type
+            _LOGGER.exception(
+                "Unable to remove unknown batch job listener %s", filterable_job
+            )
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJobType
@@ -1267,7 +1420,13 @@ class State:
 
         self.entity_id = entity_id
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        # ReadOnlyDict attributes are immutable so they can be
+        # shared between states instead of being copied
+        self.attributes = (
+            attributes
+            if type(attributes) is ReadOnlyDict
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1416,13 +1575,23 @@ class State:
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_domain_index", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_domain_index",
+        "_reservations",
+        "_shared_attributes",
+        "_bus",
+        "_loop",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
         self._domain_index: dict[str, dict[str, State]] = {}
         self._reservations: set[str] = set()
+        self._shared_attributes: weakref.WeakValueDictionary[
+            tuple[tuple[str, Any], ...], ReadOnlyDict[str, Any]
+        ] = weakref.WeakValueDictionary()
         self._bus = bus
         self._loop = loop
 
@@ -1626,6 +1795,13 @@ class StateMachine:
         if same_state and same_attr:
             return
 
+        if same_attr:
+            if TYPE_CHECKING:
+                assert old_state is not None
+            attributes = old_state.attributes
+        else:
+            attributes = self._async_share_attributes(attributes)
+
         if context is None:
             # It is much faster to convert a timestamp to a utc datetime object
             # than converting a utc datetime object to a timestamp since cpython
@@ -1668,6 +1844,32 @@ class StateMachine:
             time_fired=now,
         )
 
+    @callback
+    def _async_share_attributes(
+        self, attributes: Mapping[str, Any]
+    ) -> Mapping[str, Any]:
+        """Return a shared ReadOnlyDict for the attributes if possible.
+
+        Many entities have the exact same attributes so we keep
+        one immutable copy of each distinct set of attributes as
+        long as a state is still using it.
+        """
+        for value in attributes.values():
+            # Equal containers may hold values of different types, for example
+            # (255, 0, 0) and (255.0, 0.0, 0.0), so only scalars are shared
+            if type(value) not in _SHAREABLE_ATTRIBUTE_TYPES:
+                return attributes
+        key = tuple(attributes.items())
+        if (shared := self._shared_attributes.get(key)) is not None:
+            # 1, 1.0 and True compare equal so the types must be checked
+            for attr, value in attributes.items():
+                if type(value) is not type(shared[attr]):
+                    return attributes
+            return shared
+        shared = ReadOnlyDict(attributes)
+        self._shared_attributes[key] = shared
+        return shared
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
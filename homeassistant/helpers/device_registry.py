@@ -448,6 +448,7 @@ class DeviceRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
 
     @callback
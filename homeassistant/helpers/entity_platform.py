@@ -44,7 +44,7 @@ from .issue_registry import IssueSeverity, async_create_issue
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
-    from .entity import Entity
+    from .entity import DeviceInfo, Entity
 
 
 SLOW_SETUP_WARNING = 10
@@ -360,11 +360,11 @@ class EntityPlatform:
 
                 # Block till all entities are done
                 while self._tasks:
-                    pending = [task for task in self._tasks if not task.done()]
+                    # Entities may have been added without suspending,
+                    # gather the done tasks too so their errors are raised
+                    pending = self._tasks.copy()
                     self._tasks.clear()
-
-                    if pending:
-                        await asyncio.gather(*pending)
+                    await asyncio.gather(*pending)
 
                 hass.config.components.add(full_name)
                 self._setup_complete = True
@@ -492,19 +492,24 @@ class EntityPlatform:
         hass = self.hass
 
         entity_registry = ent_reg.async_get(hass)
-        tasks = [
-            self._async_add_entity(entity, update_before_add, entity_registry)
-            for entity in new_entities
-        ]
+        entities = list(new_entities)
 
         # No entities for processing
-        if not tasks:
+        if not entities:
             return
 
-        timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(tasks), SLOW_ADD_MIN_TIMEOUT)
+        timeout = max(SLOW_ADD_ENTITY_MAX_WAIT * len(entities), SLOW_ADD_MIN_TIMEOUT)
         try:
             async with self.hass.timeout.async_timeout(timeout, self.domain):
-                await asyncio.gather(*tasks)
+                if update_before_add:
+                    await asyncio.gather(
+                        *(
+                            self._async_add_entity(entity, True, entity_registry)
+                            for entity in entities
+                        )
+                    )
+                else:
+                    await self._async_add_entities_bulk(entities, entity_registry)
         except asyncio.TimeoutError:
             self.logger.warning(
                 "Timed out adding entities for domain %s with platform %s after %ds",
@@ -534,6 +539,42 @@ class EntityPlatform:
             name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
         )
 
+    async def _async_add_entities_bulk(
+        self, entities: list[Entity], entity_registry: EntityRegistry
+    ) -> None:
+        """Add entities which do not need an update before they are added.
+
+        All entities are registered in a single pass first, reusing the
+        device of the previous entity when the device info is the same.
+        They are then added to Home Assistant concurrently.
+        """
+        device_cache: list[tuple[DeviceInfo, dev_reg.DeviceEntry]] = []
+        registered: list[Entity] = []
+        error: Exception | None = None
+        for entity in entities:
+            try:
+                if entity is None:
+                    raise ValueError("Entity cannot be None")
+                entity.add_to_platform_start(
+                    self.hass,
+                    self,
+                    self._get_parallel_updates_semaphore(hasattr(entity, "update")),
+                )
+                if self._async_register_entity(entity, entity_registry, device_cache):
+                    registered.append(entity)
+            except Exception as err:  # pylint: disable=broad-except
+                error = error or err
+
+        if registered:
+            await asyncio.gather(
+                *(entity.add_to_platform_finish() for entity in registered)
+            )
+
+        # Raise the first error once all other entities have been added, the
+        # same way adding the entities concurrently would
+        if error is not None:
+            raise error
+
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
         """Check if an entity_id already exists.
 
@@ -550,7 +591,7 @@ class EntityPlatform:
                 already_exists = True
         return (already_exists, restored)
 
-    async def _async_add_entity(  # noqa: C901
+    async def _async_add_entity(
         self,
         entity: Entity,
         update_before_add: bool,
@@ -576,6 +617,22 @@ class EntityPlatform:
                 entity.add_to_platform_abort()
                 return
 
+        if self._async_register_entity(entity, entity_registry, None):
+            await entity.add_to_platform_finish()
+
+    @callback
+    def _async_register_entity(  # noqa: C901
+        self,
+        entity: Entity,
+        entity_registry: EntityRegistry,
+        device_cache: list[tuple[DeviceInfo, dev_reg.DeviceEntry]] | None,
+    ) -> bool:
+        """Register an entity and reserve its entity_id.
+
+        Returns if the entity should be added to Home Assistant. The device of
+        the previous entity registered with the same device_cache is reused if
+        the device info of the entity is the same.
+        """
         suggested_object_id: str | None = None
         generate_new_entity_id = False
 
@@ -609,14 +666,19 @@ class EntityPlatform:
                         )
                     self.logger.error(msg)
                     entity.add_to_platform_abort()
-                    return
+                    return False
 
             if self.config_entry and (device_info := entity.device_info):
                 try:
-                    device = dev_reg.async_get(self.hass).async_get_or_create(
-                        config_entry_id=self.config_entry.entry_id,
-                        **device_info,
-                    )
+                    if device_cache and device_cache[0][0] == device_info:
+                        device = device_cache[0][1]
+                    else:
+                        device = dev_reg.async_get(self.hass).async_get_or_create(
+                            config_entry_id=self.config_entry.entry_id,
+                            **device_info,
+                        )
+                        if device_cache is not None:
+                            device_cache[:] = [(device_info, device)]
                 except dev_reg.DeviceInfoError as exc:
                     self.logger.error(
                         "%s: Not adding entity with invalid device info: %s",
@@ -624,7 +686,7 @@ class EntityPlatform:
                         str(exc),
                     )
                     entity.add_to_platform_abort()
-                    return
+                    return False
             else:
                 device = None
 
@@ -720,7 +782,7 @@ class EntityPlatform:
                 "Entity id already exists - ignoring: %s", entity.entity_id
             )
             entity.add_to_platform_abort()
-            return
+            return False
 
         if entity.registry_entry and entity.registry_entry.disabled:
             self.logger.debug(
@@ -730,7 +792,7 @@ class EntityPlatform:
                 or f'"{self.platform_name} {entity.unique_id}"',
             )
             entity.add_to_platform_abort()
-            return
+            return False
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
@@ -748,8 +810,7 @@ class EntityPlatform:
             self.entities.pop(entity_id)
 
         entity.async_on_remove(remove_entity_cb)
-
-        await entity.add_to_platform_finish()
+        return True
 
     async def async_reset(self) -> None:
         """Remove all entities and reset data.
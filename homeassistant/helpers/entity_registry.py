@@ -10,7 +10,7 @@ timer.
 from __future__ import annotations
 
 from collections import UserDict
-from collections.abc import Callable, Iterable, Mapping, ValuesView
+from collections.abc import Callable, Iterable, Iterator, Mapping, ValuesView
 from datetime import datetime, timedelta
 from enum import StrEnum
 import logging
@@ -430,12 +430,60 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
         return data
 
 
+def _registry_entry_from_stored(entity: dict[str, Any]) -> RegistryEntry:
+    """Create a registry entry from its stored data."""
+    # We removed this in 2022.5. Remove this check in 2023.1.
+    if entity["entity_category"] == "system":
+        entity["entity_category"] = None
+
+    return RegistryEntry(
+        aliases=set(entity["aliases"]),
+        area_id=entity["area_id"],
+        capabilities=entity["capabilities"],
+        config_entry_id=entity["config_entry_id"],
+        device_class=entity["device_class"],
+        device_id=entity["device_id"],
+        disabled_by=RegistryEntryDisabler(entity["disabled_by"])
+        if entity["disabled_by"]
+        else None,
+        entity_category=EntityCategory(entity["entity_category"])
+        if entity["entity_category"]
+        else None,
+        entity_id=entity["entity_id"],
+        hidden_by=RegistryEntryHider(entity["hidden_by"])
+        if entity["hidden_by"]
+        else None,
+        icon=entity["icon"],
+        id=entity["id"],
+        has_entity_name=entity["has_entity_name"],
+        name=entity["name"],
+        options=entity["options"],
+        original_device_class=entity["original_device_class"],
+        original_icon=entity["original_icon"],
+        original_name=entity["original_name"],
+        platform=entity["platform"],
+        supported_features=entity["supported_features"],
+        translation_key=entity["translation_key"],
+        unique_id=entity["unique_id"],
+        unit_of_measurement=entity["unit_of_measurement"],
+    )
+
+
 class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+    - config_entry_id -> entity_ids
+    - device_id -> entity_ids
+
+    Stored entries added with add_stored are only turned into registry
+    entries when they are first accessed. A lookup by entity_id, id or
+    the unique id of a platform creates the entries of that platform, a
+    lookup by config entry or device creates the entries of the platforms
+    of the matching entities. Iterating the container creates all
+    remaining entries.
     """
 
     def __init__(self) -> None:
@@ -443,36 +491,188 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._config_entry_id_index: dict[str, dict[str, None]] = {}
+        self._device_id_index: dict[str, dict[str, None]] = {}
+        self._stored: dict[str, dict[str, dict[str, Any]]] = {}
+        self._stored_platforms: dict[str, str] = {}
+        self._stored_ids: dict[str, str] = {}
+
+    def add_stored(self, entities: Iterable[dict[str, Any]]) -> None:
+        """Add stored entries to create when they are first accessed."""
+        stored = self._stored
+        stored_platforms = self._stored_platforms
+        stored_ids = self._stored_ids
+        for entity in entities:
+            entity_id = entity["entity_id"]
+            if entity_id in self.data:
+                del self[entity_id]
+            elif (old_platform := stored_platforms.get(entity_id)) is not None:
+                old_entity = stored[old_platform].pop(entity_id)
+                self._unindex(
+                    entity_id, old_entity["config_entry_id"], old_entity["device_id"]
+                )
+            self._add_index(entity_id, entity["config_entry_id"], entity["device_id"])
+            platform = entity["platform"]
+            if (platform_entities := stored.get(platform)) is None:
+                platform_entities = stored[platform] = {}
+            platform_entities[entity_id] = entity
+            stored_platforms[entity_id] = platform
+            stored_ids[entity["id"]] = entity_id
+
+    def _add_index(
+        self, entity_id: str, config_entry_id: str | None, device_id: str | None
+    ) -> None:
+        """Add an entity_id to the config entry and device indexes."""
+        if config_entry_id is not None:
+            self._config_entry_id_index.setdefault(config_entry_id, {})[
+                entity_id
+            ] = None
+        if device_id is not None:
+            self._device_id_index.setdefault(device_id, {})[entity_id] = None
+
+    def _unindex(
+        self, entity_id: str, config_entry_id: str | None, device_id: str | None
+    ) -> None:
+        """Remove an entity_id from the config entry and device indexes."""
+        for index, key in (
+            (self._config_entry_id_index, config_entry_id),
+            (self._device_id_index, device_id),
+        ):
+            if key is None or (entity_ids := index.get(key)) is None:
+                continue
+            entity_ids.pop(entity_id, None)
+            if not entity_ids:
+                del index[key]
+
+    def _create_platform(self, platform: str) -> None:
+        """Create the registry entries of the stored entries of a platform."""
+        stored_platforms = self._stored_platforms
+        for entity_id, entity in self._stored.pop(platform).items():
+            # Skip entries which were replaced before they were created
+            if stored_platforms.get(entity_id) != platform:
+                continue
+            del stored_platforms[entity_id]
+            self[entity_id] = _registry_entry_from_stored(entity)
+        if not self._stored:
+            self._stored_ids.clear()
+
+    def _create_all(self) -> None:
+        """Create the registry entries of all stored entries."""
+        for platform in list(self._stored):
+            self._create_platform(platform)
+
+    def stored_values(self) -> Iterator[dict[str, Any]]:
+        """Return the stored entries which were not created yet."""
+        stored_platforms = self._stored_platforms
+        for platform, platform_entities in self._stored.items():
+            for entity_id, entity in platform_entities.items():
+                if stored_platforms.get(entity_id) == platform:
+                    yield entity
 
     def values(self) -> ValuesView[RegistryEntry]:
         """Return the underlying values to avoid __iter__ overhead."""
+        if self._stored:
+            self._create_all()
         return self.data.values()
 
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the entity_ids."""
+        if self._stored:
+            self._create_all()
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self.data) + len(self._stored_platforms)
+
+    def __contains__(self, key: object) -> bool:
+        """Return if an entity_id is in the container."""
+        return key in self.data or key in self._stored_platforms
+
+    def __getitem__(self, key: str) -> RegistryEntry:
+        """Get an entry by entity_id."""
+        if (platform := self._stored_platforms.get(key)) is not None:
+            self._create_platform(platform)
+        return self.data[key]
+
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
-        if key in self:
-            old_entry = self[key]
+        if key in self.data:
+            old_entry = self.data[key]
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
+            self._unindex(key, old_entry.config_entry_id, old_entry.device_id)
+        elif (platform := self._stored_platforms.pop(key, None)) is not None:
+            stored = self._stored[platform][key]
+            self._unindex(key, stored["config_entry_id"], stored["device_id"])
         super().__setitem__(key, entry)
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        self._add_index(key, entry.config_entry_id, entry.device_id)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        self._unindex(key, entry.config_entry_id, entry.device_id)
         super().__delitem__(key)
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
+        if key[1] in self._stored:
+            self._create_platform(key[1])
         return self._index.get(key)
 
     def get_entry(self, key: str) -> RegistryEntry | None:
         """Get entry from id."""
+        if (
+            entity_id := self._stored_ids.get(key)
+        ) is not None and entity_id in self._stored_platforms:
+            self._create_platform(self._stored_platforms[entity_id])
         return self._entry_ids.get(key)
 
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        return [
+            self[entity_id]
+            for entity_id in list(self._config_entry_id_index.get(config_entry_id, ()))
+        ]
+
+    def get_entries_for_device_id(
+        self, device_id: str, include_disabled_entities: bool = False
+    ) -> list[RegistryEntry]:
+        """Get entries for device."""
+        entries = [
+            self[entity_id]
+            for entity_id in list(self._device_id_index.get(device_id, ()))
+        ]
+        if include_disabled_entities:
+            return entries
+        return [entry for entry in entries if not entry.disabled_by]
+
+    def get_device_classes(self) -> Iterator[tuple[str, str, str | None]]:
+        """Return device_id, entity_id and device class of entries with a device.
+
+        Stored entries are not created.
+        """
+        for entry in self.data.values():
+            if entry.device_id:
+                yield (
+                    entry.device_id,
+                    entry.entity_id,
+                    entry.device_class or entry.original_device_class,
+                )
+        for entity in self.stored_values():
+            if entity["device_id"]:
+                yield (
+                    entity["device_id"],
+                    entity["entity_id"],
+                    entity["device_class"] or entity["original_device_class"],
+                )
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -490,6 +690,7 @@ class EntityRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
@@ -505,17 +706,14 @@ class EntityRegistry:
         The result is indexed by device_id, then by the matching (domain, device_class)
         """
         lookup: dict[str, dict[tuple[str, str | None], str]] = {}
-        for entity in self.entities.values():
-            if not entity.device_id:
-                continue
-            device_class = entity.device_class or entity.original_device_class
-            domain_device_class = (entity.domain, device_class)
+        for device_id, entity_id, device_class in self.entities.get_device_classes():
+            domain_device_class = (split_entity_id(entity_id)[0], device_class)
             if domain_device_class not in domain_device_classes:
                 continue
-            if entity.device_id not in lookup:
-                lookup[entity.device_id] = {domain_device_class: entity.entity_id}
+            if device_id not in lookup:
+                lookup[device_id] = {domain_device_class: entity_id}
             else:
-                lookup[entity.device_id][domain_device_class] = entity.entity_id
+                lookup[device_id][domain_device_class] = entity_id
         return lookup
 
     @callback
@@ -530,9 +728,12 @@ class EntityRegistry:
         We retrieve the RegistryEntry from the underlying dict to avoid
         the overhead of the UserDict __getitem__.
         """
-        return self._entities_data.get(entity_id_or_uuid) or self.entities.get_entry(
-            entity_id_or_uuid
-        )
+        if (entry := self._entities_data.get(entity_id_or_uuid)) is not None:
+            return entry
+        if entity_id_or_uuid in self.entities:
+            # Stored entry which was not created yet
+            return self.entities[entity_id_or_uuid]
+        return self.entities.get_entry(entity_id_or_uuid)
 
     @callback
     def async_get_entity_id(
@@ -1040,42 +1241,7 @@ class EntityRegistry:
         deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry] = {}
 
         if data is not None:
-            for entity in data["entities"]:
-                # We removed this in 2022.5. Remove this check in 2023.1.
-                if entity["entity_category"] == "system":
-                    entity["entity_category"] = None
-
-                entities[entity["entity_id"]] = RegistryEntry(
-                    aliases=set(entity["aliases"]),
-                    area_id=entity["area_id"],
-                    capabilities=entity["capabilities"],
-                    config_entry_id=entity["config_entry_id"],
-                    device_class=entity["device_class"],
-                    device_id=entity["device_id"],
-                    disabled_by=RegistryEntryDisabler(entity["disabled_by"])
-                    if entity["disabled_by"]
-                    else None,
-                    entity_category=EntityCategory(entity["entity_category"])
-                    if entity["entity_category"]
-                    else None,
-                    entity_id=entity["entity_id"],
-                    hidden_by=RegistryEntryHider(entity["hidden_by"])
-                    if entity["hidden_by"]
-                    else None,
-                    icon=entity["icon"],
-                    id=entity["id"],
-                    has_entity_name=entity["has_entity_name"],
-                    name=entity["name"],
-                    options=entity["options"],
-                    original_device_class=entity["original_device_class"],
-                    original_icon=entity["original_icon"],
-                    original_name=entity["original_name"],
-                    platform=entity["platform"],
-                    supported_features=entity["supported_features"],
-                    translation_key=entity["translation_key"],
-                    unique_id=entity["unique_id"],
-                    unit_of_measurement=entity["unit_of_measurement"],
-                )
+            entities.add_stored(data["entities"])
             for entity in data["deleted_entities"]:
                 key = (
                     split_entity_id(entity["entity_id"])[0],
@@ -1131,8 +1297,10 @@ class EntityRegistry:
                 "unique_id": entry.unique_id,
                 "unit_of_measurement": entry.unit_of_measurement,
             }
-            for entry in self.entities.values()
+            for entry in self._entities_data.values()
         ]
+        # Entries which were never accessed are saved as they were loaded
+        data["entities"].extend(self.entities.stored_values())
         data["deleted_entities"] = [
             {
                 "config_entry_id": entry.config_entry_id,
@@ -1208,12 +1376,9 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
-    ]
+    return registry.entities.get_entries_for_device_id(
+        device_id, include_disabled_entities
+    )
 
 
 @callback
@@ -1229,11 +1394,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -1340,10 +1501,7 @@ async def async_migrate_entries(
     """Migrator of unique IDs."""
     ent_reg = async_get(hass)
 
-    for entry in ent_reg.entities.values():
-        if entry.config_entry_id != config_entry_id:
-            continue
-
+    for entry in ent_reg.entities.get_entries_for_config_entry_id(config_entry_id):
         updates = entry_callback(entry)
 
         if updates is not None:
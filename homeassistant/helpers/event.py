@@ -50,12 +50,6 @@ from .typing import EventType, TemplateVarsType
 TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
 TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
 
-TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
-TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
-
-TRACK_STATE_REMOVED_DOMAIN_CALLBACKS = "track_state_removed_domain_callbacks"
-TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
-
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
@@ -221,8 +215,11 @@ def async_track_state_change(
         return True
 
     @callback
-    def state_change_dispatcher(event: EventType[EventStateChangedData]) -> None:
+    def state_change_listener(event: EventType[EventStateChangedData]) -> None:
         """Handle specific state changes."""
+        if not state_change_filter(event):
+            return
+
         hass.async_run_hass_job(
             job,
             event.data["entity_id"],
@@ -230,28 +227,18 @@ def async_track_state_change(
             event.data["new_state"],
         )
 
-    @callback
-    def state_change_listener(event: EventType[EventStateChangedData]) -> None:
-        """Handle specific state changes."""
-        if not state_change_filter(event):
-            return
+    if entity_ids == MATCH_ALL:
+        return _async_track_state_change_event(hass, MATCH_ALL, state_change_listener)
 
-        state_change_dispatcher(event)
-
-    if entity_ids != MATCH_ALL:
-        # If we have a list of entity ids we use
-        # async_track_state_change_event to route
-        # by entity_id to avoid iterating though state change
-        # events and creating a jobs where the most
-        # common outcome is to return right away because
-        # the entity_id does not match since usually
-        # only one or two listeners want that specific
-        # entity_id.
-        return async_track_state_change_event(hass, entity_ids, state_change_listener)
-
-    return hass.bus.async_listen(
-        EVENT_STATE_CHANGED, state_change_dispatcher, event_filter=state_change_filter  # type: ignore[arg-type]
-    )
+    # If we have a list of entity ids we use
+    # async_track_state_change_event to route
+    # by entity_id to avoid iterating though state change
+    # events and creating a jobs where the most
+    # common outcome is to return right away because
+    # the entity_id does not match since usually
+    # only one or two listeners want that specific
+    # entity_id.
+    return async_track_state_change_event(hass, entity_ids, state_change_listener)
 
 
 track_state_change = threaded_listener_factory(async_track_state_change)
@@ -273,8 +260,18 @@ def async_track_state_change_event(
     for each one, we keep a dict of entity ids that
     care about the state change events so we can
     do a fast dict lookup to route events.
+
+    Only entity_ids are tracked, anything that is not an
+    entity_id will never match a state change.
     """
-    if not (entity_ids := _async_string_to_lower_list(entity_ids)):
+    if not (
+        entity_ids := [
+            entity_id
+            for entity_id in _async_string_to_lower_list(entity_ids)
+            # Domain and MATCH_ALL keys are reserved for internal use
+            if "." in entity_id
+        ]
+    ):
         return _remove_empty_listener
     return _async_track_state_change_event(hass, entity_ids, action)
 
@@ -286,17 +283,19 @@ def _async_dispatch_entity_id_event(
     event: EventType[EventStateChangedData],
 ) -> None:
     """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list[:]:
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
-            )
+    entity_id = event.data["entity_id"]
+    for key in (entity_id, entity_id.partition(".")[0], MATCH_ALL):
+        if not (callbacks_list := callbacks.get(key)):
+            continue
+        for job in callbacks_list[:]:
+            try:
+                hass.async_run_hass_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while dispatching event for %s to %s",
+                    entity_id,
+                    job,
+                )
 
 
 @callback
@@ -305,8 +304,13 @@ def _async_state_change_filter(
     callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
     event: EventType[EventStateChangedData],
 ) -> bool:
-    """Filter state changes by entity_id."""
-    return event.data["entity_id"] in callbacks
+    """Filter state changes by entity_id, domain or MATCH_ALL."""
+    entity_id = event.data["entity_id"]
+    return (
+        entity_id in callbacks
+        or MATCH_ALL in callbacks
+        or entity_id.partition(".")[0] in callbacks
+    )
 
 
 @bind_hass
@@ -315,7 +319,15 @@ def _async_track_state_change_event(
     entity_ids: str | Iterable[str],
     action: Callable[[EventType[EventStateChangedData]], Any],
 ) -> CALLBACK_TYPE:
-    """async_track_state_change_event without lowercasing."""
+    """async_track_state_change_event without lowercasing.
+
+    Keys may be entity_ids, domains or MATCH_ALL. Trackers that
+    follow whole domains or all entities share the single
+    EVENT_STATE_CHANGED listener with the entity_id trackers so
+    the cost of a state write only depends on the number of
+    matching listeners. A job must not be registered for both
+    an entity_id and its domain or it will be called twice.
+    """
     return _async_track_event(
         hass,
         entity_ids,
@@ -529,36 +541,6 @@ def async_track_device_registry_updated_event(
     )
 
 
-@callback
-def _async_dispatch_domain_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
-) -> None:
-    """Dispatch domain event listeners."""
-    domain = split_entity_id(event.data["entity_id"])[0]
-    for job in callbacks.get(domain, []) + callbacks.get(MATCH_ALL, []):
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while processing event %s for domain %s", event, domain
-            )
-
-
-@callback
-def _async_domain_added_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event.data["old_state"] is None and (
-        MATCH_ALL in callbacks
-        or split_entity_id(event.data["entity_id"])[0] in callbacks
-    )
-
-
 @bind_hass
 def async_track_state_added_domain(
     hass: HomeAssistant,
@@ -568,39 +550,14 @@ def async_track_state_added_domain(
     """Track state change events when an entity is added to domains."""
     if not (domains := _async_string_to_lower_list(domains)):
         return _remove_empty_listener
-    return _async_track_state_added_domain(hass, domains, action)
-
-
-@bind_hass
-def _async_track_state_added_domain(
-    hass: HomeAssistant,
-    domains: str | Iterable[str],
-    action: Callable[[EventType[EventStateChangedData]], Any],
-) -> CALLBACK_TYPE:
-    """Track state change events when an entity is added to domains."""
-    return _async_track_event(
-        hass,
-        domains,
-        TRACK_STATE_ADDED_DOMAIN_CALLBACKS,
-        TRACK_STATE_ADDED_DOMAIN_LISTENER,
-        EVENT_STATE_CHANGED,
-        _async_dispatch_domain_event,
-        _async_domain_added_filter,
-        action,
-    )
+    job = HassJob(action, f"track state added domain event {domains}")
 
+    @callback
+    def _async_state_added(event: EventType[EventStateChangedData]) -> None:
+        if event.data["old_state"] is None:
+            hass.async_run_hass_job(job, event)
 
-@callback
-def _async_domain_removed_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event.data["new_state"] is None and (
-        MATCH_ALL in callbacks
-        or split_entity_id(event.data["entity_id"])[0] in callbacks
-    )
+    return _async_track_state_change_event(hass, domains, _async_state_added)
 
 
 @bind_hass
@@ -610,16 +567,16 @@ def async_track_state_removed_domain(
     action: Callable[[EventType[EventStateChangedData]], Any],
 ) -> CALLBACK_TYPE:
     """Track state change events when an entity is removed from domains."""
-    return _async_track_event(
-        hass,
-        domains,
-        TRACK_STATE_REMOVED_DOMAIN_CALLBACKS,
-        TRACK_STATE_REMOVED_DOMAIN_LISTENER,
-        EVENT_STATE_CHANGED,
-        _async_dispatch_domain_event,
-        _async_domain_removed_filter,
-        action,
-    )
+    if not (domains := _async_string_to_lower_list(domains)):
+        return _remove_empty_listener
+    job = HassJob(action, f"track state removed domain event {domains}")
+
+    @callback
+    def _async_state_removed(event: EventType[EventStateChangedData]) -> None:
+        if event.data["new_state"] is None:
+            hass.async_run_hass_job(job, event)
+
+    return _async_track_state_change_event(hass, domains, _async_state_removed)
 
 
 @callback
@@ -642,9 +599,6 @@ class _TrackStateChangeFiltered:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
         self._action = action
-        self._action_as_hassjob = HassJob(
-            action, f"track state change filtered {track_states}"
-        )
         self._listeners: dict[str, Callable[[], None]] = {}
         self._last_track_states: TrackStates = track_states
 
@@ -729,8 +683,13 @@ class _TrackStateChangeFiltered:
     @callback
     def _setup_entities_listener(self, domains: set[str], entities: set[str]) -> None:
         if domains:
-            entities = entities.copy()
-            entities.update(self.hass.states.async_entity_ids(domains))
+            # Entities in tracked domains are already
+            # covered by the domains listener
+            entities = {
+                entity_id
+                for entity_id in entities
+                if entity_id.partition(".")[0] not in domains
+            }
 
         # Entities has changed to none
         if not entities:
@@ -740,27 +699,19 @@ class _TrackStateChangeFiltered:
             self.hass, entities, self._action
         )
 
-    @callback
-    def _state_added(self, event: EventType[EventStateChangedData]) -> None:
-        self._cancel_listener(_ENTITIES_LISTENER)
-        self._setup_entities_listener(
-            self._last_track_states.domains, self._last_track_states.entities
-        )
-        self.hass.async_run_hass_job(self._action_as_hassjob, event)
-
     @callback
     def _setup_domains_listener(self, domains: set[str]) -> None:
         if not domains:
             return
 
-        self._listeners[_DOMAINS_LISTENER] = _async_track_state_added_domain(
-            self.hass, domains, self._state_added
+        self._listeners[_DOMAINS_LISTENER] = _async_track_state_change_event(
+            self.hass, domains, self._action
         )
 
     @callback
     def _setup_all_listener(self) -> None:
-        self._listeners[_ALL_LISTENER] = self.hass.bus.async_listen(
-            EVENT_STATE_CHANGED, self._action  # type: ignore[arg-type]
+        self._listeners[_ALL_LISTENER] = _async_track_state_change_event(
+            self.hass, MATCH_ALL, self._action
         )
 
 
@@ -1333,8 +1284,8 @@ def async_track_same_state(
     async_remove_state_for_listener = async_call_later(hass, period, state_for_listener)
 
     if entity_ids == MATCH_ALL:
-        async_remove_state_for_cancel = hass.bus.async_listen(
-            EVENT_STATE_CHANGED, state_for_cancel_listener  # type: ignore[arg-type]
+        async_remove_state_for_cancel = _async_track_state_change_event(
+            hass, MATCH_ALL, state_for_cancel_listener
         )
     else:
         async_remove_state_for_cancel = async_track_state_change_event(
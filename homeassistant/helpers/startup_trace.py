@@ -0,0 +1,189 @@
+"""Record a timeline of the Home Assistant startup.
+
+The timeline is written as a Chrome trace event file which can be
+opened with chrome://tracing or https://ui.perfetto.dev.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+import contextlib
+import logging
+from time import monotonic
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .json import save_json
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STARTUP_TRACE = "startup_trace"
+
+STARTUP_TRACE_FILE = "startup_trace.json"
+
+# How often the event loop is checked for being blocked
+LOOP_CHECK_INTERVAL = 0.05
+# How late a check must run to record the event loop as blocked
+LOOP_BLOCKED_THRESHOLD = 0.1
+
+LOOP_TRACK = "event loop"
+CATEGORY_LOOP_BLOCKED = "loop blocked"
+
+
+class StartupTrace:
+    """Collect the spans of a startup timeline."""
+
+    __slots__ = (
+        "_hass",
+        "_start",
+        "_spans",
+        "_tracks",
+        "_loop_check_due",
+        "_loop_check_handle",
+        "finished",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the startup trace."""
+        self._hass = hass
+        self._start = monotonic()
+        self._spans: list[dict[str, Any]] = []
+        self._tracks: dict[str, int] = {}
+        self._loop_check_due = 0.0
+        self._loop_check_handle: asyncio.TimerHandle | None = None
+        self.finished = False
+
+    @callback
+    def async_add_span(
+        self, track: str, name: str, category: str, start: float, end: float
+    ) -> None:
+        """Add a span, timed with time.monotonic, to a track of the timeline."""
+        if (tid := self._tracks.get(track)) is None:
+            tid = self._tracks[track] = len(self._tracks) + 1
+        self._spans.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((start - self._start) * 1_000_000),
+                "dur": round((end - start) * 1_000_000),
+                "pid": 1,
+                "tid": tid,
+            }
+        )
+
+    @callback
+    def async_start_loop_monitor(self) -> None:
+        """Start recording intervals in which the event loop is blocked."""
+        self._schedule_loop_check()
+
+    @callback
+    def _schedule_loop_check(self) -> None:
+        """Schedule the next check of the event loop."""
+        self._loop_check_due = monotonic() + LOOP_CHECK_INTERVAL
+        self._loop_check_handle = self._hass.loop.call_later(
+            LOOP_CHECK_INTERVAL, self._async_check_loop
+        )
+
+    @callback
+    def _async_check_loop(self) -> None:
+        """Record the event loop as blocked if the check runs late."""
+        now = monotonic()
+        if now - self._loop_check_due > LOOP_BLOCKED_THRESHOLD:
+            self.async_add_span(
+                LOOP_TRACK,
+                CATEGORY_LOOP_BLOCKED,
+                CATEGORY_LOOP_BLOCKED,
+                self._loop_check_due,
+                now,
+            )
+        self._schedule_loop_check()
+
+    @callback
+    def async_finish(self) -> None:
+        """Stop recording."""
+        self.finished = True
+        if self._loop_check_handle is not None:
+            self._loop_check_handle.cancel()
+            self._loop_check_handle = None
+
+    @callback
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trace in the Chrome trace event format."""
+        thread_names = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": track},
+            }
+            for track, tid in self._tracks.items()
+        ]
+        return {
+            "traceEvents": [*thread_names, *self._spans],
+            "displayTimeUnit": "ms",
+        }
+
+
+@callback
+def async_enable_startup_trace(hass: HomeAssistant) -> StartupTrace:
+    """Start recording the startup timeline."""
+    trace = hass.data[DATA_STARTUP_TRACE] = StartupTrace(hass)
+    trace.async_start_loop_monitor()
+
+    # Bootstrap finishes the trace once the integrations are set up, but it
+    # can exit before, make sure the event loop is not monitored forever
+    @callback
+    def _async_finish_on_started(_: Event) -> None:
+        """Finish the trace when Home Assistant has started."""
+        hass.async_create_task(async_finish_startup_trace(hass), "finish startup trace")
+
+    @callback
+    def _async_finish_on_stop(_: Event) -> None:
+        """Stop recording when Home Assistant stops."""
+        trace.async_finish()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_finish_on_started)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_finish_on_stop)
+    return trace
+
+
+@callback
+def async_get_startup_trace(hass: HomeAssistant) -> StartupTrace | None:
+    """Return the startup trace if it is enabled."""
+    trace: StartupTrace | None = hass.data.get(DATA_STARTUP_TRACE)
+    return trace
+
+
+@contextlib.contextmanager
+def trace_startup_phase(
+    hass: HomeAssistant, domain: str, phase: str, category: str = "setup"
+) -> Generator[None, None, None]:
+    """Record a phase of the setup of an integration while starting up."""
+    trace: StartupTrace | None = hass.data.get(DATA_STARTUP_TRACE)
+    if trace is None or trace.finished:
+        yield
+        return
+    start = monotonic()
+    try:
+        yield
+    finally:
+        trace.async_add_span(domain, phase, category, start, monotonic())
+
+
+async def async_finish_startup_trace(hass: HomeAssistant) -> None:
+    """Stop recording the startup timeline and write it to the config dir."""
+    if (trace := async_get_startup_trace(hass)) is None or trace.finished:
+        return
+    trace.async_finish()
+    path = hass.config.path(STARTUP_TRACE_FILE)
+    try:
+        await hass.async_add_executor_job(save_json, path, trace.as_dict())
+    except HomeAssistantError as err:
+        _LOGGER.error("Unable to write the startup trace to %s: %s", path, err)
+        return
+    _LOGGER.info("Startup trace written to %s", path)
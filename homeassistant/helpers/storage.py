@@ -6,10 +6,14 @@ from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
 import inspect
+import json
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
-from typing import Any, Generic, TypeVar
+from time import monotonic
+from typing import Any, Generic, NamedTuple, TypeVar
+
+import orjson
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import (
@@ -24,7 +28,12 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import (
+    WriteError,
+    write_utf8_file,
+    write_utf8_files_atomic,
+)
+from homeassistant.util.uuid import random_uuid_hex
 
 from . import json as json_helper
 
@@ -35,6 +44,11 @@ STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
+STORAGE_WRITER = "storage_writer"
+
+JOURNAL_SUFFIX = ".journal"
+# Number of journal records after which the journal is compacted
+JOURNAL_MAX_RECORDS = 1000
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
@@ -79,6 +93,351 @@ async def async_migrator(
     return config
 
 
+class StorageWriter:
+    """Write the data of all stores in batches.
+
+    Writes requested while a batch is being written are collected and
+    written together in the next batch with a single executor job. Files
+    that are written atomically share the directory fsync.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the storage writer."""
+        self._hass = hass
+        self._pending: list[tuple[_StoreWrite, asyncio.Future[None]]] = []
+        self._writing = False
+        self.batches = 0
+        self.writes = 0
+        self.bytes_written = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the write statistics."""
+        return {
+            "batches": self.batches,
+            "writes": self.writes,
+            "bytes_written": self.bytes_written,
+            "last_latency": self.last_latency,
+            "max_latency": self.max_latency,
+        }
+
+    async def async_write(
+        self,
+        key: str,
+        path: str,
+        data: dict,
+        encoder: type[JSONEncoder] | None,
+        atomic_writes: bool,
+        private: bool,
+    ) -> None:
+        """Write the data of a store with the next batch."""
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        self._pending.append(
+            (_StoreWrite(key, path, data, encoder, atomic_writes, private), future)
+        )
+        if not self._writing:
+            self._writing = True
+            self._hass.async_create_task(self._async_write_pending(), "storage writer")
+        await future
+
+    async def _async_write_pending(self) -> None:
+        """Write batches until no writes are pending."""
+        try:
+            while pending := self._pending:
+                self._pending = []
+                start = monotonic()
+                try:
+                    errors, bytes_written = await self._hass.async_add_executor_job(
+                        _write_batch, [write for write, _ in pending]
+                    )
+                except asyncio.CancelledError:
+                    for _, future in pending:
+                        future.cancel()
+                    raise
+                except Exception as err:  # pylint: disable=broad-except
+                    for _, future in pending:
+                        if not future.done():
+                            future.set_exception(err)
+                    continue
+                latency = monotonic() - start
+                self.batches += 1
+                self.writes += len(pending)
+                self.bytes_written += bytes_written
+                self.last_latency = latency
+                self.max_latency = max(self.max_latency, latency)
+                for write, future in pending:
+                    if future.done():
+                        continue
+                    if (error := errors.get(write.path)) is not None:
+                        future.set_exception(error)
+                    else:
+                        future.set_result(None)
+        finally:
+            self._writing = False
+
+
+class _StoreWrite(NamedTuple):
+    """The data of a store to write with a batch."""
+
+    key: str
+    path: str
+    data: dict
+    encoder: type[JSONEncoder] | None
+    atomic_writes: bool
+    private: bool
+
+
+def _write_batch(batch: list[_StoreWrite]) -> tuple[dict[str, Exception], int]:
+    """Write a batch of store data.
+
+    Returns the errors by path and the number of bytes written.
+    """
+    errors: dict[str, Exception] = {}
+    atomic_files: list[tuple[str, str, bool]] = []
+    written: list[str] = []
+    for write in batch:
+        path = write.path
+        _LOGGER.debug("Writing data for %s to %s", write.key, path)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            json_data = json_helper.prepare_save_json(
+                path, write.data, encoder=write.encoder
+            )
+        except (OSError, json_util.SerializationError) as err:
+            errors[path] = err
+            continue
+        if write.atomic_writes:
+            atomic_files.append((path, json_data, write.private))
+            continue
+        try:
+            write_utf8_file(path, json_data, write.private)
+        except WriteError as err:
+            errors[path] = err
+            continue
+        written.append(path)
+
+    if atomic_files:
+        atomic_errors = write_utf8_files_atomic(atomic_files)
+        errors.update(atomic_errors)
+        written.extend(path for path, *_ in atomic_files if path not in atomic_errors)
+    bytes_written = 0
+    for path in written:
+        with suppress(OSError):
+            bytes_written += os.path.getsize(path)
+    return errors, bytes_written
+
+
+@callback
+def async_get_storage_writer(hass: HomeAssistant) -> StorageWriter:
+    """Return the storage writer."""
+    if (writer := hass.data.get(STORAGE_WRITER)) is None:
+        writer = hass.data[STORAGE_WRITER] = StorageWriter(hass)
+    return writer
+
+
+class StoreJournal:
+    """Append-only journal of the changes to the data of a store.
+
+    The data of the store is kept in a snapshot file. Changes are appended
+    to a journal file next to it as one JSON record per line. Lists of
+    dictionaries with an "id" are journaled per item, other values of the
+    data are journaled as a whole. The snapshot and the journal share a
+    journal id so a journal left behind by an interrupted compaction is
+    never replayed on top of a newer snapshot.
+
+    All methods are called from the executor while the store holds its
+    write lock.
+    """
+
+    def __init__(self, store: Store) -> None:
+        """Initialize the journal."""
+        self._store = store
+        self._header: tuple[Any, ...] | None = None
+        self._values: dict[str, Any] = {}
+        self._items: dict[str, dict[str, Any]] = {}
+        self._journal_id: str | None = None
+        self._journal_exists = False
+        self.records = 0
+
+    def _dumps(self, value: Any) -> bytes:
+        """Serialize a value for the journal."""
+        # pylint: disable-next=protected-access
+        if (encoder := self._store._encoder) and encoder is not JSONEncoder:
+            return json.dumps(value, cls=encoder, separators=(",", ":")).encode()
+        return orjson.dumps(
+            value,
+            option=orjson.OPT_NON_STR_KEYS,
+            default=json_helper.json_encoder_default,
+        )
+
+    def _set_written(self, stored: dict[str, Any]) -> None:
+        """Remember the data that was written to compare the next changes."""
+        self._values = {}
+        self._items = {}
+        for key, value in stored.items():
+            if _is_item_list(value):
+                self._items[key] = {item["id"]: item for item in value}
+            else:
+                self._values[key] = value
+
+    def load(self, path: str) -> dict[str, Any]:
+        """Load the snapshot and replay the journal on top of it."""
+        data = json_util.load_json(path)
+        self._header = None
+        self._journal_exists = False
+        self.records = 0
+        if (
+            not isinstance(data, dict)
+            or (journal_id := data.pop("journal_id", None)) is None
+        ):
+            return data
+
+        records: list[dict[str, Any]] = []
+        incomplete = False
+        with suppress(FileNotFoundError), open(
+            f"{path}{JOURNAL_SUFFIX}", encoding="utf-8"
+        ) as journal:
+            for line in journal:
+                try:
+                    record = json_util.json_loads(line)
+                except ValueError:
+                    # The last record was not completely written
+                    _LOGGER.warning(
+                        "Ignoring incomplete record in the journal of %s",
+                        self._store.key,
+                    )
+                    incomplete = True
+                    break
+                if not records and record.get("journal_id") != journal_id:
+                    # Left behind by an interrupted compaction
+                    break
+                records.append(record)
+
+        stored = data["data"]
+        if records and isinstance(stored, dict):
+            items = {
+                key: {item["id"]: item for item in value}
+                for key, value in stored.items()
+                if _is_item_list(value)
+            }
+            for record in records[1:]:
+                key = record["key"]
+                if "id" not in record:
+                    items.pop(key, None)
+                    stored[key] = record["value"]
+                elif "item" in record:
+                    items.setdefault(key, {})[record["id"]] = record["item"]
+                else:
+                    items.get(key, {}).pop(record["id"], None)
+            for key, key_items in items.items():
+                stored[key] = list(key_items.values())
+            self._journal_exists = True
+            self.records = len(records) - 1
+
+        # Records appended after an incomplete record would never be
+        # replayed, the next write replaces the journal with a snapshot
+        if isinstance(stored, dict) and not incomplete:
+            self._set_written(stored)
+            self._header = (data["version"], data.get("minor_version", 1))
+            self._journal_id = journal_id
+        return data
+
+    def append(self, path: str, data: dict[str, Any]) -> bool:
+        """Append the changes of the data to the journal.
+
+        Items are compared with the last written items and only the changed
+        items are serialized. Returns False if the data has to be written
+        as a new snapshot.
+        """
+        if (
+            self._header is None
+            or self._header != (data["version"], data["minor_version"])
+            or self.records >= JOURNAL_MAX_RECORDS
+            or not isinstance(stored := data["data"], dict)
+            or (self._values.keys() | self._items.keys()) - stored.keys()
+        ):
+            return False
+
+        records: list[bytes] = []
+        try:
+            for key, value in stored.items():
+                if (old_items := self._items.get(key)) is None:
+                    if _is_item_list(value):
+                        return False
+                    if key not in self._values or self._values[key] != value:
+                        records.append(self._dumps({"key": key, "value": value}))
+                    continue
+                if not _is_item_list(value):
+                    return False
+                items = {item["id"]: item for item in value}
+                records.extend(
+                    self._dumps({"key": key, "id": item_id, "item": item})
+                    for item_id, item in items.items()
+                    if old_items.get(item_id) != item
+                )
+                records.extend(
+                    self._dumps({"key": key, "id": item_id})
+                    for item_id in old_items.keys() - items.keys()
+                )
+        except (TypeError, ValueError):
+            return False
+
+        if not records:
+            return True
+        self.records += len(records)
+        if not self._journal_exists:
+            records.insert(0, self._dumps({"journal_id": self._journal_id}))
+
+        journal_path = f"{path}{JOURNAL_SUFFIX}"
+        flags = os.O_WRONLY | os.O_CREAT
+        flags |= os.O_APPEND if self._journal_exists else os.O_TRUNC
+        # pylint: disable-next=protected-access
+        mode = 0o600 if self._store._private else 0o644
+        try:
+            fd = os.open(journal_path, flags, mode)
+            with open(fd, "ab") as journal:
+                journal.write(b"".join(record + b"\n" for record in records))
+                journal.flush()
+                os.fsync(journal.fileno())
+        except OSError as err:
+            _LOGGER.warning(
+                "Unable to append to the journal of %s: %s", self._store.key, err
+            )
+            # The journal may end with an incomplete record
+            self._header = None
+            return False
+
+        self._journal_exists = True
+        self._set_written(stored)
+        return True
+
+    def compacted(self, path: str, data: dict[str, Any]) -> None:
+        """Start a new journal after the data was written as a snapshot."""
+        self._header = None
+        with suppress(FileNotFoundError):
+            os.unlink(f"{path}{JOURNAL_SUFFIX}")
+        self._journal_exists = False
+        self.records = 0
+        if not isinstance(data["data"], dict):
+            return
+        self._set_written(data["data"])
+        self._header = (data["version"], data["minor_version"])
+        self._journal_id = data["journal_id"]
+
+    def invalidate(self) -> None:
+        """Write the data as a new snapshot with the next write."""
+        self._header = None
+
+
+def _is_item_list(value: Any) -> bool:
+    """Return if a value is a list of items that are journaled separately."""
+    return isinstance(value, list) and all(
+        isinstance(item, dict) and isinstance(item.get("id"), str) for item in value
+    )
+
+
 @bind_hass
 class Store(Generic[_T]):
     """Class to help storing data."""
@@ -94,8 +453,13 @@ class Store(Generic[_T]):
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If journal is set, changes are appended to a journal and the data
+        is only rewritten completely when the journal is compacted.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -109,6 +473,7 @@ class Store(Generic[_T]):
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._journal = StoreJournal(self) if journal else None
 
     @property
     def path(self):
@@ -159,7 +524,10 @@ class Store(Generic[_T]):
         else:
             try:
                 data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
+                    json_util.load_json
+                    if self._journal is None
+                    else self._journal.load,
+                    self.path,
                 )
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
@@ -354,20 +722,39 @@ class Store(Generic[_T]):
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
-
-    def _write_data(self, path: str, data: dict) -> None:
-        """Write the data."""
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-
-        _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
-            path,
-            data,
-            self._private,
-            encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
-        )
+        """Write the data with the next batch of the storage writer."""
+        writer = async_get_storage_writer(self.hass)
+        if (journal := self._journal) is None:
+            await writer.async_write(
+                self.key,
+                path,
+                data,
+                self._encoder,
+                self._atomic_writes,
+                self._private,
+            )
+            return
+
+        # The journal is compacted when Home Assistant shuts down
+        if self.hass.state is not CoreState.final_write and (
+            await self.hass.async_add_executor_job(journal.append, path, data)
+        ):
+            return
+
+        data = {**data, "journal_id": random_uuid_hex()}
+        try:
+            await writer.async_write(
+                self.key,
+                path,
+                data,
+                self._encoder,
+                self._atomic_writes,
+                self._private,
+            )
+        except BaseException:
+            journal.invalidate()
+            raise
+        await self.hass.async_add_executor_job(journal.compacted, path, data)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -380,3 +767,9 @@ class Store(Generic[_T]):
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal is not None:
+            self._journal.invalidate()
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}{JOURNAL_SUFFIX}"
+                )
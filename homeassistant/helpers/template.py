@@ -13,6 +13,7 @@ from functools import cache, lru_cache, partial, wraps
 import json
 import logging
 import math
+import operator
 from operator import contains
 import pathlib
 import random
@@ -36,10 +37,10 @@ import weakref
 
 from awesomeversion import AwesomeVersion
 import jinja2
-from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2 import nodes, pass_context, pass_environment, pass_eval_context
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
-from jinja2.utils import Namespace
+from jinja2.utils import Namespace, _PassArg
 from lru import LRU  # pylint: disable=no-name-in-module
 import orjson
 import voluptuous as vol
@@ -151,6 +152,20 @@ CACHED_TEMPLATE_LRU: MutableMapping[State, TemplateState] = LRU(CACHED_TEMPLATE_
 CACHED_TEMPLATE_NO_COLLECT_LRU: MutableMapping[State, TemplateState] = LRU(
     CACHED_TEMPLATE_STATES
 )
+
+#
+# Compiled template code does not depend on the hass instance, only on
+# the flavour of the environment (no hass, limited, strict). Identical
+# template sources share their compiled code across all environments of
+# the same flavour, and recently compiled templates are kept after the
+# last Template using them is gone so recreating them does not compile
+# them again. Hits and misses are available from the LRU's get_stats.
+#
+CACHED_COMPILED_TEMPLATES = 1024
+CACHED_COMPILED_TEMPLATES_LRU: MutableMapping[
+    tuple[str, bool, bool, bool], CodeType
+] = LRU(CACHED_COMPILED_TEMPLATES)
+
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
 ORJSON_PASSTHROUGH_OPTIONS = (
@@ -455,6 +470,7 @@ class Template:
         "is_static",
         "_compiled_code",
         "_compiled",
+        "_fast_render",
         "_exc_info",
         "_limited",
         "_strict",
@@ -471,6 +487,7 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
         self._compiled: jinja2.Template | None = None
+        self._fast_render: _FastRenderType | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: sys._OptExcInfo | None = None
@@ -565,7 +582,7 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            render_result = self._render(compiled, kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -723,10 +740,13 @@ class Template:
         value: Any,
         error_value: Any = _SENTINEL,
         variables: dict[str, Any] | None = None,
+        parse_json: bool = True,
     ) -> Any:
         """Render template with value exposed.
 
-        If valid JSON will expose value_json too.
+        If valid JSON will expose value_json too. Callers which already
+        decoded the value can pass value_json in the variables and disable
+        parse_json.
 
         This method must be run in the event loop.
         """
@@ -740,11 +760,12 @@ class Template:
         variables = dict(variables or {})
         variables["value"] = value
 
-        with suppress(*JSON_DECODE_EXCEPTIONS):
-            variables["value_json"] = json_loads(value)
+        if parse_json:
+            with suppress(*JSON_DECODE_EXCEPTIONS):
+                variables["value_json"] = json_loads(value)
 
         try:
-            return _render_with_context(self.template, compiled, **variables).strip()
+            return self._render(compiled, variables).strip()
         except jinja2.TemplateError as ex:
             if error_value is _SENTINEL:
                 _LOGGER.error(
@@ -785,9 +806,22 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        if (fast_expr := _fast_render_expr(self.template)) is not None:
+            with suppress(_FastRenderMiss):
+                self._fast_render = _build_fast_render(env, fast_expr)
 
         return self._compiled
 
+    def _render(self, compiled: jinja2.Template, variables: dict[str, Any]) -> str:
+        """Render the template, bypassing jinja for simple expressions."""
+        if (fast_render := self._fast_render) is not None:
+            with set_template(self.template, "rendering"):
+                try:
+                    return str(fast_render(variables))
+                except _FastRenderMiss:
+                    pass
+        return _render_with_context(self.template, compiled, **variables)
+
     def __eq__(self, other):
         """Compare template with another."""
         return (
@@ -2198,6 +2232,156 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+class _FastRenderMiss(Exception):
+    """The fast render path cannot render the template for these variables."""
+
+
+_FastRenderType = Callable[[dict[str, Any]], Any]
+
+# Globals and filters which are known to not depend on the jinja context
+# and can be called directly by the fast render path
+_FAST_RENDER_GLOBALS = {"is_state", "state_attr", "states"}
+_FAST_RENDER_FILTERS = {"float", "int", "round"}
+_FAST_RENDER_OPERATORS: dict[type[nodes.Expr], Callable[..., Any]] = {
+    nodes.Add: operator.add,
+    nodes.Sub: operator.sub,
+    nodes.Mul: operator.mul,
+    nodes.Div: operator.truediv,
+    nodes.FloorDiv: operator.floordiv,
+    nodes.Mod: operator.mod,
+    nodes.Pow: operator.pow,
+    nodes.Neg: operator.neg,
+    nodes.Pos: operator.pos,
+}
+
+
+def _is_fast_render_node(node: nodes.Node) -> bool:
+    """Return if an expression only uses nodes the fast render path supports."""
+    if isinstance(node, (nodes.Const, nodes.Name)):
+        return True
+    if isinstance(node, nodes.Getattr):
+        return _is_fast_render_node(node.node)
+    if isinstance(node, nodes.Getitem):
+        return isinstance(node.arg, nodes.Const) and _is_fast_render_node(node.node)
+    if type(node) in _FAST_RENDER_OPERATORS:
+        if isinstance(node, nodes.BinExpr):
+            return _is_fast_render_node(node.left) and _is_fast_render_node(node.right)
+        return _is_fast_render_node(node.node)  # type: ignore[attr-defined]
+    if isinstance(node, (nodes.Call, nodes.Filter)):
+        if (
+            node.kwargs
+            or node.dyn_args
+            or node.dyn_kwargs
+            or not all(isinstance(arg, nodes.Const) for arg in node.args)
+        ):
+            return False
+        if isinstance(node, nodes.Filter):
+            return (
+                node.name in _FAST_RENDER_FILTERS
+                and node.node is not None
+                and _is_fast_render_node(node.node)
+            )
+        return (
+            isinstance(node.node, nodes.Name) and node.node.name in _FAST_RENDER_GLOBALS
+        )
+    return False
+
+
+@lru_cache(maxsize=CACHED_COMPILED_TEMPLATES)
+def _fast_render_expr(template_str: str) -> nodes.Expr | None:
+    """Return the expression of a template that is a single simple expression.
+
+    Templates like {{ states('sensor.x') }} or {{ value_json.temperature }}
+    do not need a full jinja render and are evaluated directly instead.
+    """
+    try:
+        ast = _NO_HASS_ENV.parse(template_str)
+    except jinja2.TemplateError:
+        return None
+    if (
+        len(ast.body) != 1
+        or not isinstance(output := ast.body[0], nodes.Output)
+        or len(output.nodes) != 1
+        or isinstance(expr := output.nodes[0], nodes.TemplateData)
+        or not _is_fast_render_node(expr)
+    ):
+        return None
+    return expr
+
+
+def _build_fast_render(env: TemplateEnvironment, node: nodes.Expr) -> _FastRenderType:
+    """Build a callable that evaluates an expression the same way jinja does."""
+    if isinstance(node, nodes.Const):
+        const = node.value
+        return lambda variables: const
+
+    if isinstance(node, nodes.Name):
+        name = node.name
+        env_globals = env.globals
+        undefined = env.undefined
+
+        def _resolve(variables: dict[str, Any]) -> Any:
+            if name in variables:
+                return variables[name]
+            if name in env_globals:
+                return env_globals[name]
+            return undefined(name=name)
+
+        return _resolve
+
+    if isinstance(node, nodes.Getattr):
+        getattr_obj = _build_fast_render(env, node.node)
+        attr = node.attr
+        env_getattr = env.getattr
+        return lambda variables: env_getattr(getattr_obj(variables), attr)
+
+    if isinstance(node, nodes.Getitem):
+        getitem_obj = _build_fast_render(env, node.node)
+        key = cast(nodes.Const, node.arg).value
+        env_getitem = env.getitem
+        return lambda variables: env_getitem(getitem_obj(variables), key)
+
+    if isinstance(node, nodes.BinExpr):
+        binop = _FAST_RENDER_OPERATORS[type(node)]
+        left = _build_fast_render(env, node.left)
+        right = _build_fast_render(env, node.right)
+        return lambda variables: binop(left(variables), right(variables))
+
+    if isinstance(node, nodes.UnaryExpr):
+        unaryop = _FAST_RENDER_OPERATORS[type(node)]
+        operand = _build_fast_render(env, node.node)
+        return lambda variables: unaryop(operand(variables))
+
+    args = tuple(cast(nodes.Const, arg).value for arg in cast(nodes.Call, node).args)
+
+    if isinstance(node, nodes.Filter):
+        assert node.node is not None
+        filter_obj = _build_fast_render(env, node.node)
+        if (filter_func := env.filters.get(node.name)) is None or isinstance(
+            getattr(filter_func, "jinja_pass_arg", None), _PassArg
+        ):
+            raise _FastRenderMiss
+        return lambda variables: filter_func(filter_obj(variables), *args)
+
+    func_name = cast(nodes.Name, cast(nodes.Call, node).node).name
+    if (func := env.globals.get(func_name)) is None:
+        raise _FastRenderMiss
+    func_args: tuple[Any, ...] = args
+    if (pass_arg := getattr(func, "jinja_pass_arg", None)) is _PassArg.context:
+        # The hass functions ignore the jinja context they are passed
+        func_args = (None, *args)
+    elif isinstance(pass_arg, _PassArg):
+        raise _FastRenderMiss
+
+    def _call(variables: dict[str, Any]) -> Any:
+        if func_name in variables:
+            # The function is shadowed by a variable
+            raise _FastRenderMiss
+        return func(*func_args)
+
+    return _call
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2317,6 +2501,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self._compiled_flavour = (hass is None, bool(limited), bool(strict))
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | str | None
         ] = weakref.WeakValueDictionary()
@@ -2603,9 +2788,17 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        if (cached := self.template_cache.get(source)) is None:
+        if (cached := self.template_cache.get(source)) is not None:
+            return cached
+
+        if not isinstance(source, str):
             cached = self.template_cache[source] = super().compile(source)
+            return cached
 
+        key = (source, *self._compiled_flavour)
+        if (cached := CACHED_COMPILED_TEMPLATES_LRU.get(key)) is None:
+            cached = CACHED_COMPILED_TEMPLATES_LRU[key] = super().compile(source)
+        self.template_cache[source] = cached
         return cached
 
 
@@ -3,13 +3,15 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Hashable
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 from random import randint
 from time import monotonic
 from typing import Any, Generic, Protocol, TypeVar
 import urllib.error
+from weakref import WeakSet
 
 import aiohttp
 import requests
@@ -26,10 +28,32 @@ from homeassistant.util.dt import utcnow
 
 from . import entity, event
 from .debounce import Debouncer
+from .singleton import singleton
+from .startup_trace import trace_startup_phase
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+DATA_REFRESH_SCHEDULER = "update_coordinator_refresh_scheduler"
+DATA_FETCH_CACHE = "update_coordinator_fetch_cache"
+
+# Scheduled refreshes are moved to an earlier second when this many refreshes
+# are already scheduled in their second
+REFRESH_SLOT_CAPACITY = 4
+# Scheduled refreshes are moved by at most this fraction of their update interval
+REFRESH_MAX_SPREAD = 0.5
+# Consecutive failed refreshes after which the update interval is doubled for
+# every further failure, up to the maximum backoff factor
+REFRESH_BACKOFF_AFTER_FAILURES = 2
+REFRESH_MAX_BACKOFF_FACTOR = 8
+# The update intervals are stretched by this factor while the event loop lags
+# or more refreshes than this are in flight
+REFRESH_SATURATED_STRETCH_FACTOR = 2
+REFRESH_SATURATED_LOOP_LAG = 0.1
+REFRESH_SATURATED_IN_FLIGHT = 32
+# Weight of a new event loop lag sample in the smoothed event loop lag
+REFRESH_LOOP_LAG_SMOOTHING = 0.2
+
 _DataT = TypeVar("_DataT")
 _BaseDataUpdateCoordinatorT = TypeVar(
     "_BaseDataUpdateCoordinatorT", bound="BaseDataUpdateCoordinatorProtocol"
@@ -39,10 +63,235 @@ _DataUpdateCoordinatorT = TypeVar(
 )
 
 
+_FETCH_CANCELLED = object()
+
+
 class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+@dataclass(slots=True)
+class RefreshMetrics:
+    """Metrics of the refreshes of a coordinator."""
+
+    refreshes: int = 0
+    failed_refreshes: int = 0
+    consecutive_failures: int = 0
+    skipped_refreshes: int = 0
+    last_latency: float | None = None
+    total_latency: float = 0.0
+    upstream_fetches: int = 0
+    shared_fetches: int = 0
+    cache_hits: int = 0
+
+    @property
+    def average_latency(self) -> float | None:
+        """Return the average duration of a refresh."""
+        if not self.refreshes:
+            return None
+        return self.total_latency / self.refreshes
+
+    @property
+    def cache_hit_rate(self) -> float | None:
+        """Return the fraction of fetches which did not call the upstream."""
+        reused = self.shared_fetches + self.cache_hits
+        if not (fetches := self.upstream_fetches + reused):
+            return None
+        return reused / fetches
+
+    @callback
+    def async_record_refresh(self, latency: float, success: bool) -> None:
+        """Record a finished refresh."""
+        self.refreshes += 1
+        self.last_latency = latency
+        self.total_latency += latency
+        if success:
+            self.consecutive_failures = 0
+        else:
+            self.failed_refreshes += 1
+            self.consecutive_failures += 1
+
+
+class RefreshScheduler:
+    """Schedule the refreshes of all coordinators of a Home Assistant instance.
+
+    Refreshes are spread so that only a few coordinators refresh in the same
+    second, intervals are backed off while a coordinator keeps failing, and
+    stretched while the event loop lags or too many refreshes are in flight.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the refresh scheduler."""
+        self.hass = hass
+        self.coordinators: WeakSet[DataUpdateCoordinator[Any]] = WeakSet()
+        self.loop_lag = 0.0
+        self.in_flight = 0
+        self._slots: dict[int, int] = {}
+        self._probing_loop = False
+
+    @property
+    def saturated(self) -> bool:
+        """Return if the event loop lags or too many refreshes are in flight."""
+        return (
+            self.loop_lag > REFRESH_SATURATED_LOOP_LAG
+            or self.in_flight > REFRESH_SATURATED_IN_FLIGHT
+        )
+
+    @callback
+    def async_schedule(
+        self, coordinator: DataUpdateCoordinator[Any], last_refresh: float
+    ) -> float:
+        """Return when to refresh a coordinator and reserve its slot.
+
+        The update interval is applied to the time of the last refresh.
+        """
+        assert coordinator.update_interval is not None
+        interval = coordinator.update_interval.total_seconds()
+        metrics = coordinator.refresh_metrics
+        factor = 1
+        if (failures := metrics.consecutive_failures) > REFRESH_BACKOFF_AFTER_FAILURES:
+            factor = min(
+                2 ** (failures - REFRESH_BACKOFF_AFTER_FAILURES),
+                REFRESH_MAX_BACKOFF_FACTOR,
+            )
+        if self.saturated:
+            factor = max(factor, REFRESH_SATURATED_STRETCH_FACTOR)
+
+        due = last_refresh + interval * factor
+        now = self.hass.loop.time()
+        due_slot = slot = int(due)
+        max_spread = int(interval * factor * REFRESH_MAX_SPREAD)
+        for earlier_slot in range(due_slot, due_slot - max_spread - 1, -1):
+            if due - (due_slot - earlier_slot) <= now:
+                break
+            if self._slots.get(earlier_slot, 0) < REFRESH_SLOT_CAPACITY:
+                slot = earlier_slot
+                break
+
+        self._slots[slot] = self._slots.get(slot, 0) + 1
+        coordinator.refresh_slot = slot
+        self.coordinators.add(coordinator)
+        return due - (due_slot - slot)
+
+    @callback
+    def async_release(self, coordinator: DataUpdateCoordinator[Any]) -> None:
+        """Release the slot reserved for the refresh of a coordinator."""
+        if (slot := coordinator.refresh_slot) is None:
+            return
+        coordinator.refresh_slot = None
+        if (count := self._slots[slot] - 1) > 0:
+            self._slots[slot] = count
+        else:
+            del self._slots[slot]
+
+    @callback
+    def async_remove(self, coordinator: DataUpdateCoordinator[Any]) -> None:
+        """Stop tracking a coordinator without scheduled refreshes."""
+        self.async_release(coordinator)
+        self.coordinators.discard(coordinator)
+
+    @callback
+    def async_probe_loop(self) -> None:
+        """Measure how long the event loop takes to run a callback."""
+        if self._probing_loop:
+            return
+        self._probing_loop = True
+        self.hass.loop.call_soon(self._async_record_loop_lag, monotonic())
+
+    @callback
+    def _async_record_loop_lag(self, start: float) -> None:
+        """Record the lag of the event loop."""
+        self._probing_loop = False
+        self.loop_lag += (monotonic() - start - self.loop_lag) * (
+            REFRESH_LOOP_LAG_SMOOTHING
+        )
+
+    @callback
+    def async_metrics(self) -> dict[str, RefreshMetrics]:
+        """Return the refresh metrics of the scheduled coordinators by job name."""
+        return {
+            coordinator.job_name: coordinator.refresh_metrics
+            for coordinator in self.coordinators
+        }
+
+
+@callback
+@singleton(DATA_REFRESH_SCHEDULER)
+def async_get_refresh_scheduler(hass: HomeAssistant) -> RefreshScheduler:
+    """Return the refresh scheduler."""
+    return RefreshScheduler(hass)
+
+
+class FetchCache:
+    """Share the fetches of coordinators which fetch the same data.
+
+    Coordinators fetching with the same key while a fetch is in flight wait for
+    its result instead of calling the upstream again. Results can be cached for
+    a time to live.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the fetch cache."""
+        self.hass = hass
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._results: dict[Hashable, tuple[float, Any]] = {}
+
+    async def async_fetch(
+        self,
+        key: Hashable,
+        ttl: float | None,
+        fetch: Callable[[], Awaitable[_DataT]],
+        metrics: RefreshMetrics,
+    ) -> _DataT:
+        """Return the cached or in flight result for a key or fetch it."""
+        while True:
+            if (result := self._results.get(key)) is not None:
+                if result[0] > monotonic():
+                    metrics.cache_hits += 1
+                    return result[1]  # type: ignore[no-any-return]
+                del self._results[key]
+            if (future := self._in_flight.get(key)) is None:
+                break
+            # Shielded so a cancelled waiter does not cancel the shared fetch
+            data = await asyncio.shield(future)
+            if data is not _FETCH_CANCELLED:
+                metrics.shared_fetches += 1
+                return data  # type: ignore[no-any-return]
+            # The fetch was cancelled, fetch again for the remaining waiters
+
+        metrics.upstream_fetches += 1
+        future = self._in_flight[key] = self.hass.loop.create_future()
+        try:
+            data = await fetch()
+        except Exception as err:
+            future.set_exception(err)
+            # Mark the exception retrieved in case nobody else waits for it
+            future.exception()
+            raise
+        else:
+            future.set_result(data)
+        finally:
+            del self._in_flight[key]
+            if not future.done():
+                # The fetch was cancelled
+                future.set_result(_FETCH_CANCELLED)
+        if ttl:
+            self._results[key] = (monotonic() + ttl, data)
+        return data
+
+    @callback
+    def async_invalidate(self, key: Hashable) -> None:
+        """Drop the cached result for a key."""
+        self._results.pop(key, None)
+
+
+@callback
+@singleton(DATA_FETCH_CACHE)
+def async_get_fetch_cache(hass: HomeAssistant) -> FetchCache:
+    """Return the fetch cache."""
+    return FetchCache(hass)
+
+
 class BaseDataUpdateCoordinatorProtocol(Protocol):
     """Base protocol type for DataUpdateCoordinator."""
 
@@ -59,6 +308,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Setting :attr:`fetch_key` will cause coordinators with the same key to
+    share fetches which are in flight, and setting :attr:`cache_ttl` will
+    cause the fetched data to be reused by refreshes within the time to live.
     """
 
     def __init__(
@@ -71,6 +324,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         update_method: Callable[[], Awaitable[_DataT]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        fetch_key: Hashable | None = None,
+        cache_ttl: timedelta | None = None,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -81,7 +336,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
+        self.fetch_key = fetch_key
+        self.cache_ttl = cache_ttl
         self._next_refresh: float | None = None
+        self.refresh_metrics = RefreshMetrics()
+        self.refresh_slot: int | None = None
+        self._refreshing = False
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -105,6 +365,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         job_name += f" {name}"
         if entry := self.config_entry:
             job_name += f" {entry.title} {entry.domain} {entry.entry_id}"
+        self.job_name = job_name
         self._job = HassJob(self._handle_refresh_interval, job_name)
         self._unsub_refresh: CALLBACK_TYPE | None = None
         self._unsub_shutdown: CALLBACK_TYPE | None = None
@@ -176,6 +437,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         """Cancel any scheduled call, and ignore new runs."""
         self._shutdown_requested = True
         self._async_unsub_refresh()
+        if (key := self._cache_key) is not None:
+            async_get_fetch_cache(self.hass).async_invalidate(key)
+        async_get_refresh_scheduler(self.hass).async_remove(self)
         self._async_unsub_shutdown()
         await self._debounced_refresh.async_shutdown()
 
@@ -185,6 +449,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._async_unsub_refresh()
         self._debounced_refresh.async_cancel()
         self._next_refresh = None
+        async_get_refresh_scheduler(self.hass).async_remove(self)
 
     def async_contexts(self) -> Generator[Any, None, None]:
         """Return all registered contexts."""
@@ -197,6 +462,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._unsub_refresh:
             self._unsub_refresh()
             self._unsub_refresh = None
+            async_get_refresh_scheduler(self.hass).async_release(self)
 
     def _async_unsub_shutdown(self) -> None:
         """Cancel any scheduled call."""
@@ -222,7 +488,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         now = self.hass.loop.time()
         if self._next_refresh is None or self._next_refresh <= now:
             self._next_refresh = int(now) + self._microsecond
-        self._next_refresh += self.update_interval.total_seconds()
+        self._next_refresh = async_get_refresh_scheduler(self.hass).async_schedule(
+            self, self._next_refresh
+        )
         self._unsub_refresh = event.async_call_at(
             self.hass,
             self._job,
@@ -232,6 +500,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
+        scheduler = async_get_refresh_scheduler(self.hass)
+        scheduler.async_release(self)
+        scheduler.async_probe_loop()
+        if self._refreshing:
+            # A requested refresh is still running
+            self.refresh_metrics.skipped_refreshes += 1
+            self._schedule_refresh()
+            return
         await self._async_refresh(log_failures=True, scheduled=True)
 
     async def async_request_refresh(self) -> None:
@@ -247,6 +523,27 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             raise NotImplementedError("Update method not implemented")
         return await self.update_method()
 
+    @property
+    def _cache_key(self) -> Hashable | None:
+        """Return the key of the fetches in the fetch cache."""
+        if self.fetch_key is not None:
+            return self.fetch_key
+        if self.cache_ttl is not None:
+            return self
+        return None
+
+    async def _async_fetch_data(self) -> _DataT:
+        """Fetch the latest data or reuse a shared or cached result."""
+        if (key := self._cache_key) is None:
+            self.refresh_metrics.upstream_fetches += 1
+            return await self._async_update_data()
+        return await async_get_fetch_cache(self.hass).async_fetch(
+            key,
+            self.cache_ttl.total_seconds() if self.cache_ttl else None,
+            self._async_update_data,
+            self.refresh_metrics,
+        )
+
     async def async_config_entry_first_refresh(self) -> None:
         """Refresh data for the first time when a config entry is setup.
 
@@ -254,9 +551,15 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         fails. Additionally logging is handled by config entry setup
         to ensure that multiple retries do not cause log spam.
         """
-        await self._async_refresh(
-            log_failures=False, raise_on_auth_failed=True, raise_on_entry_error=True
-        )
+        domain = self.config_entry.domain if self.config_entry else self.name
+        with trace_startup_phase(
+            self.hass, domain, f"first refresh {self.name}", "first refresh"
+        ):
+            await self._async_refresh(
+                log_failures=False,
+                raise_on_auth_failed=True,
+                raise_on_entry_error=True,
+            )
         if self.last_update_success:
             return
         ex = ConfigEntryNotReady()
@@ -280,17 +583,20 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._debounced_refresh.async_cancel()
 
         if self._shutdown_requested or scheduled and self.hass.is_stopping:
+            if scheduled:
+                self.refresh_metrics.skipped_refreshes += 1
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
-            start = monotonic()
-
+        start = monotonic()
         auth_failed = False
         previous_update_success = self.last_update_success
         previous_data = self.data
+        scheduler = async_get_refresh_scheduler(self.hass)
 
         try:
-            self.data = await self._async_update_data()
+            self._refreshing = True
+            scheduler.in_flight += 1
+            self.data = await self._async_fetch_data()
 
         except (asyncio.TimeoutError, requests.exceptions.Timeout) as err:
             self.last_exception = err
@@ -371,13 +677,16 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
-            if log_timing:
-                self.logger.debug(
-                    "Finished fetching %s data in %.3f seconds (success: %s)",
-                    self.name,
-                    monotonic() - start,
-                    self.last_update_success,
-                )
+            self._refreshing = False
+            scheduler.in_flight -= 1
+            latency = monotonic() - start
+            self.refresh_metrics.async_record_refresh(latency, self.last_update_success)
+            self.logger.debug(
+                "Finished fetching %s data in %.3f seconds (success: %s)",
+                self.name,
+                latency,
+                self.last_update_success,
+            )
             if not auth_failed and self._listeners and not self.hass.is_stopping:
                 self._schedule_refresh()
 
@@ -406,6 +715,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._async_unsub_refresh()
         self._debounced_refresh.async_cancel()
         self._next_refresh = None
+        if (key := self._cache_key) is not None:
+            # The cached result is older than the data
+            async_get_fetch_cache(self.hass).async_invalidate(key)
 
         self.data = data
         self.last_update_success = True
@@ -25,7 +25,9 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
+from .const import __version__ as HA_VERSION
 from .core import HomeAssistant, callback
+from .exceptions import HomeAssistantError
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.dhcp import DHCP
@@ -48,6 +50,8 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
+DATA_PRE_IMPORTS = "pre_imports"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -63,6 +67,10 @@ MAX_LOAD_CONCURRENTLY = 4
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 30
+
 
 class DHCPMatcherRequired(TypedDict, total=True):
     """Matcher for the dhcp integration for required fields."""
@@ -184,6 +192,106 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class ManifestIndex:
+    """Persistent index of integration manifests.
+
+    Reading and parsing the manifest.json of every integration on each
+    start is slow on SD cards and network storage. The index keeps the
+    parsed manifests on disk so they can be loaded with a single read.
+
+    Manifests of built-in integrations only change with the Home Assistant
+    version, so they are trusted without touching the file system unless
+    this is a development version. Other manifests are revalidated with
+    the modification time of the manifest file.
+    """
+
+    __slots__ = ("_store", "_manifests", "_trust_built_in")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest index."""
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            MANIFEST_INDEX_STORAGE_VERSION,
+            MANIFEST_INDEX_STORAGE_KEY,
+            private=True,
+        )
+        self._manifests: dict[str, dict[str, Any]] = {}
+        self._trust_built_in = "dev" not in HA_VERSION
+
+    async def async_load(self) -> None:
+        """Load the index, discarding it if Home Assistant was updated."""
+        try:
+            data = await self._store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to load the manifest index: %s", err)
+            return
+        if data and data.get("ha_version") == HA_VERSION:
+            self._manifests = data["manifests"]
+
+    def get_manifest(self, manifest_path: pathlib.Path) -> Manifest | None:
+        """Return the indexed manifest if it is still up to date.
+
+        This method is run in the executor.
+        """
+        if (entry := self._manifests.get(str(manifest_path))) is None:
+            return None
+        if (mtime := entry["mtime"]) is not None:
+            try:
+                if manifest_path.stat().st_mtime != mtime:
+                    return None
+            except OSError:
+                return None
+        return cast(Manifest, dict(entry["manifest"]))
+
+    def index_entry(
+        self, manifest_path: pathlib.Path, manifest: Manifest, is_built_in: bool
+    ) -> dict[str, Any]:
+        """Create an index entry for a manifest that was read from disk.
+
+        This method is run in the executor.
+        """
+        mtime: float | None = None
+        if not is_built_in or not self._trust_built_in:
+            mtime = manifest_path.stat().st_mtime
+        return {"mtime": mtime, "manifest": manifest}
+
+    @callback
+    def async_update(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Add new manifests to the index and schedule saving it."""
+        if not entries:
+            return
+        self._manifests.update(entries)
+        self._store.async_delay_save(self._data_to_save, MANIFEST_INDEX_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the index to store."""
+        return {"ha_version": HA_VERSION, "manifests": self._manifests}
+
+
+async def async_get_manifest_index(hass: HomeAssistant) -> ManifestIndex | None:
+    """Return the manifest index, loading it on first use."""
+    if hass.config.config_dir is None:
+        return None
+
+    if (index_or_evt := hass.data.get(DATA_MANIFEST_INDEX)) is None:
+        evt = hass.data[DATA_MANIFEST_INDEX] = asyncio.Event()
+        index = ManifestIndex(hass)
+        await index.async_load()
+        hass.data[DATA_MANIFEST_INDEX] = index
+        evt.set()
+        return index
+
+    if isinstance(index_or_evt, asyncio.Event):
+        await index_or_evt.wait()
+        return cast(ManifestIndex, hass.data[DATA_MANIFEST_INDEX])
+
+    return cast(ManifestIndex, index_or_evt)
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -209,12 +317,18 @@ async def _async_get_custom_components(
         get_sub_directories, custom_components.__path__
     )
 
+    manifest_index = await async_get_manifest_index(hass)
+    index_entries: dict[str, dict[str, Any]] = {}
     integrations = await hass.async_add_executor_job(
         _resolve_integrations_from_root,
         hass,
         custom_components,
         [comp.name for comp in dirs],
+        manifest_index,
+        index_entries,
     )
+    if manifest_index is not None:
+        manifest_index.async_update(index_entries)
     return {
         integration.domain: integration
         for integration in integrations.values()
@@ -553,22 +667,41 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        manifest_index: ManifestIndex | None = None,
+        index_entries: dict[str, dict[str, Any]] | None = None,
     ) -> Integration | None:
-        """Resolve an integration from a root module."""
+        """Resolve an integration from a root module.
+
+        If a manifest index is passed, up to date manifests are taken from
+        the index and manifests read from disk are added to index_entries.
+        """
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
+            if manifest_index is not None and (
+                indexed_manifest := manifest_index.get_manifest(manifest_path)
+            ):
+                manifest = indexed_manifest
+            elif not manifest_path.is_file():
                 continue
+            else:
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+                if manifest_index is not None and index_entries is not None:
+                    index_entries[str(manifest_path)] = manifest_index.index_entry(
+                        manifest_path,
+                        dict(manifest),  # type: ignore[arg-type]
+                        root_module.__name__ == PACKAGE_BUILTIN,
+                    )
 
             integration = cls(
                 hass,
@@ -860,13 +993,19 @@ class Integration:
 
 
 def _resolve_integrations_from_root(
-    hass: HomeAssistant, root_module: ModuleType, domains: list[str]
+    hass: HomeAssistant,
+    root_module: ModuleType,
+    domains: list[str],
+    manifest_index: ManifestIndex | None = None,
+    index_entries: dict[str, dict[str, Any]] | None = None,
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
     integrations: dict[str, Integration] = {}
     for domain in domains:
         try:
-            integration = Integration.resolve_from_root(hass, root_module, domain)
+            integration = Integration.resolve_from_root(
+                hass, root_module, domain, manifest_index, index_entries
+            )
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Error loading integration: %s", domain)
         else:
@@ -891,6 +1030,18 @@ def async_get_loaded_integration(hass: HomeAssistant, domain: str) -> Integratio
     raise IntegrationNotLoaded(domain)
 
 
+async def async_wait_for_pre_import(hass: HomeAssistant, domain: str) -> None:
+    """Wait until the modules of an integration imported ahead of setup are imported.
+
+    Importing a module in the event loop while it is imported in the executor
+    blocks the event loop on the import lock of the module.
+    """
+    pre_imports: dict[str, asyncio.Task[None]] | None = hass.data.get(DATA_PRE_IMPORTS)
+    if pre_imports and (task := pre_imports.get(domain)) is not None:
+        # Errors are reported when the integration is imported again
+        await asyncio.wait((task,))
+
+
 async def async_get_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get integration."""
     integrations_or_excs = await async_get_integrations(hass, [domain])
@@ -953,9 +1104,18 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        manifest_index = await async_get_manifest_index(hass)
+        index_entries: dict[str, dict[str, Any]] = {}
         integrations = await hass.async_add_executor_job(
-            _resolve_integrations_from_root, hass, components, list(needed)
+            _resolve_integrations_from_root,
+            hass,
+            components,
+            list(needed),
+            manifest_index,
+            index_entries,
         )
+        if manifest_index is not None:
+            manifest_index.async_update(index_entries)
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
@@ -53,6 +53,7 @@ class RuntimeConfig:
 
     debug: bool = False
     open_ui: bool = False
+    trace_startup: bool = False
 
 
 def can_use_pidfd() -> bool:
@@ -6,19 +6,37 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import json
 import logging
+import os
+import tempfile
+import tracemalloc
 from timeit import default_timer as timer
 from typing import TypeVar
 
-from homeassistant import core
+from homeassistant import config_entries, core
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity_registry as er,
+    storage,
+)
+from homeassistant.helpers.entity import (
+    DeviceInfo,
+    Entity,
+    async_setup as async_setup_entity_sources,
+)
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    TrackTemplate,
     async_track_state_change,
     async_track_state_change_event,
+    async_track_template_result,
 )
-from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.helpers.json import JSON_DUMP, JSONEncoder, save_json
+from homeassistant.helpers.template import Template
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -227,6 +245,104 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_template_trackers(hass):
+    """Run 10k state changes with 10k template trackers.
+
+    Each tracker follows its own entity and a few follow a whole domain
+    so the state writes only reach the matching trackers.
+    """
+    count = 0
+    trackers = 10**4
+    events_to_fire = 10**4
+
+    @core.callback
+    def listener(*args):
+        """Handle template result change."""
+        nonlocal count
+        count += 1
+
+    for idx in range(trackers):
+        hass.states.async_set(f"sensor.benchmark_{idx}", "0")
+        if idx % 1000:
+            template_str = f"{{{{ states('sensor.benchmark_{idx}') }}}}"
+        else:
+            template_str = "{{ states.light | count }}"
+        async_track_template_result(
+            hass, [TrackTemplate(Template(template_str, hass), None)], listener
+        )
+    await hass.async_block_till_done()
+    count = 0
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.states.async_set("sensor.benchmark_1", str(idx + 1))
+        await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def state_machine_memory(hass):
+    """Set 50k sensor states with the same attributes and report memory use."""
+    attributes = {
+        "unit_of_measurement": "°C",
+        "device_class": "temperature",
+        "state_class": "measurement",
+    }
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    start = timer()
+    for idx in range(5 * 10**4):
+        hass.states.async_set(f"sensor.benchmark_{idx}", str(idx), dict(attributes))
+    runtime = timer() - start
+
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(f"State machine uses {used / 2**20:.1f} MiB for 50k states")
+
+    return runtime
+
+
+@benchmark
+async def template_render(hass):
+    """Render simple templates with and without the fast render path."""
+    hass.states.async_set("sensor.benchmark", "21.5", {"unit": "°C"})
+    variables = {"value": "21.5", "value_json": {"temperature": 21.5}}
+    template_strs = (
+        "{{ states('sensor.benchmark') }}",
+        "{{ state_attr('sensor.benchmark', 'unit') }}",
+        "{{ value_json.temperature }}",
+        "{{ value | float * 10 }}",
+    )
+    renders = 10**5
+    fast_runtime = 0.0
+
+    for template_str in template_strs:
+        runtimes = []
+        for fast_render in (True, False):
+            template = Template(template_str, hass)
+            template.async_render(variables)
+            if not fast_render:
+                # pylint: disable-next=protected-access
+                template._fast_render = None
+            start = timer()
+            for _ in range(renders):
+                template.async_render(variables)
+            runtimes.append(timer() - start)
+        fast_runtime += runtimes[0]
+        print(
+            f"{template_str}: {renders / runtimes[0]:.0f} renders/s fast,"
+            f" {renders / runtimes[1]:.0f} renders/s jinja"
+        )
+
+    return fast_runtime
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -314,6 +430,194 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def entity_registry_load(hass):
+    """Load an entity registry of 50k entities and set up one integration."""
+    entities = [
+        {
+            "aliases": [],
+            "area_id": None,
+            "capabilities": None,
+            "config_entry_id": f"entry_{idx % 500}",
+            "device_class": None,
+            "device_id": f"device_{idx // 5}",
+            "disabled_by": None,
+            "entity_category": None,
+            "entity_id": f"sensor.entity_{idx}",
+            "hidden_by": None,
+            "icon": None,
+            "id": f"{idx:032x}",
+            "has_entity_name": True,
+            "name": None,
+            "options": {},
+            "original_device_class": "temperature",
+            "original_icon": None,
+            "original_name": f"Entity {idx}",
+            "platform": f"platform_{idx % 100}",
+            "supported_features": 0,
+            "translation_key": None,
+            "unique_id": f"unique_{idx}",
+            "unit_of_measurement": "°C",
+        }
+        for idx in range(50000)
+    ]
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        os.mkdir(hass.config.path(storage.STORAGE_DIR))
+        save_json(
+            hass.config.path(storage.STORAGE_DIR, er.STORAGE_KEY),
+            {
+                "version": er.STORAGE_VERSION_MAJOR,
+                "minor_version": er.STORAGE_VERSION_MINOR,
+                "key": er.STORAGE_KEY,
+                "data": {"entities": entities, "deleted_entities": []},
+            },
+        )
+
+        start = timer()
+        await er.async_load(hass)
+        registry = er.async_get(hass)
+        for idx in range(0, 50000, 100):
+            registry.async_get_entity_id("sensor", "platform_0", f"unique_{idx}")
+        return timer() - start
+
+
+@benchmark
+async def add_entities(hass):
+    """Add 10k entities of 2k devices to a config entry platform."""
+
+    class BenchmarkEntity(Entity):
+        """Entity to add."""
+
+        _attr_has_entity_name = True
+        _attr_should_poll = False
+
+        def __init__(self, idx: int) -> None:
+            """Initialize the entity."""
+            self._attr_unique_id = f"unique_{idx}"
+            self._attr_name = f"Sensor {idx % 5}"
+            self._attr_device_info = DeviceInfo(
+                identifiers={("benchmark", f"device_{idx // 5}")},
+                name=f"Device {idx // 5}",
+            )
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        async_setup_entity_sources(hass)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        config_entry = config_entries.ConfigEntry(
+            1, "benchmark", "Benchmark", {}, config_entries.SOURCE_USER
+        )
+        # pylint: disable-next=protected-access
+        hass.config_entries._entries[config_entry.entry_id] = config_entry
+        platform = EntityPlatform(
+            hass=hass,
+            logger=logging.getLogger(__name__),
+            domain="sensor",
+            platform_name="benchmark",
+            platform=None,
+            scan_interval=timedelta(seconds=30),
+            entity_namespace=None,
+        )
+        platform.config_entry = config_entry
+        entities = [BenchmarkEntity(idx) for idx in range(10000)]
+
+        start = timer()
+        await platform.async_add_entities(entities)
+        runtime = timer() - start
+        await hass.async_stop()
+        return runtime
+
+
+@benchmark
+async def entity_write_state(hass):
+    """Write the state of sensor, light and climate entities 100k times each."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.climate import ClimateEntity, HVACMode
+    from homeassistant.components.light import ColorMode, LightEntity
+    from homeassistant.components.sensor import (
+        SensorDeviceClass,
+        SensorEntity,
+        SensorStateClass,
+    )
+
+    class BenchmarkSensor(SensorEntity):
+        """Sensor to write."""
+
+        _attr_device_class = SensorDeviceClass.TEMPERATURE
+        _attr_native_unit_of_measurement = "°C"
+        _attr_state_class = SensorStateClass.MEASUREMENT
+        _attr_name = "Benchmark sensor"
+
+        def bump(self, idx: int) -> None:
+            """Change the state."""
+            self._attr_native_value = 20 + idx % 10
+
+    class BenchmarkLight(LightEntity):
+        """Light to write."""
+
+        _attr_color_mode = ColorMode.BRIGHTNESS
+        _attr_supported_color_modes = {ColorMode.BRIGHTNESS}
+        _attr_name = "Benchmark light"
+        _attr_is_on = True
+
+        def bump(self, idx: int) -> None:
+            """Change the state."""
+            self._attr_brightness = idx % 255
+
+    class BenchmarkClimate(ClimateEntity):
+        """Climate entity to write."""
+
+        _attr_hvac_mode = HVACMode.HEAT
+        _attr_hvac_modes = [HVACMode.HEAT, HVACMode.OFF]
+        _attr_name = "Benchmark climate"
+        _attr_target_temperature = 21
+        _attr_temperature_unit = "°C"
+
+        def bump(self, idx: int) -> None:
+            """Change the state."""
+            self._attr_current_temperature = 20 + idx % 10
+
+    count = 10**5
+    runtime = 0.0
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        async_setup_entity_sources(hass)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        for entity_class, domain in (
+            (BenchmarkSensor, "sensor"),
+            (BenchmarkLight, "light"),
+            (BenchmarkClimate, "climate"),
+        ):
+            platform = EntityPlatform(
+                hass=hass,
+                logger=logging.getLogger(__name__),
+                domain=domain,
+                platform_name="benchmark",
+                platform=None,
+                scan_interval=timedelta(seconds=30),
+                entity_namespace=None,
+            )
+            entity = entity_class()
+            entity.entity_id = f"{domain}.benchmark"
+            await platform.async_add_entities([entity])
+
+            start = timer()
+            for idx in range(count):
+                entity.bump(idx)
+                entity.async_write_ha_state()
+            elapsed = timer() - start
+            runtime += elapsed
+            print(f"{domain}: {count / elapsed:.0f} writes per second")
+        await hass.async_stop()
+
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -357,3 +661,87 @@ def _create_state_changed_event_from_old_new(
     from homeassistant.components import logbook
 
     return logbook.LazyEventPartialState(row, {})
+
+
+@benchmark
+async def mqtt_subscription_match(hass):
+    """Match 100k distinct topics against 20k wildcard subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from functools import lru_cache
+
+    from homeassistant.components.mqtt.client import (
+        MATCHING_SUBSCRIPTIONS_CACHE_SIZE,
+        Subscription,
+        SubscriptionTrie,
+    )
+
+    job = core.HassJob(lambda msg: None)
+    trie = SubscriptionTrie()
+    for device in range(10**4):
+        trie.add(Subscription(f"tele/device{device}/+", job))
+        trie.add(Subscription(f"stat/device{device}/#", job))
+    matching_subscriptions = lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)(trie.match)
+    topics = [
+        f"{prefix}/device{idx % 10**4}/sensor{idx // 10**4}"
+        for prefix in ("tele", "stat")
+        for idx in range(5 * 10**4)
+    ]
+
+    start = timer()
+    for topic in topics:
+        matching_subscriptions(topic)
+    # Topics seen recently are matched from the cache
+    for topic in topics[-MATCHING_SUBSCRIPTIONS_CACHE_SIZE:]:
+        matching_subscriptions(topic)
+    runtime = timer() - start
+
+    cache_info = matching_subscriptions.cache_info()
+    print(f"Cache hits: {cache_info.hits}, misses: {cache_info.misses}")
+    return runtime
+
+
+@benchmark
+async def mqtt_zigbee2mqtt_replay(hass):
+    """Render the value templates of 200 zigbee2mqtt devices for 10k messages.
+
+    Every device publishes a JSON payload rendered by the value templates of
+    its 10 entities.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.mqtt.models import MqttValueTemplate
+
+    keys = [
+        "temperature",
+        "humidity",
+        "pressure",
+        "battery",
+        "voltage",
+        "linkquality",
+        "illuminance",
+        "occupancy",
+        "power",
+        "energy",
+    ]
+    devices = [
+        [
+            MqttValueTemplate(Template(f"{{{{ value_json.{key} }}}}"), hass=hass)
+            for key in keys
+        ]
+        for _ in range(200)
+    ]
+    messages = [
+        (
+            devices[idx % len(devices)],
+            json.dumps(
+                {key: round(idx * 0.1 + offset, 1) for offset, key in enumerate(keys)}
+                | {"update": {"state": "idle"}, "last_seen": "2023-09-01T10:00:00Z"}
+            ),
+        )
+        for idx in range(10**4)
+    ]
+
+    start = timer()
+    for templates, payload in messages:
+        for value_template in templates:
+            value_template.async_render_with_possible_json_value(payload)
+    return timer() - start
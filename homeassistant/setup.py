@@ -6,6 +6,7 @@ from collections.abc import Awaitable, Callable, Generator, Iterable
 import contextlib
 from datetime import timedelta
 import logging.handlers
+from time import monotonic
 from timeit import default_timer as timer
 from types import ModuleType
 from typing import Any
@@ -21,6 +22,7 @@ from .const import (
 from .core import CALLBACK_TYPE, DOMAIN as HOMEASSISTANT_DOMAIN
 from .exceptions import DependencyError, HomeAssistantError
 from .helpers.issue_registry import IssueSeverity, async_create_issue
+from .helpers.startup_trace import async_get_startup_trace, trace_startup_phase
 from .helpers.typing import ConfigType
 from .util import dt as dt_util, ensure_unique_string
 
@@ -54,6 +56,10 @@ DATA_SETUP_STARTED = "setup_started"
 # setting up a component.
 DATA_SETUP_TIME = "setup_time"
 
+# DATA_IMPORT_TIME is a dict [str, dict[str, float]], indicating how many
+# seconds were spent importing each module of a component ahead of setup.
+DATA_IMPORT_TIME = "import_time"
+
 DATA_DEPS_REQS = "deps_reqs_processed"
 
 SLOW_SETUP_WARNING = 10
@@ -204,15 +210,19 @@ async def _async_setup_component(
     # Process requirements as soon as possible, so we can import the component
     # without requiring imports to be in functions.
     try:
-        await async_process_deps_reqs(hass, config, integration)
+        with trace_startup_phase(hass, domain, "requirements"):
+            await async_process_deps_reqs(hass, config, integration)
     except HomeAssistantError as err:
         log_error(str(err))
         return False
 
+    await loader.async_wait_for_pre_import(hass, domain)
+
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with trace_startup_phase(hass, domain, "import"):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
@@ -284,8 +294,9 @@ async def _async_setup_component(
                 return False
 
             if task:
-                async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-                    result = await task
+                with trace_startup_phase(hass, domain, "async_setup"):
+                    async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
+                        result = await task
         except asyncio.TimeoutError:
             _LOGGER.error(
                 (
@@ -373,6 +384,8 @@ async def async_prepare_setup_platform(
         log_error(str(err))
         return None
 
+    await loader.async_wait_for_pre_import(hass, integration.domain)
+
     try:
         platform = integration.get_platform(domain)
     except ImportError as exc:
@@ -505,6 +518,7 @@ def async_start_setup(
     """Keep track of when setup starts and finishes."""
     setup_started = hass.data.setdefault(DATA_SETUP_STARTED, {})
     started = dt_util.utcnow()
+    started_monotonic = monotonic()
     unique_components: dict[str, str] = {}
     for domain in components:
         unique = ensure_unique_string(domain, setup_started)
@@ -515,10 +529,22 @@ def async_start_setup(
 
     setup_time: dict[str, timedelta] = hass.data.setdefault(DATA_SETUP_TIME, {})
     time_taken = dt_util.utcnow() - started
+    trace = async_get_startup_trace(hass)
+    if trace is not None and trace.finished:
+        trace = None
+    finished_monotonic = monotonic()
     for unique, domain in unique_components.items():
         del setup_started[unique]
-        integration = domain.rpartition(".")[-1]
+        platform, _, integration = domain.rpartition(".")
         if integration in setup_time:
             setup_time[integration] += time_taken
         else:
             setup_time[integration] = time_taken
+        if trace is not None:
+            trace.async_add_span(
+                integration,
+                f"{platform} platform setup" if platform else "setup",
+                "platform setup" if platform else "setup",
+                started_monotonic,
+                finished_monotonic,
+            )
@@ -1,6 +1,8 @@
 """File utility functions."""
 from __future__ import annotations
 
+from collections.abc import Sequence
+from contextlib import suppress
 import logging
 import os
 import tempfile
@@ -80,3 +82,63 @@ def write_utf8_file(
                     filename,
                     err,
                 )
+
+
+def write_utf8_files_atomic(
+    files: Sequence[tuple[str, str, bool]],
+) -> dict[str, WriteError]:
+    """Write multiple files and rename them into place with shared fsyncs.
+
+    Each file is a tuple of filename, utf8 data and private. Every file
+    is written all or nothing like with write_utf8_file_atomic, but the
+    directories are only synced once after all files are renamed.
+
+    Returns the errors of the files that could not be written.
+    """
+    errors: dict[str, WriteError] = {}
+    written: list[tuple[str, str]] = []
+    for filename, utf8_data, private in files:
+        tmp_filename = ""
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=os.path.dirname(filename),
+                delete=False,
+            ) as fdesc:
+                tmp_filename = fdesc.name
+                if not private:
+                    os.fchmod(fdesc.fileno(), 0o644)
+                fdesc.write(utf8_data)
+                fdesc.flush()
+                os.fsync(fdesc.fileno())
+        except OSError as error:
+            _LOGGER.exception("Saving file failed: %s", filename)
+            errors[filename] = WriteError(error)
+            if tmp_filename:
+                with suppress(OSError):
+                    os.remove(tmp_filename)
+            continue
+        written.append((tmp_filename, filename))
+
+    directories: set[str] = set()
+    for tmp_filename, filename in written:
+        try:
+            os.replace(tmp_filename, filename)
+        except OSError as error:
+            _LOGGER.exception("Saving file failed: %s", filename)
+            errors[filename] = WriteError(error)
+            with suppress(OSError):
+                os.remove(tmp_filename)
+            continue
+        directories.add(os.path.dirname(filename))
+
+    for directory in directories:
+        with suppress(OSError):
+            dir_fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    return errors
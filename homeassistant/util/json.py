@@ -4,6 +4,8 @@ from __future__ import annotations
 from collections.abc import Callable
 import json
 import logging
+import mmap
+import os
 from os import PathLike
 from typing import Any
 
@@ -25,6 +27,10 @@ JsonArrayType = list[JsonValueType]
 JsonObjectType = dict[str, JsonValueType]
 """Dictionary that can be returned by the standard JSON deserializing process."""
 
+# Files of at least this size are memory-mapped and parsed straight from
+# the mapping instead of being read into memory first
+MMAP_MIN_SIZE = 1024 * 1024
+
 JSON_ENCODE_EXCEPTIONS = (TypeError, ValueError)
 JSON_DECODE_EXCEPTIONS = (orjson.JSONDecodeError,)
 
@@ -64,8 +70,13 @@ def load_json(
     Defaults to returning empty dict if file is not found.
     """
     try:
-        with open(filename, encoding="utf-8") as fdesc:
-            return orjson.loads(fdesc.read())  # type: ignore[no-any-return]
+        with open(filename, "rb") as fdesc:
+            if os.fstat(fdesc.fileno()).st_size < MMAP_MIN_SIZE:
+                return orjson.loads(fdesc.read())  # type: ignore[no-any-return]
+            with mmap.mmap(
+                fdesc.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped, memoryview(mapped) as buffer:
+                return orjson.loads(buffer)  # type: ignore[no-any-return]
     except FileNotFoundError:
         # This is not a fatal error
         _LOGGER.debug("JSON file not found: %s", filename)
@@ -230,6 +230,110 @@ async def test_history_during_period_impossible_conditions(
     assert response["result"] == {}
 
 
+async def test_history_during_period_max_points(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples numeric states to max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("5", "1", "9", "3", "7", "unavailable", "4", "6", "2"):
+        hass.states.async_set("sensor.test", state, attributes={"any": "attr"})
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "max_points": 4,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    # The bucket has a non-numeric state, its first non-numeric
+    # state and its last state are kept
+    assert [state["s"] for state in response["result"]["sensor.test"]] == [
+        "5",
+        "unavailable",
+        "6",
+        "2",
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "max_points": 9,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(response["result"]["sensor.test"]) == 9
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "max_points": 3,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
+def test_downsample_compressed_states() -> None:
+    """Test downsampling keeps at most max_points states."""
+    states = [
+        {"s": state, "lu": float(idx)}
+        for idx, state in enumerate(
+            ["on", "off"] * 50 + ["1", "nan", "3", "inf", "2", "5"] * 10
+        )
+    ]
+    downsampled = websocket_api._downsample_compressed_states(states, 10)
+    assert len(downsampled) <= 10
+    assert downsampled[0] is states[0]
+    assert downsampled[-1] is states[-1]
+    # Buckets of numeric states only keep their lowest and highest state
+    numeric = [
+        {"s": state, "lu": float(idx)}
+        for idx, state in enumerate(["5", "1", "nan", "9", "3", "7"])
+    ]
+    assert [
+        state["s"] for state in websocket_api._downsample_compressed_states(numeric, 4)
+    ] == [
+        "5",
+        "nan",
+        "3",
+        "7",
+    ]
+    numeric[2]["s"] = "4"
+    assert [
+        state["s"] for state in websocket_api._downsample_compressed_states(numeric, 4)
+    ] == [
+        "5",
+        "1",
+        "9",
+        "7",
+    ]
+
+
 @pytest.mark.parametrize(
     "time_zone", ["UTC", "Europe/Berlin", "America/Chicago", "US/Hawaii"]
 )
@@ -523,6 +627,76 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_sent_in_chunks(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends long time ranges as multiple messages."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    sensor_one_last_updated = hass.states.get("sensor.one").last_updated
+    await async_recorder_block_till_done(hass)
+    await asyncio.sleep(0.00001)
+    chunk_time = dt_util.utcnow() - now
+    await asyncio.sleep(0.00001)
+    hass.states.async_set("sensor.two", "off", attributes={"any": "attr"})
+    sensor_two_last_updated = hass.states.get("sensor.two").last_updated
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "HISTORY_CHUNK_TIME", chunk_time):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one", "sensor.two"],
+                "start_time": now.isoformat(),
+                "end_time": end_time.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+        assert response["type"] == "result"
+
+        response = await client.receive_json()
+        assert response == {
+            "event": {
+                "end_time": sensor_one_last_updated.timestamp(),
+                "start_time": now.timestamp(),
+                "states": {
+                    "sensor.one": [
+                        {"lu": sensor_one_last_updated.timestamp(), "s": "on"}
+                    ],
+                },
+            },
+            "id": 1,
+            "type": "event",
+        }
+
+        response = await client.receive_json()
+        assert response == {
+            "event": {
+                "end_time": sensor_two_last_updated.timestamp(),
+                "start_time": (now + chunk_time).timestamp(),
+                "states": {
+                    "sensor.two": [
+                        {"lu": sensor_two_last_updated.timestamp(), "s": "off"}
+                    ],
+                },
+            },
+            "id": 1,
+            "type": "event",
+        }
+
+
 async def test_history_stream_significant_domain_historical_only(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1,6 +1,6 @@
 """The test for the History Statistics sensor platform."""
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -1234,28 +1234,30 @@ async def test_measure_from_end_going_backwards(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
     """Test the history statistics sensor with a moving end and a duration to find the start."""
-    start_time = dt_util.utcnow() - timedelta(minutes=60)
+    start_time = dt_util.utcnow().replace(microsecond=0) - timedelta(minutes=60)
     t0 = start_time + timedelta(minutes=20)
     t1 = t0 + timedelta(minutes=10)
     t2 = t1 + timedelta(minutes=10)
+    end_time = start_time + timedelta(minutes=60)
 
     # Start     t0        t1        t2        End
     # |--20min--|--20min--|--10min--|--10min--|
     # |---off---|---on----|---off---|---on----|
 
-    def _fake_states(*args, **kwargs):
-        return {
+    fake_states = MagicMock(
+        return_value={
             "binary_sensor.test_id": [
                 ha.State("binary_sensor.test_id", "on", last_changed=t0),
                 ha.State("binary_sensor.test_id", "off", last_changed=t1),
                 ha.State("binary_sensor.test_id", "on", last_changed=t2),
             ]
         }
+    )
 
     with patch(
         "homeassistant.components.recorder.history.state_changes_during_period",
-        _fake_states,
-    ), freeze_time(start_time):
+        fake_states,
+    ), freeze_time(end_time):
         await async_setup_component(
             hass,
             "sensor",
@@ -1311,18 +1313,98 @@ async def test_measure_from_end_going_backwards(
     assert hass.states.get("sensor.sensor3").state == "2"
     assert hass.states.get("sensor.sensor4").state == "83.3"
 
-    past_next_update = start_time + timedelta(minutes=30)
+    assert fake_states.call_count == 4
+
+    # The period moves past t0 and t1, the states are taken from the timeline
+    past_next_update = end_time + timedelta(minutes=35)
     with patch(
         "homeassistant.components.recorder.history.state_changes_during_period",
-        _fake_states,
+        fake_states,
     ), freeze_time(past_next_update):
         async_fire_time_changed(hass, past_next_update)
         await hass.async_block_till_done()
 
-    assert hass.states.get("sensor.sensor1").state == "0.83"
-    assert hass.states.get("sensor.sensor2").state == "0.833333333333333"
-    assert hass.states.get("sensor.sensor3").state == "2"
-    assert hass.states.get("sensor.sensor4").state == "83.3"
+    assert hass.states.get("sensor.sensor1").state == "0.92"
+    assert hass.states.get("sensor.sensor2").state == "0.916666666666667"
+    assert hass.states.get("sensor.sensor3").state == "1"
+    assert hass.states.get("sensor.sensor4").state == "91.7"
+    assert fake_states.call_count == 4
+
+
+async def test_sliding_window_from_timeline(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test a sliding window is computed from state changes without the database."""
+    start_time = dt_util.utcnow().replace(microsecond=0)
+
+    fake_states = MagicMock(
+        return_value={
+            "binary_sensor.state": [
+                ha.State(
+                    "binary_sensor.state",
+                    "on",
+                    last_changed=start_time - timedelta(hours=1),
+                ),
+            ]
+        }
+    )
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        fake_states,
+    ), freeze_time(start_time):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.state",
+                        "name": "sensor1",
+                        "state": "on",
+                        "start": "{{ as_timestamp(utcnow()) - 3600 }}",
+                        "end": "{{ utcnow() }}",
+                        "type": "time",
+                    }
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "1.0"
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        fake_states,
+    ):
+        turn_off_time = start_time + timedelta(minutes=10)
+        with freeze_time(turn_off_time):
+            hass.states.async_set("binary_sensor.state", "off")
+            await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.sensor1").state == "1.0"
+
+        for minutes, expected in ((40, "0.5"), (80, "0.0")):
+            next_update = start_time + timedelta(minutes=minutes)
+            with freeze_time(next_update):
+                async_fire_time_changed(hass, next_update)
+                await hass.async_block_till_done()
+
+            assert hass.states.get("sensor.sensor1").state == expected
+
+        turn_on_time = start_time + timedelta(minutes=80)
+        with freeze_time(turn_on_time):
+            hass.states.async_set("binary_sensor.state", "on")
+            await hass.async_block_till_done()
+
+        next_update = start_time + timedelta(minutes=110)
+        with freeze_time(next_update):
+            async_fire_time_changed(hass, next_update)
+            await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "0.5"
+    assert fake_states.call_count == 1
 
 
 async def test_measure_cet(recorder_mock: Recorder, hass: HomeAssistant) -> None:
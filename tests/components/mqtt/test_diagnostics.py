@@ -48,7 +48,17 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [],
         "mqtt_config": default_config,
-        "mqtt_debug_info": {"entities": [], "triggers": []},
+        "mqtt_debug_info": {
+            "entities": [],
+            "triggers": [],
+            "received_messages": {
+                "messages": 0,
+                "batches": 0,
+                "average_batch_size": 0,
+                "largest_batch_size": 0,
+                "messages_per_second": 0.0,
+            },
+        },
     }
 
     # Discover a device with an entity and a trigger
@@ -132,7 +142,7 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": default_config,
-        "mqtt_debug_info": expected_debug_info,
+        "mqtt_debug_info": {**expected_debug_info, "received_messages": ANY},
     }
 
     assert await get_diagnostics_for_device(
@@ -259,7 +269,7 @@ async def test_redact_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": expected_config,
-        "mqtt_debug_info": expected_debug_info,
+        "mqtt_debug_info": {**expected_debug_info, "received_messages": ANY},
     }
 
     assert await get_diagnostics_for_device(
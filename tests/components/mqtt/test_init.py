@@ -12,10 +12,20 @@ import pytest
 import voluptuous as vol
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt import debug_info
-from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
+from homeassistant.components.mqtt import debug_info, models
+from homeassistant.components.mqtt.client import (
+    MATCHING_SUBSCRIPTIONS_CACHE_SIZE,
+    EnsureJobAfterCooldown,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
-from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
+from homeassistant.components.mqtt.models import (
+    MESSAGE_RATE_WINDOW,
+    MessageCallbackType,
+    MessageMetrics,
+    ReceiveMessage,
+)
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import (
     ATTR_ASSUMED_STATE,
@@ -418,6 +428,35 @@ async def test_value_template_value(hass: HomeAssistant) -> None:
         assert template_state_calls.call_count == 1
 
 
+async def test_value_template_payload_decoded_once(hass: HomeAssistant) -> None:
+    """Test the templates rendering the same payload share the decoded JSON."""
+    models._decode_json_payload.cache_clear()
+    templates = [
+        mqtt.MqttValueTemplate(
+            template.Template(f"{{{{ value_json.{key} }}}}"), hass=hass
+        )
+        for key in ("temperature", "humidity", "battery")
+    ]
+    payload = '{"temperature": 21.5, "humidity": 40, "battery": 100}'
+
+    with patch(
+        "homeassistant.components.mqtt.models.json_loads", wraps=models.json_loads
+    ) as mock_json_loads:
+        assert [
+            val_tpl.async_render_with_possible_json_value(payload)
+            for val_tpl in templates
+        ] == ["21.5", "40", "100"]
+        assert mock_json_loads.call_count == 1
+
+        # Payloads which are not JSON are not decoded again either
+        val_tpl = mqtt.MqttValueTemplate(
+            template.Template("{{ value_json is defined }} {{ value }}"), hass=hass
+        )
+        for _ in range(2):
+            assert val_tpl.async_render_with_possible_json_value("on") == "False on"
+        assert mock_json_loads.call_count == 2
+
+
 async def test_value_template_fails(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -782,6 +821,86 @@ def test_validate_publish_topic() -> None:
     mqtt.valid_publish_topic("$SYS/")
 
 
+def test_subscription_trie() -> None:
+    """Test matching topics with the subscription trie."""
+    trie = SubscriptionTrie()
+    subscriptions = {
+        topic: Subscription(topic, ha.HassJob(lambda msg: None))
+        for topic in (
+            "#",
+            "+",
+            "home/+/temperature",
+            "home/#",
+            "home/+/+",
+            "$SYS/#",
+            "+/kitchen/#",
+        )
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+    assert len(trie) == 7
+    assert set(trie) == set(subscriptions.values())
+    assert "home/+/+" in trie
+    assert "home/+" not in trie
+
+    def matches(topic: str) -> set[str]:
+        return {subscription.topic for subscription in trie.match(topic)}
+
+    assert matches("home") == {"#", "+", "home/#"}
+    assert matches("home/kitchen/temperature") == {
+        "#",
+        "home/+/temperature",
+        "home/#",
+        "home/+/+",
+        "+/kitchen/#",
+    }
+    assert matches("home/kitchen") == {"#", "home/#", "+/kitchen/#"}
+    assert matches("home//temperature") == {
+        "#",
+        "home/+/temperature",
+        "home/#",
+        "home/+/+",
+    }
+    # Wildcards on the first level do not match topics starting with $
+    assert matches("$SYS/broker/uptime") == {"$SYS/#"}
+
+    trie.remove(subscriptions["home/+/temperature"])
+    trie.remove(subscriptions["home/+/+"])
+    assert len(trie) == 5
+    assert "home/+/+" not in trie
+    assert matches("home/kitchen/temperature") == {"#", "home/#", "+/kitchen/#"}
+    with pytest.raises(ValueError):
+        trie.remove(subscriptions["home/+/+"])
+
+    for topic in ("#", "+", "home/#", "$SYS/#", "+/kitchen/#"):
+        trie.remove(subscriptions[topic])
+    assert not trie
+    assert not trie._root.children
+
+
+async def test_matching_subscriptions_cache_bounded(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test the matching subscriptions of topics are cached in a bounded cache."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic/+", record_calls)
+    matching_subscriptions = mqtt.get_mqtt_data(hass).client._matching_subscriptions
+
+    async_fire_mqtt_message(hass, "test-topic/1", "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/1", "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/2", "test-payload")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 3
+    cache_info = matching_subscriptions.cache_info()
+    assert cache_info.maxsize == MATCHING_SUBSCRIPTIONS_CACHE_SIZE
+    assert cache_info.hits == 1
+    assert cache_info.misses == 2
+
+
 def test_entity_device_info_schema() -> None:
     """Test MQTT entity device info validation."""
     # just identifier
@@ -930,6 +1049,60 @@ async def test_all_subscriptions_run_when_decode_fails(
     assert len(calls) == 1
 
 
+async def test_received_messages_handled_in_batches(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test messages received until the event loop runs are handled as a batch."""
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.client import MQTTMessage
+
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic/+", record_calls)
+    mqtt_data = mqtt.get_mqtt_data(hass)
+
+    with patch.object(hass.loop, "call_soon_threadsafe") as mock_call_soon:
+        for idx in range(3):
+            msg = MQTTMessage(topic=f"test-topic/{idx}".encode())
+            msg.payload = b"test-payload"
+            mqtt_data.client._mqtt_on_message(None, None, msg)
+    assert len(mock_call_soon.mock_calls) == 1
+    mqtt_data.client._mqtt_handle_message_buffer()
+
+    assert [msg.topic for msg in calls] == [
+        "test-topic/0",
+        "test-topic/1",
+        "test-topic/2",
+    ]
+    # All messages of the batch share the timestamp
+    assert len({msg.timestamp for msg in calls}) == 1
+    metrics = mqtt_data.message_metrics.as_dict()
+    assert metrics["batches"] == 1
+    assert metrics["largest_batch_size"] == 3
+
+
+def test_message_rate_measured() -> None:
+    """Test the rate of received messages is measured over a window."""
+    with patch(
+        "homeassistant.components.mqtt.models.time.monotonic", return_value=100
+    ) as mock_monotonic:
+        metrics = MessageMetrics()
+        metrics.async_record_batch(40)
+        assert metrics.messages_per_second == 0
+        mock_monotonic.return_value = 100 + MESSAGE_RATE_WINDOW
+        metrics.async_record_batch(60)
+
+    assert metrics.as_dict() == {
+        "messages": 100,
+        "batches": 2,
+        "average_batch_size": 50,
+        "largest_batch_size": 60,
+        "messages_per_second": 100 / MESSAGE_RATE_WINDOW,
+    }
+
+
 async def test_subscribe_topic(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
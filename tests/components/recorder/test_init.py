@@ -342,6 +342,47 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_queued_events_as_batch(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test events that back up in the queue are processed as a batch."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 1}
+    )
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    await async_block_recorder(hass, 0.1)
+    with patch.object(
+        instance, "_process_events", wraps=instance._process_events
+    ) as process_events:
+        for idx in range(20):
+            hass.states.async_set(f"test.recorder_{idx}", "on", attributes)
+            hass.bus.async_fire("test_event", {"idx": idx})
+        await async_wait_recording_done(hass)
+
+    assert process_events.call_count == 1
+    assert len(process_events.call_args[0][0]) == 40
+
+    def _get_db_rows():
+        with session_scope(hass=hass, read_only=True) as session:
+            db_states = list(session.query(States))
+            db_events = list(
+                session.query(Events).filter(
+                    Events.event_type_id.in_(select_event_type_ids(("test_event",)))
+                )
+            )
+            return db_states, db_events, session.query(StateAttributes).count()
+
+    db_states, db_events, attributes_count = await instance.async_add_executor_job(
+        _get_db_rows
+    )
+    assert len(db_states) == 20
+    assert len({db_state.metadata_id for db_state in db_states}) == 20
+    assert len({db_state.attributes_id for db_state in db_states}) == 1
+    assert attributes_count == 1
+    assert len(db_events) == 20
+
+
 async def test_saving_state_with_intermixed_time_changes(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
@@ -1601,6 +1642,104 @@ def test_service_disable_run_information_recorded(tmp_path: Path) -> None:
     hass.stop()
 
 
+def test_table_manager_caches_primed_after_restart(tmp_path: Path) -> None:
+    """Test the table manager caches are primed with recent rows at startup."""
+    test_dir = tmp_path.joinpath("sqlite")
+    test_dir.mkdir()
+    test_db_file = test_dir.joinpath("test_prime_caches.db")
+    dburl = f"{SQLITE_URL_PREFIX}//{test_db_file}"
+
+    hass = get_test_home_assistant()
+    recorder_helper.async_initialize_recorder(hass)
+    setup_component(
+        hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl, CONF_COMMIT_INTERVAL: 0}}
+    )
+    hass.start()
+    wait_recording_done(hass)
+
+    hass.states.set("test.one", "on", {"color": "blue"})
+    hass.bus.fire("test_event", {"data": "test"})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        attributes_id = session.query(StateAttributes.attributes_id).one()[0]
+        data_id = (
+            session.query(EventData.data_id)
+            .filter(EventData.shared_data == '{"data":"test"}')
+            .one()[0]
+        )
+        metadata_id = (
+            session.query(StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "test.one")
+            .one()[0]
+        )
+
+    hass.stop()
+
+    hass = get_test_home_assistant()
+    recorder_helper.async_initialize_recorder(hass)
+    setup_component(
+        hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl, CONF_COMMIT_INTERVAL: 0}}
+    )
+    hass.start()
+    wait_recording_done(hass)
+
+    instance = recorder.get_instance(hass)
+    assert (
+        instance.state_attributes_manager.get_from_cache('{"color":"blue"}')
+        == attributes_id
+    )
+    assert instance.event_data_manager.get_from_cache('{"data":"test"}') == data_id
+    assert instance.states_meta_manager.get_from_cache("test.one") == metadata_id
+
+    hass.stop()
+
+
+def test_table_manager_cache_priming_failure_is_isolated(tmp_path: Path) -> None:
+    """Test a failure to prime one table manager cache does not skip the others."""
+    test_dir = tmp_path.joinpath("sqlite")
+    test_dir.mkdir()
+    test_db_file = test_dir.joinpath("test_prime_caches_failure.db")
+    dburl = f"{SQLITE_URL_PREFIX}//{test_db_file}"
+
+    hass = get_test_home_assistant()
+    recorder_helper.async_initialize_recorder(hass)
+    setup_component(
+        hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl, CONF_COMMIT_INTERVAL: 0}}
+    )
+    hass.start()
+    wait_recording_done(hass)
+
+    hass.states.set("test.one", "on", {"color": "blue"})
+    hass.bus.fire("test_event", {"data": "test"})
+    wait_recording_done(hass)
+    hass.stop()
+
+    hass = get_test_home_assistant()
+    recorder_helper.async_initialize_recorder(hass)
+    with patch(
+        "homeassistant.components.recorder.core.StateAttributesManager.load_recent",
+        side_effect=OperationalError("statement", {}, None),
+    ):
+        setup_component(
+            hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl, CONF_COMMIT_INTERVAL: 0}}
+        )
+        hass.start()
+        wait_recording_done(hass)
+
+    instance = recorder.get_instance(hass)
+    assert instance.state_attributes_manager.get_from_cache('{"color":"blue"}') is None
+    assert instance.event_data_manager.get_from_cache('{"data":"test"}') is not None
+    assert instance.states_meta_manager.get_from_cache("test.one") is not None
+
+    hass.states.set("test.one", "off", {"color": "blue"})
+    wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StateAttributes).count() == 1
+
+    hass.stop()
+
+
 class CannotSerializeMe:
     """A class that the JSONEncoder cannot serialize."""
 
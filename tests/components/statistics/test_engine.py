@@ -0,0 +1,132 @@
+"""Test the incremental statistics engine."""
+from datetime import datetime, timedelta
+import math
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.engine import StatisticsEngine
+from homeassistant.util import dt as dt_util
+
+
+def _expected(states: list[float], ages: list[datetime]) -> dict[str, float]:
+    """Return the statistics of the samples calculated from scratch."""
+    pairs = list(zip(states, states[1:]))
+    age_pairs = list(zip(ages, ages[1:]))
+    return {
+        "sum": sum(states),
+        "mean": statistics.mean(states),
+        "median": statistics.median(states),
+        "variance": statistics.variance(states),
+        "standard_deviation": statistics.stdev(states),
+        "percentile": statistics.quantiles(states, n=100, method="exclusive")[89],
+        "value_max": max(states),
+        "value_min": min(states),
+        "datetime_value_max": ages[states.index(max(states))],
+        "datetime_value_min": ages[states.index(min(states))],
+        "sum_differences": sum(abs(j - i) for i, j in pairs),
+        "sum_differences_nonnegative": sum(j - i if j >= i else j for i, j in pairs),
+        "area_linear": sum(
+            0.5 * (i + j) * (later - earlier).total_seconds()
+            for (i, j), (earlier, later) in zip(pairs, age_pairs)
+        ),
+        "area_step": sum(
+            i * (later - earlier).total_seconds()
+            for i, (earlier, later) in zip(states, age_pairs)
+        ),
+    }
+
+
+def _actual(engine: StatisticsEngine) -> dict[str, float]:
+    """Return the statistics of the engine."""
+    return {
+        "sum": engine.sum,
+        "mean": engine.mean,
+        "median": engine.median,
+        "variance": engine.variance,
+        "standard_deviation": engine.standard_deviation,
+        "percentile": engine.percentile(90),
+        "value_max": engine.value_max,
+        "value_min": engine.value_min,
+        "datetime_value_max": engine.datetime_value_max,
+        "datetime_value_min": engine.datetime_value_min,
+        "sum_differences": engine.sum_differences,
+        "sum_differences_nonnegative": engine.sum_differences_nonnegative,
+        "area_linear": engine.area_linear,
+        "area_step": engine.area_step,
+    }
+
+
+@pytest.mark.parametrize("max_size", [None, 1, 7, 50])
+def test_statistics_match_recalculation(max_size: int | None) -> None:
+    """Test the incremental statistics equal the statistics of all samples."""
+    rand = random.Random(max_size)
+    engine = StatisticsEngine(max_size)
+    states: list[float] = []
+    ages: list[datetime] = []
+    now = dt_util.utcnow()
+
+    for idx in range(500):
+        now += timedelta(seconds=rand.randint(1, 30))
+        value = rand.choice([round(rand.uniform(-50, 50), 1), 21.5, 1e6 + idx])
+        engine.add(value, now)
+        states.append(value)
+        ages.append(now)
+        if max_size is not None and len(states) > max_size:
+            del states[0]
+            del ages[0]
+        if rand.random() < 0.2 and len(states) > 1:
+            engine.remove_oldest()
+            del states[0]
+            del ages[0]
+
+        assert list(engine.states) == states
+        assert list(engine.ages) == ages
+        if len(states) < 2:
+            continue
+        expected = _expected(states, ages)
+        actual = _actual(engine)
+        # The statistics module rounds the exact results once
+        for key in ("mean", "variance", "median", "percentile"):
+            assert actual.pop(key) == expected.pop(key)
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-6)
+
+
+def test_binary_statistics() -> None:
+    """Test the statistics of binary samples."""
+    engine = StatisticsEngine(3)
+    now = dt_util.utcnow()
+    for idx, value in enumerate([True, False, True, True]):
+        engine.add(value, now + timedelta(seconds=10 * idx))
+
+    assert len(engine) == 3
+    assert engine.sum == 2
+    assert engine.value_min is False
+    assert engine.area_step == 10
+
+    engine.remove_oldest()
+    engine.remove_oldest()
+    engine.remove_oldest()
+    assert len(engine) == 0
+    engine.add(False, now)
+    assert engine.sum == 0
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_sample_rejected(value: float) -> None:
+    """Test samples which are not finite are rejected without changing the engine."""
+    engine = StatisticsEngine(2)
+    now = dt_util.utcnow()
+    engine.add(1.0, now)
+    engine.add(3.0, now + timedelta(seconds=10))
+
+    with pytest.raises(ValueError):
+        engine.add(value, now + timedelta(seconds=20))
+
+    assert list(engine.states) == [1.0, 3.0]
+    assert engine.mean == 2
+    assert engine.value_max == 3
+    engine.remove_oldest()
+    engine.remove_oldest()
+    assert len(engine) == 0
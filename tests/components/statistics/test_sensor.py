@@ -143,6 +143,15 @@ async def test_sensor_defaults_numeric(hass: HomeAssistant) -> None:
     )
     assert new_state.attributes.get("source_value_valid") is False
 
+    # Source sensor has a value which is not finite, state should not change
+    for value in ("nan", "inf", "-inf"):
+        hass.states.async_set("sensor.test_monitored", value, {})
+        await hass.async_block_till_done()
+        new_state = hass.states.get("sensor.test")
+        assert new_state is not None
+        assert new_state.state == str(new_mean)
+        assert new_state.attributes.get("source_value_valid") is False
+
     # Source sensor has the STATE_UNKNOWN state, unit and state should not change
     state = hass.states.get("sensor.test")
     hass.states.async_set("sensor.test_monitored", STATE_UNKNOWN, {})
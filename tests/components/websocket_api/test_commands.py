@@ -23,7 +23,11 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr, entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.helpers.startup_trace import (
+    async_enable_startup_trace,
+    trace_startup_phase,
+)
+from homeassistant.setup import DATA_IMPORT_TIME, DATA_SETUP_TIME, async_setup_component
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -910,13 +914,19 @@ async def test_subscribe_unsubscribe_entities(
             }
         }
     }
+    # Changes in the same event loop iteration are coalesced,
+    # so let each change be delivered separately
     hass.states.async_set("light.not_permitted", "on")
     hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    await hass.async_block_till_done()
     hass.states.async_set("light.permitted", "on", {"effect": "help"})
+    await hass.async_block_till_done()
     hass.states.async_set(
         "light.permitted", "on", {"effect": "help", "color": ["blue", "green"]}
     )
+    await hass.async_block_till_done()
     hass.states.async_remove("light.permitted")
+    await hass.async_block_till_done()
     hass.states.async_set("light.permitted", "on", {"effect": "help", "color": "blue"})
 
     msg = await websocket_client.receive_json()
@@ -1098,6 +1108,69 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_coalesces_changes(
+    hass: HomeAssistant, websocket_client
+) -> None:
+    """Test changes in the same event loop iteration are sent as one message."""
+    hass.states.async_set("light.changed", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+    hass.states.async_set("light.replaced", "off")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert set(msg["event"]["a"]) == {
+        "light.changed",
+        "light.removed",
+        "light.replaced",
+    }
+
+    hass.states.async_set("light.changed", "on", {"color": "blue"})
+    hass.states.async_set("light.added", "on")
+    hass.states.async_set("light.changed", "on", {"color": "green"})
+    hass.states.async_remove("light.removed")
+    hass.states.async_set("light.added", "off")
+    hass.states.async_set("light.transient", "on")
+    hass.states.async_remove("light.transient")
+    hass.states.async_remove("light.replaced")
+    hass.states.async_set("light.replaced", "on")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "off"}},
+        "c": {
+            "light.changed": {
+                "+": {"a": {"color": "green"}, "c": ANY, "lc": ANY, "s": "on"}
+            },
+            "light.replaced": {"+": {"c": ANY, "lc": ANY, "s": "on"}},
+        },
+        "r": ["light.removed"],
+    }
+
+    hass.states.async_set("light.changed", "off")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.changed": {
+                "+": {"c": ANY, "lc": ANY, "s": "off"},
+                "-": {"a": ["color"]},
+            }
+        }
+    }
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2348,6 +2421,69 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_startup_trace(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test fetching the startup trace."""
+    await websocket_client.send_json({"id": 5, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    trace = async_enable_startup_trace(hass)
+    with trace_startup_phase(hass, "comp", "import"):
+        pass
+    trace.async_finish()
+
+    await websocket_client.send_json({"id": 6, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    assert msg["result"] == trace.as_dict()
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 7, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_integration_setup_info_import_times(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test the import times of pre-imported modules are included."""
+    hass.data[DATA_SETUP_TIME] = {
+        "august": datetime.timedelta(seconds=12.5),
+        "isy994": datetime.timedelta(seconds=12.8),
+    }
+    hass.data[DATA_IMPORT_TIME] = {
+        "august": {
+            "homeassistant.components.august": 0.5,
+            "homeassistant.components.august.lock": 0.25,
+        },
+        "isy994": {},
+    }
+    await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "domain": "august",
+            "seconds": 12.5,
+            "import_seconds": {
+                "homeassistant.components.august": 0.5,
+                "homeassistant.components.august.lock": 0.25,
+            },
+        },
+        {"domain": "isy994", "seconds": 12.8},
+    ]
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     (
@@ -2456,24 +2592,9 @@ async def test_message_coalescing(
     hass.states.async_set("light.permitted", "on", {"color": "green"})
     hass.states.async_set("light.permitted", "on", {"color": "blue"})
 
+    # Changes in the same event loop iteration collapse to the latest state
     data = await websocket_client.receive_str()
-    msgs = json_loads(data)
-
-    msg = msgs.pop(0)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"] == {
-        "c": {"light.permitted": {"+": {"a": {"color": "yellow"}, "c": ANY, "lu": ANY}}}
-    }
-
-    msg = msgs.pop(0)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"] == {
-        "c": {"light.permitted": {"+": {"a": {"color": "green"}, "c": ANY, "lu": ANY}}}
-    }
-
-    msg = msgs.pop(0)
+    msg = json_loads(data)
     assert msg["id"] == 7
     assert msg["type"] == "event"
     assert msg["event"] == {
@@ -2500,7 +2621,6 @@ async def test_message_coalescing_not_supported_by_websocket_client(
     assert msg["success"]
 
     hass.states.async_set("light.permitted", "on", {"color": "red"})
-    hass.states.async_set("light.permitted", "on", {"color": "blue"})
 
     data = await websocket_client.receive_str()
     msg = json_loads(data)
@@ -2518,6 +2638,8 @@ async def test_message_coalescing_not_supported_by_websocket_client(
         }
     }
 
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+
     data = await websocket_client.receive_str()
     msg = json_loads(data)
     assert msg["id"] == 7
@@ -2571,24 +2693,9 @@ async def test_client_message_coalescing(
     hass.states.async_set("light.permitted", "on", {"color": "green"})
     hass.states.async_set("light.permitted", "on", {"color": "blue"})
 
+    # Changes in the same event loop iteration collapse to the latest state
     data = await websocket_client.receive_str()
-    msgs = json_loads(data)
-
-    msg = msgs.pop(0)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"] == {
-        "c": {"light.permitted": {"+": {"a": {"color": "yellow"}, "c": ANY, "lu": ANY}}}
-    }
-
-    msg = msgs.pop(0)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"] == {
-        "c": {"light.permitted": {"+": {"a": {"color": "green"}, "c": ANY, "lu": ANY}}}
-    }
-
-    msg = msgs.pop(0)
+    msg = json_loads(data)
     assert msg["id"] == 7
     assert msg["type"] == "event"
     assert msg["event"] == {
@@ -13,12 +13,22 @@ from homeassistant.components.websocket_api import (
     http,
     websocket_command,
 )
+from homeassistant.components.websocket_api.auth import (
+    TYPE_AUTH,
+    TYPE_AUTH_OK,
+    TYPE_AUTH_REQUIRED,
+)
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -503,3 +513,50 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def test_permessage_deflate_negotiated(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test clients offering permessage-deflate get compressed frames."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    client = await hass_client_no_auth()
+
+    async with client.ws_connect(const.URL, compress=15) as ws:
+        assert ws.compress == 15
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_REQUIRED
+
+        await ws.send_json({"type": TYPE_AUTH, "access_token": hass_access_token})
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_OK
+
+        await ws.send_json({"id": 5, "type": "ping"})
+        msg = await ws.receive_json()
+        assert msg == {"id": 5, "type": "pong"}
+
+
+async def test_queue_depth_and_bytes_sent_metrics(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test queue depth and bytes sent are recorded."""
+    await websocket_client.send_json({"id": 5, "type": "websocket_api/metrics"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    metrics = msg["result"]
+    assert metrics["connections"] == 1
+    assert metrics["bytes_sent"] > 0
+    assert metrics["peak_queue_depth"] >= 1
+
+    await websocket_client.send_json({"id": 6, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg == {"id": 6, "type": "pong"}
+
+    await websocket_client.send_json({"id": 7, "type": "websocket_api/metrics"})
+    msg = await websocket_client.receive_json()
+    # The result of the first metrics command was sent since
+    assert msg["result"]["bytes_sent"] > metrics["bytes_sent"] + len(
+        '{"id":6,"type":"pong"}'
+    )
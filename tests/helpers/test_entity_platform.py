@@ -1501,6 +1501,75 @@ async def test_invalid_entity_id(hass: HomeAssistant) -> None:
     assert entity.platform is None
 
 
+async def test_invalid_entity_id_other_entities_added(hass: HomeAssistant) -> None:
+    """Test the other entities are added when one entity is invalid."""
+    platform = MockEntityPlatform(hass)
+    entities = [
+        MockEntity(name="before"),
+        MockEntity(entity_id="invalid_entity_id"),
+        MockEntity(name="after"),
+    ]
+    with pytest.raises(HomeAssistantError):
+        await platform.async_add_entities(entities)
+
+    assert sorted(hass.states.async_entity_ids()) == [
+        "test_domain.after",
+        "test_domain.before",
+    ]
+
+
+async def test_add_entities_added_concurrently(hass: HomeAssistant) -> None:
+    """Test entities added without an update are added to hass concurrently."""
+    platform = MockEntityPlatform(hass)
+    added = asyncio.Event()
+    started: list[str] = []
+
+    class SlowEntity(MockEntity):
+        async def async_added_to_hass(self) -> None:
+            started.append(self.entity_id)
+            await added.wait()
+
+    entities = [SlowEntity(name="first"), SlowEntity(name="second")]
+    add_task = hass.async_create_task(platform.async_add_entities(entities))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert started == ["test_domain.first", "test_domain.second"]
+
+    added.set()
+    await add_task
+    assert len(platform.entities) == 2
+
+
+async def test_add_entities_reuses_device(hass: HomeAssistant) -> None:
+    """Test entities of the same device look up the device once."""
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+    platform = MockEntityPlatform(hass, platform_name=config_entry.domain)
+    platform.config_entry = config_entry
+
+    def device_info(identifier: str) -> DeviceInfo:
+        return DeviceInfo(identifiers={("hue", identifier)}, name=identifier)
+
+    entities = [
+        MockEntity(unique_id="1", device_info=device_info("1234")),
+        MockEntity(unique_id="2", device_info=device_info("1234")),
+        MockEntity(unique_id="3", device_info=device_info("5678")),
+    ]
+    with patch.object(
+        dr.DeviceRegistry,
+        "async_get_or_create",
+        side_effect=dr.DeviceRegistry.async_get_or_create,
+        autospec=True,
+    ) as mock_get_or_create:
+        await platform.async_add_entities(entities)
+
+    assert mock_get_or_create.call_count == 2
+    assert entities[0].device_entry is entities[1].device_entry
+    assert entities[0].device_entry.identifiers == {("hue", "1234")}
+    assert entities[2].device_entry.identifiers == {("hue", "5678")}
+    assert len(hass.states.async_entity_ids()) == 3
+
+
 class MockBlockingEntity(MockEntity):
     """Class to mock an entity that will block adding entities."""
 
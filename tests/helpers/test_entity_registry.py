@@ -1475,6 +1475,168 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry2.id) is None
 
 
+def _stored_entity(entity_id: str, platform: str, unique_id: str) -> dict[str, Any]:
+    """Return the stored data of an entity registry entry."""
+    return {
+        "aliases": [],
+        "area_id": None,
+        "capabilities": None,
+        "config_entry_id": None,
+        "device_class": None,
+        "device_id": None,
+        "disabled_by": None,
+        "entity_category": None,
+        "entity_id": entity_id,
+        "hidden_by": None,
+        "icon": None,
+        "id": f"id-{entity_id}",
+        "has_entity_name": False,
+        "name": None,
+        "options": None,
+        "original_device_class": None,
+        "original_icon": None,
+        "original_name": None,
+        "platform": platform,
+        "supported_features": 0,
+        "translation_key": None,
+        "unique_id": unique_id,
+        "unit_of_measurement": None,
+    }
+
+
+def test_entity_registry_items_stored() -> None:
+    """Test stored entries are created when they are first accessed."""
+    entities = er.EntityRegistryItems()
+    entities.add_stored(
+        [
+            _stored_entity("test.hue_1", "hue", "1"),
+            _stored_entity("test.hue_2", "hue", "2"),
+            _stored_entity("test.zha_1", "zha", "1"),
+            _stored_entity("test.mqtt_1", "mqtt", "1"),
+            _stored_entity("test.shelly_1", "shelly", "1"),
+        ]
+    )
+    assert len(entities) == 5
+    assert "test.hue_1" in entities
+    assert not entities.data
+
+    # Looking up an entry creates the entries of its platform
+    assert entities.get_entity_id(("test", "hue", "1")) == "test.hue_1"
+    assert set(entities.data) == {"test.hue_1", "test.hue_2"}
+    assert entities["test.zha_1"].platform == "zha"
+    assert entities.get_entry("id-test.mqtt_1") is entities.data["test.mqtt_1"]
+    assert "test.shelly_1" not in entities.data
+    assert len(entities) == 5
+
+    # Replacing an entry before it is created drops the stored entry
+    replacement = er.RegistryEntry("test.shelly_1", "2", "other")
+    entities["test.shelly_1"] = replacement
+    assert entities["test.shelly_1"] is replacement
+    assert entities.get_entity_id(("test", "shelly", "1")) is None
+    assert len(entities) == 5
+
+    # Iterating creates all entries
+    entities.add_stored([_stored_entity("test.deconz_1", "deconz", "1")])
+    assert list(entities) == [
+        "test.hue_1",
+        "test.hue_2",
+        "test.zha_1",
+        "test.mqtt_1",
+        "test.shelly_1",
+        "test.deconz_1",
+    ]
+    assert len(entities.values()) == 6
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_load_creates_entries_on_access(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test loading the registry creates entries when they are accessed."""
+    hass_storage[er.STORAGE_KEY] = {
+        "version": er.STORAGE_VERSION_MAJOR,
+        "minor_version": er.STORAGE_VERSION_MINOR,
+        "data": {
+            "entities": [
+                _stored_entity("light.kitchen", "hue", "1234"),
+                _stored_entity("sensor.power", "shelly", "5678"),
+            ],
+            "deleted_entities": [],
+        },
+    }
+
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+    assert not registry.entities.data
+
+    assert registry.async_get("light.kitchen").unique_id == "1234"
+    assert registry.async_get("id-sensor.power").entity_id == "sensor.power"
+    assert registry.async_get("light.unknown") is None
+    assert registry.async_get_entity_id("sensor", "shelly", "5678") == "sensor.power"
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_lookups_do_not_create_unrelated_entries(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test config entry and device lookups and saving keep other entries stored."""
+    stored_entities = [
+        {
+            **_stored_entity("light.kitchen", "hue", "1234"),
+            "config_entry_id": "hue-entry",
+            "device_id": "hue-device",
+        },
+        {
+            **_stored_entity("binary_sensor.door", "zha", "5678"),
+            "config_entry_id": "zha-entry",
+            "device_id": "zha-device",
+            "original_device_class": "door",
+        },
+        _stored_entity("sensor.power", "shelly", "9012"),
+    ]
+    hass_storage[er.STORAGE_KEY] = {
+        "version": er.STORAGE_VERSION_MAJOR,
+        "minor_version": er.STORAGE_VERSION_MINOR,
+        "data": {"entities": stored_entities, "deleted_entities": []},
+    }
+
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+
+    assert registry.async_get_device_class_lookup(
+        {("binary_sensor", "door"), ("light", None)}
+    ) == {
+        "hue-device": {("light", None): "light.kitchen"},
+        "zha-device": {("binary_sensor", "door"): "binary_sensor.door"},
+    }
+    assert not registry.entities.data
+
+    assert [
+        entry.entity_id
+        for entry in er.async_entries_for_config_entry(registry, "hue-entry")
+    ] == ["light.kitchen"]
+    assert [
+        entry.entity_id for entry in er.async_entries_for_device(registry, "zha-device")
+    ] == ["binary_sensor.door"]
+    assert set(registry.entities.data) == {"light.kitchen", "binary_sensor.door"}
+
+    registry.async_update_entity("light.kitchen", device_id="other-device")
+    assert er.async_entries_for_device(registry, "hue-device") == []
+    assert er.async_entries_for_device(registry, "other-device") == [
+        registry.async_get("light.kitchen")
+    ]
+
+    # Entries which were never accessed are saved as they were loaded
+    data = registry._data_to_save()
+    assert "sensor.power" not in registry.entities.data
+    assert data["entities"][-1] == stored_entities[2]
+    assert [entity["entity_id"] for entity in data["entities"]] == [
+        "light.kitchen",
+        "binary_sensor.door",
+        "sensor.power",
+    ]
+
+
 async def test_disabled_by_str_not_allowed(hass: HomeAssistant) -> None:
     """Test we need to pass disabled by type."""
     reg = er.async_get(hass)
@@ -429,6 +429,96 @@ async def test_async_track_state_change_filtered(hass: HomeAssistant) -> None:
     track_throws.async_remove()
 
 
+async def test_async_track_state_change_filtered_domain_added_later(
+    hass: HomeAssistant,
+) -> None:
+    """Test a domain tracker fires for entities added after subscribing."""
+    tracker_calls = []
+
+    @ha.callback
+    def run_callback(event: EventType[EventStateChangedData]) -> None:
+        tracker_calls.append(event.data["entity_id"])
+
+    hass.states.async_set("light.existing", "on")
+    await hass.async_block_till_done()
+
+    track = async_track_state_change_filtered(
+        hass, TrackStates(False, set(), {"light"}), run_callback
+    )
+
+    hass.states.async_set("light.new", "on")
+    await hass.async_block_till_done()
+    assert tracker_calls == ["light.new"]
+
+    hass.states.async_set("light.new", "off")
+    hass.states.async_set("light.existing", "off")
+    hass.states.async_set("switch.other", "off")
+    await hass.async_block_till_done()
+    assert tracker_calls == ["light.new", "light.new", "light.existing"]
+
+    hass.states.async_remove("light.new")
+    await hass.async_block_till_done()
+    assert tracker_calls == ["light.new", "light.new", "light.existing", "light.new"]
+
+    track.async_remove()
+    hass.states.async_set("light.existing", "on")
+    await hass.async_block_till_done()
+    assert len(tracker_calls) == 4
+
+
+async def test_async_track_state_change_filtered_entity_and_domain(
+    hass: HomeAssistant,
+) -> None:
+    """Test tracking an entity and its domain only fires once per change."""
+    tracker_calls = []
+
+    @ha.callback
+    def run_callback(event: EventType[EventStateChangedData]) -> None:
+        tracker_calls.append(event.data["entity_id"])
+
+    track = async_track_state_change_filtered(
+        hass, TrackStates(False, {"light.a", "switch.b"}, {"light"}), run_callback
+    )
+
+    hass.states.async_set("light.a", "on")
+    await hass.async_block_till_done()
+    assert tracker_calls == ["light.a"]
+
+    hass.states.async_set("switch.b", "on")
+    await hass.async_block_till_done()
+    assert tracker_calls == ["light.a", "switch.b"]
+
+    # Dropping the domain keeps the entity listener
+    track.async_update_listeners(TrackStates(False, {"light.a"}, set()))
+    hass.states.async_set("light.a", "off")
+    hass.states.async_set("light.c", "off")
+    await hass.async_block_till_done()
+    assert tracker_calls == ["light.a", "switch.b", "light.a"]
+
+    track.async_remove()
+
+
+async def test_async_track_state_change_event_ignores_non_entity_ids(
+    hass: HomeAssistant,
+) -> None:
+    """Test domains and MATCH_ALL are not tracked as entity_ids."""
+    tracker_calls = []
+
+    @ha.callback
+    def run_callback(event: EventType[EventStateChangedData]) -> None:
+        tracker_calls.append(event)
+
+    unsub_domain = async_track_state_change_event(hass, "light", run_callback)
+    unsub_all = async_track_state_change_event(hass, [MATCH_ALL], run_callback)
+
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    assert tracker_calls == []
+
+    unsub_domain()
+    unsub_all()
+
+
 async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     """Test async_track_state_change_event."""
     single_entity_id_tracker = []
@@ -3463,6 +3553,42 @@ async def test_async_track_template_result_multiple_templates_mixing_listeners(
     info.async_remove()
 
 
+async def test_track_same_state_match_all(hass: HomeAssistant) -> None:
+    """Test track_same_state with MATCH_ALL is canceled by any entity."""
+    callback_runs = []
+    check_func = []
+    period = timedelta(minutes=1)
+
+    @ha.callback
+    def callback_run_callback():
+        callback_runs.append(1)
+
+    @ha.callback
+    def async_check_func(entity, from_s, to_s):
+        check_func.append(entity)
+        return entity != "switch.cancel"
+
+    async_track_same_state(hass, period, callback_run_callback, async_check_func)
+
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    assert check_func == ["light.bowl"]
+
+    future = dt_util.utcnow() + period
+    async_fire_time_changed(hass, future)
+    await hass.async_block_till_done()
+    assert len(callback_runs) == 1
+
+    async_track_same_state(hass, period, callback_run_callback, async_check_func)
+    hass.states.async_set("switch.cancel", "on")
+    await hass.async_block_till_done()
+    assert check_func == ["light.bowl", "switch.cancel"]
+
+    async_fire_time_changed(hass, future + period)
+    await hass.async_block_till_done()
+    assert len(callback_runs) == 1
+
+
 async def test_track_same_state_simple_no_trigger(hass: HomeAssistant) -> None:
     """Test track_same_change with no trigger."""
     callback_runs = []
@@ -0,0 +1,140 @@
+"""Test the startup trace helper."""
+import asyncio
+import logging
+import pathlib
+import time
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import update_coordinator
+from homeassistant.helpers.startup_trace import (
+    STARTUP_TRACE_FILE,
+    async_enable_startup_trace,
+    async_finish_startup_trace,
+    async_get_startup_trace,
+    trace_startup_phase,
+)
+from homeassistant.setup import async_setup_component
+from homeassistant.util.json import load_json
+
+from tests.common import MockConfigEntry, MockModule, mock_integration
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _spans(trace: dict[str, Any]) -> list[tuple[str, str, str]]:
+    """Return the track, name and category of the spans in a trace."""
+    tracks = {
+        event["tid"]: event["args"]["name"]
+        for event in trace["traceEvents"]
+        if event["ph"] == "M"
+    }
+    return [
+        (tracks[event["tid"]], event["name"], event["cat"])
+        for event in trace["traceEvents"]
+        if event["ph"] == "X"
+    ]
+
+
+async def test_trace_disabled(hass: HomeAssistant) -> None:
+    """Test nothing is recorded when the trace is not enabled."""
+    assert async_get_startup_trace(hass) is None
+    with trace_startup_phase(hass, "test", "import"):
+        pass
+    await async_finish_startup_trace(hass)
+
+
+async def test_trace_setup_phases(hass: HomeAssistant) -> None:
+    """Test the phases of setting up an integration are recorded."""
+    trace = async_enable_startup_trace(hass)
+    mock_integration(hass, MockModule("comp"))
+
+    assert await async_setup_component(hass, "comp", {})
+
+    spans = _spans(trace.as_dict())
+    assert ("comp", "requirements", "setup") in spans
+    assert ("comp", "import", "setup") in spans
+    assert ("comp", "async_setup", "setup") in spans
+    assert ("comp", "setup", "setup") in spans
+    trace.async_finish()
+
+
+async def test_trace_first_refresh(hass: HomeAssistant) -> None:
+    """Test the first refresh of a coordinator is recorded."""
+    trace = async_enable_startup_trace(hass)
+    entry = MockConfigEntry(domain="comp")
+    coordinator = update_coordinator.DataUpdateCoordinator[int](
+        hass, _LOGGER, name="poller", update_method=lambda: asyncio.sleep(0)
+    )
+    coordinator.config_entry = entry
+
+    await coordinator.async_config_entry_first_refresh()
+
+    assert _spans(trace.as_dict()) == [
+        ("comp", "first refresh poller", "first refresh")
+    ]
+    trace.async_finish()
+
+
+async def test_trace_loop_blocked(hass: HomeAssistant) -> None:
+    """Test blocking the event loop is recorded."""
+    trace = async_enable_startup_trace(hass)
+
+    # The next check of the event loop runs a second late
+    with patch(
+        "homeassistant.helpers.startup_trace.monotonic",
+        return_value=time.monotonic() + 1,
+    ):
+        await asyncio.sleep(0.1)
+
+    assert ("event loop", "loop blocked", "loop blocked") in _spans(trace.as_dict())
+    trace.async_finish()
+
+
+async def test_trace_written_to_config_dir(
+    hass: HomeAssistant, tmp_path: pathlib.Path
+) -> None:
+    """Test the trace is written as a Chrome trace file when finished."""
+    hass.config.config_dir = str(tmp_path)
+    trace = async_enable_startup_trace(hass)
+    with trace_startup_phase(hass, "comp", "import"):
+        pass
+
+    await async_finish_startup_trace(hass)
+    assert trace.finished
+
+    # Phases after finishing are not recorded
+    with trace_startup_phase(hass, "comp", "async_setup"):
+        pass
+
+    data = load_json(tmp_path / STARTUP_TRACE_FILE)
+    assert data == trace.as_dict()
+    assert data["displayTimeUnit"] == "ms"
+    assert _spans(data) == [("comp", "import", "setup")]
+
+
+async def test_trace_finished_on_started(
+    hass: HomeAssistant, tmp_path: pathlib.Path
+) -> None:
+    """Test the trace is finished when Home Assistant has started."""
+    hass.config.config_dir = str(tmp_path)
+    trace = async_enable_startup_trace(hass)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    assert trace.finished
+    assert (tmp_path / STARTUP_TRACE_FILE).exists()
+
+
+async def test_trace_loop_monitor_stopped_on_stop(hass: HomeAssistant) -> None:
+    """Test the event loop is no longer monitored once Home Assistant stops."""
+    trace = async_enable_startup_trace(hass)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    assert trace.finished
+    assert trace._loop_check_handle is None
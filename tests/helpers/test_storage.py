@@ -733,3 +733,223 @@ async def test_read_only_store(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
     await hass.async_block_till_done()
     assert read_only_store.key not in hass_storage
+
+
+async def test_writes_are_batched(tmpdir: py.path.local) -> None:
+    """Test writes of multiple stores are written in a single batch."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    tmp_storage = await hass.async_add_executor_job(tmpdir.mkdir, "temp_storage")
+    hass.config.config_dir = tmp_storage
+
+    stores = [
+        storage.Store(hass, MOCK_VERSION, "batch-plain"),
+        storage.Store(hass, MOCK_VERSION, "batch-atomic", atomic_writes=True),
+        storage.Store(hass, MOCK_VERSION, "batch-private", private=True),
+    ]
+    await asyncio.gather(*(store.async_save(MOCK_DATA) for store in stores))
+
+    writer = storage.async_get_storage_writer(hass)
+    assert writer.batches == 1
+    assert writer.writes == 3
+    assert writer.bytes_written == sum(os.path.getsize(store.path) for store in stores)
+    assert writer.stats["max_latency"] >= writer.stats["last_latency"] > 0
+
+    for store in stores:
+        reloaded = storage.Store(hass, MOCK_VERSION, store.key)
+        assert await reloaded.async_load() == MOCK_DATA
+    assert os.stat(stores[1].path).st_mode & 0o777 == 0o644
+    assert os.stat(stores[2].path).st_mode & 0o777 == 0o600
+
+    # Writes requested while a batch is written go in the next batch
+    await asyncio.gather(*(store.async_save(MOCK_DATA2) for store in stores))
+    assert writer.batches == 2
+    assert writer.writes == 6
+
+    await hass.async_stop(force=True)
+
+
+async def test_batched_write_error(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failing write does not fail the other writes of the batch."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    tmp_storage = await hass.async_add_executor_job(tmpdir.mkdir, "temp_storage")
+    hass.config.config_dir = tmp_storage
+
+    good_store = storage.Store(hass, MOCK_VERSION, "batch-good", atomic_writes=True)
+    bad_store = storage.Store(hass, MOCK_VERSION, "batch-bad", atomic_writes=True)
+    await asyncio.gather(
+        good_store.async_save(MOCK_DATA),
+        bad_store.async_save({"bad": object()}),
+    )
+
+    assert "Error writing config for batch-bad" in caplog.text
+    assert os.path.exists(good_store.path)
+    assert not os.path.exists(bad_store.path)
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal(tmpdir: py.path.local) -> None:
+    """Test changes are appended to the journal and replayed when loading."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    tmp_storage = await hass.async_add_executor_job(tmpdir.mkdir, "temp_storage")
+    hass.config.config_dir = tmp_storage
+    journal_path = f"{hass.config.path(storage.STORAGE_DIR, MOCK_KEY)}.journal"
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    await store.async_save(
+        {"items": [{"id": "a", "value": 1}, {"id": "b", "value": 1}], "other": 1}
+    )
+    # The first write is a snapshot
+    assert not os.path.exists(journal_path)
+    with open(store.path) as fh:
+        snapshot = fh.read()
+
+    await store.async_save(
+        {"items": [{"id": "b", "value": 2}, {"id": "c", "value": 1}], "other": 2}
+    )
+    # Only the changes are appended to the journal
+    with open(store.path) as fh:
+        assert fh.read() == snapshot
+    with open(journal_path) as fh:
+        records = [json.loads(line) for line in fh]
+    assert records[0] == {"journal_id": json.loads(snapshot)["journal_id"]}
+    assert sorted(records[1:], key=lambda record: record["key"]) == [
+        {"key": "items", "id": "b", "item": {"id": "b", "value": 2}},
+        {"key": "items", "id": "c", "item": {"id": "c", "value": 1}},
+        {"key": "items", "id": "a"},
+        {"key": "other", "value": 2},
+    ]
+
+    # Nothing is appended if nothing changed
+    await store.async_save(
+        {"items": [{"id": "b", "value": 2}, {"id": "c", "value": 1}], "other": 2}
+    )
+    with open(journal_path) as fh:
+        assert len(fh.readlines()) == 5
+
+    store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store2.async_load() == {
+        "items": [{"id": "b", "value": 2}, {"id": "c", "value": 1}],
+        "other": 2,
+    }
+
+    # The journal is continued after loading
+    await store2.async_save(
+        {"items": [{"id": "b", "value": 3}, {"id": "c", "value": 1}], "other": 2}
+    )
+    with open(journal_path) as fh:
+        assert json.loads(fh.readlines()[-1]) == {
+            "key": "items",
+            "id": "b",
+            "item": {"id": "b", "value": 3},
+        }
+    assert await storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal=True
+    ).async_load() == {
+        "items": [{"id": "b", "value": 3}, {"id": "c", "value": 1}],
+        "other": 2,
+    }
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into a snapshot."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    tmp_storage = await hass.async_add_executor_job(tmpdir.mkdir, "temp_storage")
+    hass.config.config_dir = tmp_storage
+    journal_path = f"{hass.config.path(storage.STORAGE_DIR, MOCK_KEY)}.journal"
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    await store.async_save({"items": [{"id": "a", "value": 0}]})
+
+    with patch.object(storage, "JOURNAL_MAX_RECORDS", 2):
+        for value in range(1, 4):
+            await store.async_save({"items": [{"id": "a", "value": value}]})
+            assert os.path.exists(journal_path) is (value != 3)
+
+    with open(store.path) as fh:
+        assert json.load(fh)["data"] == {"items": [{"id": "a", "value": 3}]}
+
+    await store.async_save({"items": [{"id": "a", "value": 4}]})
+    assert os.path.exists(journal_path)
+
+    # The journal is compacted when Home Assistant shuts down
+    hass.state = CoreState.final_write
+    await store.async_save({"items": [{"id": "a", "value": 5}]})
+    assert not os.path.exists(journal_path)
+    with open(store.path) as fh:
+        assert json.load(fh)["data"] == {"items": [{"id": "a", "value": 5}]}
+
+    hass.state = CoreState.running
+    await hass.async_stop(force=True)
+
+
+async def test_journal_interrupted_writes(tmpdir: py.path.local) -> None:
+    """Test stale journals and incomplete records are not replayed."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    tmp_storage = await hass.async_add_executor_job(tmpdir.mkdir, "temp_storage")
+    hass.config.config_dir = tmp_storage
+    journal_path = f"{hass.config.path(storage.STORAGE_DIR, MOCK_KEY)}.journal"
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    await store.async_save({"items": [{"id": "a", "value": 0}]})
+    await store.async_save({"items": [{"id": "a", "value": 1}]})
+
+    # A record that was not completely written is ignored
+    with open(journal_path, "a") as fh:
+        fh.write('{"key":"items","id":"a","item":{"id"')
+    assert await storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal=True
+    ).async_load() == {"items": [{"id": "a", "value": 1}]}
+
+    # Changes after an incomplete record are not lost on the next restarts
+    store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store2.async_load() == {"items": [{"id": "a", "value": 1}]}
+    await store2.async_save(
+        {"items": [{"id": "a", "value": 2}, {"id": "b", "value": 1}]}
+    )
+    store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store3.async_load() == {
+        "items": [{"id": "a", "value": 2}, {"id": "b", "value": 1}]
+    }
+    await store3.async_save(
+        {"items": [{"id": "a", "value": 3}, {"id": "b", "value": 1}]}
+    )
+    assert await storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal=True
+    ).async_load() == {"items": [{"id": "a", "value": 3}, {"id": "b", "value": 1}]}
+
+    # A journal of an older snapshot is ignored
+    with open(journal_path) as fh:
+        stale_journal = fh.read()
+    hass.state = CoreState.final_write
+    await store.async_save({"items": [{"id": "a", "value": 2}]})
+    hass.state = CoreState.running
+    with open(journal_path, "w") as fh:
+        fh.write(stale_journal)
+    store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store2.async_load() == {"items": [{"id": "a", "value": 2}]}
+
+    # The stale journal is replaced with the next change
+    await store2.async_save({"items": [{"id": "a", "value": 3}]})
+    assert await storage.Store(
+        hass, MOCK_VERSION, MOCK_KEY, journal=True
+    ).async_load() == {"items": [{"id": "a", "value": 3}]}
+
+    await store2.async_remove()
+    assert not os.path.exists(journal_path)
+
+    await hass.async_stop(force=True)
@@ -1409,6 +1409,21 @@ def test_render_with_possible_json_value_with_invalid_json(hass: HomeAssistant)
     assert tpl.async_render_with_possible_json_value("{ I AM NOT JSON }") == ""
 
 
+def test_render_with_possible_json_value_decoded_by_caller(
+    hass: HomeAssistant,
+) -> None:
+    """Render with possible JSON value with JSON decoded by the caller."""
+    tpl = template.Template("{{ value_json.hello }}", hass)
+    assert (
+        tpl.async_render_with_possible_json_value(
+            '{"hello": "world"}',
+            variables={"value_json": {"hello": "decoded"}},
+            parse_json=False,
+        )
+        == "decoded"
+    )
+
+
 def test_render_with_possible_json_value_with_template_error_value(
     hass: HomeAssistant,
 ) -> None:
@@ -4093,9 +4108,94 @@ async def test_cache_garbage_collection() -> None:
     del tpl
     assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
+    # The compiled code is kept alive by the LRU
+    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    template.CACHED_COMPILED_TEMPLATES_LRU.clear()
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+@pytest.mark.parametrize(
+    ("template_string", "variables", "fast_render"),
+    [
+        ("{{ states('sensor.test') }}", {}, True),
+        ("{{ states('sensor.missing') }}", {}, True),
+        ("{{ state_attr('sensor.test', 'unit') }}", {}, True),
+        ("{{ is_state('sensor.test', '21.5') }}", {}, True),
+        ("{{ states.sensor.test.state }}", {}, True),
+        ("{{ value_json.temperature }}", {"value_json": {"temperature": 21.5}}, True),
+        ("{{ value_json['list'][1] }}", {"value_json": {"list": [1, 2]}}, True),
+        ("{{ value_json.missing }}", {"value_json": {}}, True),
+        ("{{ value | float * 10 }}", {"value": "2.5"}, True),
+        ("{{ value | round(1) }}", {"value": "2.54"}, True),
+        ("{{ -(value | int) }}", {"value": "3"}, True),
+        ("{{ states('sensor.test') }}", {"states": lambda entity_id: "x"}, True),
+        ("{{ value ~ 'x' }}", {"value": "1"}, False),
+        ("{{ states('sensor.test') }} °C", {}, False),
+        ("{{ states('sensor.test') | lower }}", {}, False),
+    ],
+)
+async def test_fast_render(
+    hass: HomeAssistant,
+    template_string: str,
+    variables: dict[str, Any],
+    fast_render: bool,
+) -> None:
+    """Test simple templates bypass jinja with identical results."""
+    hass.states.async_set("sensor.test", "21.5", {"unit": "°C"})
+
+    tpl = template.Template(template_string, hass)
+    info = tpl.async_render_to_info(variables)
+    assert (tpl._fast_render is not None) is fast_render
+
+    jinja_tpl = template.Template(template_string, hass)
+    jinja_tpl._ensure_compiled()
+    jinja_tpl._fast_render = None
+    jinja_info = jinja_tpl.async_render_to_info(variables)
+
+    assert info.result() == jinja_info.result()
+    assert info.entities == jinja_info.entities
+    assert info.domains == jinja_info.domains
+    assert info.all_states == jinja_info.all_states
+
+
+async def test_fast_render_errors(hass: HomeAssistant) -> None:
+    """Test the fast render path raises the same errors as jinja."""
+    tpl = template.Template("{{ value | float * 10 }}", hass)
+    with pytest.raises(TemplateError, match="float got invalid input 'abc'"):
+        tpl.async_render({"value": "abc"})
+    assert tpl._fast_render is not None
+
+    tpl = template.Template("{{ states('sensor.test') }}", hass)
+    with pytest.raises(TemplateError, match="not supported in limited templates"):
+        tpl.async_render(limited=True)
+    assert tpl._fast_render is not None
+
+
+async def test_compiled_template_cache_shared(hass: HomeAssistant) -> None:
+    """Test identical templates share compiled code per environment flavour."""
+    template_string = "{{ 'compiled' ~ ' once' }}"
+    template.CACHED_COMPILED_TEMPLATES_LRU.clear()
+    hits, misses = template.CACHED_COMPILED_TEMPLATES_LRU.get_stats()
+
+    tpl = template.Template(template_string, hass)
+    assert tpl.async_render() == "compiled once"
+    assert template.CACHED_COMPILED_TEMPLATES_LRU.get_stats() == (hits, misses + 1)
+
+    env = template.TemplateEnvironment(hass)
+    assert env.compile(template_string) is tpl._compiled_code
+    assert template.CACHED_COMPILED_TEMPLATES_LRU.get_stats() == (
+        hits + 1,
+        misses + 1,
+    )
+
+    limited_env = template.TemplateEnvironment(hass, limited=True)
+    assert limited_env.compile(template_string) is not tpl._compiled_code
+    assert template.CACHED_COMPILED_TEMPLATES_LRU.get_stats() == (
+        hits + 1,
+        misses + 2,
+    )
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
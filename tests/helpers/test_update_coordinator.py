@@ -1,6 +1,7 @@
 """Tests for the update coordinator."""
 import asyncio
 from datetime import timedelta
+import gc
 import logging
 from unittest.mock import AsyncMock, Mock, patch
 import urllib.error
@@ -716,3 +717,286 @@ async def test_always_callback_when_always_update_is_true(
     update_callback.reset_mock()
 
     remove_callbacks()
+
+
+async def test_refreshes_are_spread(hass: HomeAssistant) -> None:
+    """Test refreshes due in the same second are spread over the interval."""
+    coordinators = [get_crd(hass, DEFAULT_UPDATE_INTERVAL) for _ in range(12)]
+    unsubs = [crd.async_add_listener(Mock()) for crd in coordinators]
+
+    now = hass.loop.time()
+    slots: dict[int, int] = {}
+    for crd in coordinators:
+        assert now < crd._next_refresh < now + DEFAULT_UPDATE_INTERVAL.seconds + 1
+        assert int(crd._next_refresh) == crd.refresh_slot
+        slots[crd.refresh_slot] = slots.get(crd.refresh_slot, 0) + 1
+    assert len(slots) == 3
+    assert max(slots.values()) == update_coordinator.REFRESH_SLOT_CAPACITY
+
+    for unsub in unsubs:
+        unsub()
+    assert not update_coordinator.async_get_refresh_scheduler(hass).coordinators
+
+
+@pytest.mark.parametrize(
+    ("consecutive_failures", "factor"),
+    [(0, 1), (2, 1), (3, 2), (4, 4), (5, 8), (10, 8)],
+)
+async def test_refresh_backoff(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+    consecutive_failures: int,
+    factor: int,
+) -> None:
+    """Test the update interval is backed off while refreshes keep failing."""
+    scheduler = update_coordinator.async_get_refresh_scheduler(hass)
+    crd.refresh_metrics.consecutive_failures = consecutive_failures
+
+    last_refresh = hass.loop.time()
+    next_refresh = scheduler.async_schedule(crd, last_refresh)
+
+    assert next_refresh == last_refresh + DEFAULT_UPDATE_INTERVAL.seconds * factor
+    # Backing off does not skip a refresh which was due
+    assert crd.refresh_metrics.skipped_refreshes == 0
+    scheduler.async_remove(crd)
+
+
+async def test_refresh_failures_are_counted(
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test the refresh metrics count consecutive failures."""
+    unsub = crd.async_add_listener(Mock())
+    crd.update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+
+    for _ in range(3):
+        await crd.async_refresh()
+    metrics = crd.refresh_metrics
+    assert metrics.refreshes == 3
+    assert metrics.failed_refreshes == 3
+    assert metrics.consecutive_failures == 3
+
+    crd.update_method = AsyncMock(return_value=1)
+    await crd.async_refresh()
+    assert metrics.refreshes == 4
+    assert metrics.failed_refreshes == 3
+    assert metrics.consecutive_failures == 0
+    assert metrics.last_latency is not None
+    assert metrics.average_latency is not None
+
+    unsub()
+
+
+async def test_refresh_stretched_when_saturated(
+    hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
+) -> None:
+    """Test the update interval is stretched while the event loop lags."""
+    scheduler = update_coordinator.async_get_refresh_scheduler(hass)
+    assert not scheduler.saturated
+    scheduler.loop_lag = 1
+
+    assert scheduler.saturated
+    unsub = crd.async_add_listener(Mock())
+    assert crd._next_refresh > hass.loop.time() + DEFAULT_UPDATE_INTERVAL.seconds
+    assert crd.refresh_metrics.skipped_refreshes == 0
+    unsub()
+
+
+async def test_saturated_by_refreshes_in_flight(hass: HomeAssistant) -> None:
+    """Test the scheduler is saturated while too many refreshes are in flight."""
+    scheduler = update_coordinator.async_get_refresh_scheduler(hass)
+    release = asyncio.Event()
+
+    async def refresh() -> int:
+        await release.wait()
+        return 1
+
+    coordinators = [
+        get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+        for _ in range(update_coordinator.REFRESH_SATURATED_IN_FLIGHT + 1)
+    ]
+    for crd in coordinators:
+        crd.update_method = refresh
+    tasks = [hass.async_create_task(crd.async_refresh()) for crd in coordinators]
+    await asyncio.sleep(0)
+    assert scheduler.in_flight == update_coordinator.REFRESH_SATURATED_IN_FLIGHT + 1
+    assert scheduler.saturated
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert scheduler.in_flight == 0
+    assert not scheduler.saturated
+
+
+async def test_scheduler_does_not_keep_coordinators(hass: HomeAssistant) -> None:
+    """Test the scheduler does not keep dropped coordinators alive."""
+    scheduler = update_coordinator.async_get_refresh_scheduler(hass)
+    crd = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+    crd.async_add_listener(Mock())
+    assert len(scheduler.coordinators) == 1
+
+    crd._async_unsub_refresh()
+    del crd
+    gc.collect()
+    assert len(scheduler.coordinators) == 0
+
+
+async def test_loop_lag_measured(
+    hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
+) -> None:
+    """Test the event loop lag is measured when a scheduled refresh runs."""
+    scheduler = update_coordinator.async_get_refresh_scheduler(hass)
+    scheduler.loop_lag = 1
+    unsub = crd.async_add_listener(Mock())
+
+    async_fire_time_changed(hass, utcnow() + DEFAULT_UPDATE_INTERVAL * 2)
+    await hass.async_block_till_done()
+
+    assert crd.data == 1
+    assert scheduler.loop_lag < 1
+    unsub()
+
+
+async def test_scheduled_refresh_skipped_while_refreshing(
+    hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
+) -> None:
+    """Test a scheduled refresh is skipped while a refresh is running."""
+    unsub = crd.async_add_listener(Mock())
+    release = asyncio.Event()
+
+    async def refresh() -> int:
+        await release.wait()
+        return 1
+
+    crd.update_method = refresh
+    task = hass.async_create_task(crd.async_refresh())
+    await asyncio.sleep(0)
+
+    await crd._handle_refresh_interval(utcnow())
+    assert crd.refresh_metrics.skipped_refreshes == 1
+    assert crd.refresh_metrics.refreshes == 0
+
+    release.set()
+    await task
+    assert crd.refresh_metrics.refreshes == 1
+    scheduler = update_coordinator.async_get_refresh_scheduler(hass)
+    assert scheduler.async_metrics() == {crd.job_name: crd.refresh_metrics}
+    unsub()
+
+
+async def test_in_flight_fetches_are_shared(hass: HomeAssistant) -> None:
+    """Test coordinators with the same fetch key share an in flight fetch."""
+    release = asyncio.Event()
+    calls = 0
+
+    async def refresh() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    coordinators = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass, _LOGGER, name="test", update_method=refresh, fetch_key="endpoint"
+        )
+        for _ in range(3)
+    ]
+    tasks = [hass.async_create_task(crd.async_refresh()) for crd in coordinators]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert [crd.data for crd in coordinators] == [1, 1, 1]
+    assert sum(crd.refresh_metrics.upstream_fetches for crd in coordinators) == 1
+    assert sum(crd.refresh_metrics.shared_fetches for crd in coordinators) == 2
+
+    # Without a time to live the result is not reused after the fetch
+    await coordinators[0].async_refresh()
+    assert calls == 2
+    assert coordinators[0].data == 2
+
+
+async def test_shared_fetch_failure(hass: HomeAssistant) -> None:
+    """Test a failed shared fetch fails all waiting coordinators."""
+    release = asyncio.Event()
+
+    async def refresh() -> int:
+        await release.wait()
+        raise update_coordinator.UpdateFailed("Boom")
+
+    coordinators = [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass, _LOGGER, name="test", update_method=refresh, fetch_key="endpoint"
+        )
+        for _ in range(2)
+    ]
+    tasks = [hass.async_create_task(crd.async_refresh()) for crd in coordinators]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    for crd in coordinators:
+        assert not crd.last_update_success
+        assert isinstance(crd.last_exception, update_coordinator.UpdateFailed)
+
+
+async def test_cancelled_shared_fetch(hass: HomeAssistant) -> None:
+    """Test waiting coordinators fetch again when the shared fetch is cancelled."""
+    release = asyncio.Event()
+    calls = 0
+
+    async def refresh() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    first, second = (
+        update_coordinator.DataUpdateCoordinator[int](
+            hass, _LOGGER, name="test", update_method=refresh, fetch_key="endpoint"
+        )
+        for _ in range(2)
+    )
+    first_task = hass.async_create_task(first.async_refresh())
+    await asyncio.sleep(0)
+    second_task = hass.async_create_task(second.async_refresh())
+    await asyncio.sleep(0)
+
+    first_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first_task
+    await asyncio.sleep(0)
+    release.set()
+    await second_task
+
+    assert calls == 2
+    assert second.data == 2
+    assert second.refresh_metrics.upstream_fetches == 1
+    assert second.refresh_metrics.shared_fetches == 0
+
+
+async def test_fetch_cached_for_ttl(
+    hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
+) -> None:
+    """Test fetched data is reused by refreshes within the time to live."""
+    crd.cache_ttl = timedelta(seconds=5)
+
+    await crd.async_refresh()
+    await crd.async_refresh()
+    assert crd.data == 1
+    assert crd.refresh_metrics.upstream_fetches == 1
+    assert crd.refresh_metrics.cache_hits == 1
+    assert crd.refresh_metrics.cache_hit_rate == 0.5
+
+    with patch(
+        "homeassistant.helpers.update_coordinator.monotonic",
+        return_value=update_coordinator.monotonic() + 6,
+    ):
+        await crd.async_refresh()
+    assert crd.data == 2
+
+    # Manually updated data replaces the cached result
+    crd.async_set_updated_data(10)
+    await crd.async_refresh()
+    assert crd.data == 3
+    assert crd.refresh_metrics.upstream_fetches == 3
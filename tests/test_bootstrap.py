@@ -3,12 +3,13 @@ import asyncio
 from collections.abc import Generator, Iterable
 import glob
 import os
+import sys
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, runner
+from homeassistant import bootstrap, runner, setup
 import homeassistant.config as config_util
 from homeassistant.config_entries import HANDLERS, ConfigEntry
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -16,7 +17,13 @@ from homeassistant.core import HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.loader import Integration
+from homeassistant.loader import (
+    DATA_INTEGRATIONS,
+    DATA_PRE_IMPORTS,
+    Integration,
+    async_get_integration,
+)
+from homeassistant.setup import DATA_IMPORT_TIME
 
 from .common import (
     MockConfigEntry,
@@ -958,3 +965,125 @@ async def test_bootstrap_dependencies(
     assert (
         f"Dependency {integration} will wait for dependencies ['mqtt']" in caplog.text
     )
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_pre_import_integrations(hass: HomeAssistant) -> None:
+    """Test integrations are imported after their dependencies."""
+    hass.config.skip_pip = True
+    integrations = {
+        domain: Integration(
+            hass,
+            f"custom_components.pre_{domain}",
+            None,
+            {"domain": domain, "name": domain, "dependencies": dependencies},
+        )
+        for domain, dependencies in (
+            ("top", ["middle", "bottom"]),
+            ("middle", ["bottom"]),
+            ("bottom", []),
+            ("broken", []),
+        )
+    }
+    integrations["with_requirements"] = Integration(
+        hass,
+        "custom_components.pre_with_requirements",
+        None,
+        {
+            "domain": "with_requirements",
+            "name": "with_requirements",
+            "requirements": ["some-package==1.0"],
+        },
+    )
+    hass.data[DATA_INTEGRATIONS].update(integrations)
+    for integration in integrations.values():
+        assert await integration.resolve_dependencies()
+
+    imported: list[str] = []
+
+    def mock_import_module(name: str) -> None:
+        if name == "custom_components.pre_broken":
+            raise ImportError("Boom")
+        imported.append(name)
+
+    with patch(
+        "homeassistant.bootstrap.importlib.import_module",
+        side_effect=mock_import_module,
+    ):
+        bootstrap._async_pre_import_integrations(hass, {}, integrations)
+        await hass.async_block_till_done()
+
+    assert sorted(imported) == [
+        "custom_components.pre_bottom",
+        "custom_components.pre_middle",
+        "custom_components.pre_top",
+    ]
+    assert imported.index("custom_components.pre_bottom") < imported.index(
+        "custom_components.pre_middle"
+    )
+    assert imported.index("custom_components.pre_middle") < imported.index(
+        "custom_components.pre_top"
+    )
+    import_time = hass.data[DATA_IMPORT_TIME]
+    assert set(import_time["top"]) == {"custom_components.pre_top"}
+    assert import_time["broken"] == {}
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_pre_import_platforms(hass: HomeAssistant) -> None:
+    """Test platforms set up from YAML and config entries are imported."""
+    hass.config.skip_pip = True
+    MockConfigEntry(domain="kitchen_sink").add_to_hass(hass)
+    integrations = {
+        domain: await async_get_integration(hass, domain)
+        for domain in ("kitchen_sink", "template", "sensor")
+    }
+    config = {
+        "sensor": [{"platform": "template"}],
+        "template": {},
+        "kitchen_sink": {},
+    }
+
+    imported: list[str] = []
+    with patch(
+        "homeassistant.bootstrap.importlib.import_module", side_effect=imported.append
+    ), patch.dict(sys.modules, clear=False) as modules:
+        for module_name in list(modules):
+            if module_name.startswith(
+                (
+                    "homeassistant.components.kitchen_sink",
+                    "homeassistant.components.template",
+                )
+            ):
+                del modules[module_name]
+        bootstrap._async_pre_import_integrations(hass, config, integrations)
+        await hass.async_block_till_done()
+
+    assert "homeassistant.components.template.sensor" in imported
+    assert "homeassistant.components.template.light" not in imported
+    assert "homeassistant.components.kitchen_sink.sensor" in imported
+    assert "homeassistant.components.kitchen_sink.lock" in imported
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_waits_for_pre_import(hass: HomeAssistant) -> None:
+    """Test setting up an integration waits until it is pre-imported."""
+    mock_integration(hass, MockModule("comp"))
+    pre_import: asyncio.Future[None] = hass.loop.create_future()
+    hass.data[DATA_PRE_IMPORTS] = {"comp": pre_import}
+
+    setup_task = hass.async_create_task(setup.async_setup_component(hass, "comp", {}))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert not setup_task.done()
+
+    pre_import.set_result(None)
+    assert await setup_task
+    assert "comp" in hass.config.components
+
+    # Pre-imports of integrations which were not set up are cancelled
+    pending: asyncio.Future[None] = hass.loop.create_future()
+    hass.data[DATA_PRE_IMPORTS] = {"other": pending}
+    bootstrap._async_cancel_pre_imports(hass)
+    assert pending.cancelled()
+    assert DATA_PRE_IMPORTS not in hass.data
@@ -814,6 +814,179 @@ async def test_eventbus_run_immediately(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_batch_listener(hass: HomeAssistant) -> None:
+    """Test events fired in the same loop iteration are dispatched as a batch."""
+    calls = []
+
+    @ha.callback
+    def listener(events):
+        """Mock batch listener."""
+        calls.append(events)
+
+    @ha.callback
+    def filter(event):
+        """Mock filter."""
+        return not event.data.get("filtered")
+
+    unsub = hass.bus.async_listen_batch("test", listener, event_filter=filter)
+    assert hass.bus.async_listeners()["test"] == 1
+
+    hass.bus.async_fire("test", {"id": 1})
+    hass.bus.async_fire("other", {"id": 2})
+    hass.bus.async_fire("test", {"id": 3, "filtered": True})
+    hass.bus.async_fire("test", {"id": 4})
+    assert len(calls) == 0
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert [event.data["id"] for event in calls[0]] == [1, 4]
+
+    hass.bus.async_fire("test", {"filtered": True})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    hass.bus.async_fire("test", {"id": 5})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert [event.data["id"] for event in calls[1]] == [5]
+
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+
+    hass.bus.async_fire("test", {"id": 6})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+async def test_eventbus_batch_listener_match_all(hass: HomeAssistant) -> None:
+    """Test MATCH_ALL batch listeners get all event types in one batch."""
+    calls = []
+
+    async def listener(events):
+        """Mock batch listener."""
+        calls.append(events)
+
+    unsub = hass.bus.async_listen_batch(MATCH_ALL, listener)
+
+    hass.bus.async_fire("test_1")
+    hass.bus.async_fire("test_2")
+    hass.bus.async_fire("test_1")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert [event.event_type for event in calls[0]] == [
+        "test_1",
+        "test_2",
+        "test_1",
+    ]
+
+    unsub()
+
+
+async def test_eventbus_batch_listener_subscribed_while_pending(
+    hass: HomeAssistant,
+) -> None:
+    """Test batch listeners do not get events fired before they subscribed."""
+    early_calls = []
+    late_calls = []
+
+    @ha.callback
+    def early_listener(events):
+        """Mock batch listener subscribed before the event."""
+        early_calls.append(events)
+
+    @ha.callback
+    def late_listener(events):
+        """Mock batch listener subscribed after the event."""
+        late_calls.append(events)
+
+    unsub_early = hass.bus.async_listen_batch("test", early_listener)
+    hass.bus.async_fire("test", {"idx": 1})
+    unsub_late = hass.bus.async_listen_batch("test", late_listener)
+    hass.bus.async_fire("test", {"idx": 2})
+    await hass.async_block_till_done()
+
+    assert [[event.data["idx"] for event in batch] for batch in early_calls] == [[1, 2]]
+    assert [[event.data["idx"] for event in batch] for batch in late_calls] == [[2]]
+
+    unsub_early()
+    unsub_late()
+
+
+async def test_eventbus_batch_listener_flushed_on_stop(hass: HomeAssistant) -> None:
+    """Test pending batched events are delivered in each shutdown stage."""
+    calls = []
+
+    @ha.callback
+    def listener(events):
+        """Mock batch listener."""
+        calls.append(([event.event_type for event in events], hass.state))
+
+    @ha.callback
+    def stop_listener(event):
+        """Fire an event while stopping."""
+        hass.bus.async_fire("test_on_stop")
+
+    hass.bus.async_listen_batch(MATCH_ALL, listener)
+    hass.bus.async_listen_batch(EVENT_HOMEASSISTANT_CLOSE, listener)
+    hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, stop_listener, run_immediately=True)
+
+    # Without waiting for the loop the batches must still be delivered
+    with patch.object(hass, "async_block_till_done"):
+        await hass.async_stop()
+
+    assert calls == [
+        ([EVENT_HOMEASSISTANT_STOP, "test_on_stop"], ha.CoreState.stopping),
+        ([EVENT_HOMEASSISTANT_FINAL_WRITE], ha.CoreState.final_write),
+        ([EVENT_HOMEASSISTANT_CLOSE], ha.CoreState.not_running),
+    ]
+    assert hass.bus._batch_flush_handle is None
+
+
+async def test_eventbus_batch_listener_errors(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test errors in batch filters and listeners are logged."""
+    calls = []
+
+    @ha.callback
+    def listener(events):
+        """Mock batch listener."""
+        calls.append(events)
+
+    @ha.callback
+    def bad_filter(event):
+        """Mock filter that raises."""
+        raise ValueError("bad filter")
+
+    @ha.callback
+    def bad_listener(events):
+        """Mock batch listener that raises."""
+        raise ValueError("bad listener")
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_batch("test", listener, event_filter=lambda e: True)
+
+    unsub_filter = hass.bus.async_listen_batch(
+        "test", listener, event_filter=bad_filter
+    )
+    unsub_bad = hass.bus.async_listen_batch("test", bad_listener)
+    unsub = hass.bus.async_listen_batch("test", listener)
+
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert "Error in event filter" in caplog.text
+    assert "Error running job" in caplog.text
+
+    unsub_filter()
+    unsub_bad()
+    unsub()
+    unsub()
+    assert "Unable to remove unknown batch job listener" in caplog.text
+
+
 async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -1098,6 +1271,42 @@ async def test_statemachine_last_changed_not_updated_on_same_state(
     assert state.last_changed == state2.last_changed
 
 
+async def test_statemachine_shares_attributes(hass: HomeAssistant) -> None:
+    """Test equal attributes are shared between states."""
+    attrs = {"unit_of_measurement": "°C", "device_class": "temperature"}
+    hass.states.async_set("sensor.one", "1", attrs)
+    hass.states.async_set("sensor.two", "2", dict(attrs))
+    state_one = hass.states.get("sensor.one")
+    state_two = hass.states.get("sensor.two")
+    assert state_one.attributes is state_two.attributes
+    assert state_one.attributes is not attrs
+    assert state_one.attributes == attrs
+
+    # Unchanged attributes are reused when the state changes
+    hass.states.async_set("sensor.one", "3", attrs)
+    assert hass.states.get("sensor.one").attributes is state_one.attributes
+
+    # Values that compare equal but have a different type are not shared
+    hass.states.async_set("sensor.int", "1", {"value": 1})
+    hass.states.async_set("sensor.bool", "1", {"value": True})
+    assert type(hass.states.get("sensor.int").attributes["value"]) is int
+    assert hass.states.get("sensor.bool").attributes["value"] is True
+
+    # Equal containers may hold values of different types
+    hass.states.async_set("light.int", "on", {"rgb_color": (255, 0, 0)})
+    hass.states.async_set("light.float", "on", {"rgb_color": (255.0, 0.0, 0.0)})
+    assert type(hass.states.get("light.int").attributes["rgb_color"][0]) is int
+    assert type(hass.states.get("light.float").attributes["rgb_color"][0]) is float
+
+    # Unhashable values are not shared but still stored
+    hass.states.async_set("sensor.list_one", "1", {"items": [1, 2]})
+    hass.states.async_set("sensor.list_two", "1", {"items": [1, 2]})
+    list_one = hass.states.get("sensor.list_one")
+    list_two = hass.states.get("sensor.list_two")
+    assert list_one.attributes == list_two.attributes == {"items": [1, 2]}
+    assert list_one.attributes is not list_two.attributes
+
+
 async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     """Test force update option."""
     hass.states.async_set("light.bowl", "on", {})
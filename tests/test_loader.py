@@ -1,4 +1,7 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+import pathlib
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -7,8 +10,14 @@ from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_component_dependencies(hass: HomeAssistant) -> None:
@@ -733,3 +742,104 @@ async def test_loggers(hass: HomeAssistant) -> None:
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+HUE_MANIFEST_PATH = str(pathlib.Path(hue.__file__).parent / "manifest.json")
+
+
+@pytest.fixture
+def release_version():
+    """Pretend to run a release version."""
+    with patch("homeassistant.loader.HA_VERSION", "2023.10.0"):
+        yield
+
+
+async def test_manifest_index_saved(
+    hass: HomeAssistant, hass_storage: dict[str, Any], release_version: None
+) -> None:
+    """Test manifests read from disk are saved to the index."""
+    integration = await loader.async_get_integration(hass, "hue")
+    assert loader.MANIFEST_INDEX_STORAGE_KEY not in hass_storage
+
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_INDEX_SAVE_DELAY + 1),
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]
+    assert data["ha_version"] == "2023.10.0"
+    entry = data["manifests"][HUE_MANIFEST_PATH]
+    # Built-in manifests are trusted for a release version
+    assert entry["mtime"] is None
+    assert entry["manifest"]["name"] == integration.name
+
+
+async def test_manifest_index_used(
+    hass: HomeAssistant, hass_storage: dict[str, Any], release_version: None
+) -> None:
+    """Test manifests are loaded from the index."""
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY] = {
+        "version": loader.MANIFEST_INDEX_STORAGE_VERSION,
+        "data": {
+            "ha_version": "2023.10.0",
+            "manifests": {
+                HUE_MANIFEST_PATH: {
+                    "mtime": None,
+                    "manifest": {"domain": "hue", "name": "Indexed Hue"},
+                }
+            },
+        },
+    }
+    with patch.object(pathlib.Path, "read_text") as mock_read_text:
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert integration.name == "Indexed Hue"
+    assert not mock_read_text.called
+
+
+async def test_manifest_index_discarded_after_update(
+    hass: HomeAssistant, hass_storage: dict[str, Any], release_version: None
+) -> None:
+    """Test the index is not used after Home Assistant was updated."""
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY] = {
+        "version": loader.MANIFEST_INDEX_STORAGE_VERSION,
+        "data": {
+            "ha_version": "2023.9.0",
+            "manifests": {
+                HUE_MANIFEST_PATH: {
+                    "mtime": None,
+                    "manifest": {"domain": "hue", "name": "Indexed Hue"},
+                }
+            },
+        },
+    }
+    integration = await loader.async_get_integration(hass, "hue")
+    assert integration.name == "Philips Hue"
+
+
+async def test_manifest_index_stale_custom_integration(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    enable_custom_integrations: None,
+) -> None:
+    """Test changed manifests of custom integrations are read again."""
+    manifest_path = str(
+        pathlib.Path(hass.config.path("custom_components"))
+        / "test_package"
+        / "manifest.json"
+    )
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY] = {
+        "version": loader.MANIFEST_INDEX_STORAGE_VERSION,
+        "data": {
+            "ha_version": loader.HA_VERSION,
+            "manifests": {
+                manifest_path: {
+                    "mtime": 0,
+                    "manifest": {"domain": "test_package", "name": "Stale"},
+                }
+            },
+        },
+    }
+    integration = await loader.async_get_integration(hass, "test_package")
+    assert integration.name == "Test Package"
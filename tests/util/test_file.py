@@ -6,7 +6,12 @@ from unittest.mock import patch
 import py
 import pytest
 
-from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
+from homeassistant.util.file import (
+    WriteError,
+    write_utf8_file,
+    write_utf8_file_atomic,
+    write_utf8_files_atomic,
+)
 
 
 @pytest.mark.parametrize("func", [write_utf8_file, write_utf8_file_atomic])
@@ -82,3 +87,44 @@ def test_write_utf8_file_atomic_fails(tmpdir: py.path.local) -> None:
         write_utf8_file_atomic(test_file, '{"some":"data"}', False)
 
     assert not os.path.exists(test_file)
+
+
+def test_write_utf8_files_atomic(tmpdir: py.path.local) -> None:
+    """Test multiple files are written atomically with a shared fsync."""
+    test_dir = tmpdir.mkdir("files")
+    public_file = str(test_dir / "public.json")
+    private_file = str(test_dir / "private.json")
+
+    with patch("homeassistant.util.file.os.fsync", wraps=os.fsync) as mock_fsync:
+        errors = write_utf8_files_atomic(
+            [
+                (public_file, '{"some":"data"}', False),
+                (private_file, '{"other":"data"}', True),
+            ]
+        )
+
+    assert errors == {}
+    # One fsync per file and one for the directory
+    assert mock_fsync.call_count == 3
+    with open(public_file) as fh:
+        assert fh.read() == '{"some":"data"}'
+    with open(private_file) as fh:
+        assert fh.read() == '{"other":"data"}'
+    assert os.stat(public_file).st_mode & 0o777 == 0o644
+    assert os.stat(private_file).st_mode & 0o777 == 0o600
+    assert sorted(os.listdir(test_dir)) == ["private.json", "public.json"]
+
+
+def test_write_utf8_files_atomic_error(tmpdir: py.path.local) -> None:
+    """Test a file that fails to write does not stop the other files."""
+    test_dir = tmpdir.mkdir("files")
+    good_file = str(test_dir / "good.json")
+    bad_file = str(test_dir / "missing" / "bad.json")
+
+    errors = write_utf8_files_atomic(
+        [(bad_file, '{"some":"data"}', False), (good_file, '{"some":"data"}', False)]
+    )
+
+    assert list(errors) == [bad_file]
+    assert isinstance(errors[bad_file], WriteError)
+    assert sorted(os.listdir(test_dir)) == ["good.json"]
@@ -1,5 +1,7 @@
 """Test Home Assistant json utility functions."""
+import mmap
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -28,6 +30,25 @@ def test_load_bad_data(tmp_path: Path) -> None:
     assert isinstance(err.value.__cause__, ValueError)
 
 
+def test_load_json_memory_mapped(tmp_path: Path) -> None:
+    """Test large files are parsed from a memory mapping."""
+    fname = tmp_path / "test5.json"
+    with open(fname, "w", encoding="utf8") as handle:
+        handle.write('{"a": 1, "B": "two"}')
+    bad_fname = tmp_path / "test6.json"
+    with open(bad_fname, "w") as fh:
+        fh.write(TEST_BAD_SERIALIED)
+
+    with patch("homeassistant.util.json.MMAP_MIN_SIZE", 1), patch(
+        "homeassistant.util.json.mmap.mmap", wraps=mmap.mmap
+    ) as mock_mmap:
+        assert load_json(fname) == TEST_JSON_A
+        with pytest.raises(HomeAssistantError) as err:
+            load_json(bad_fname)
+    assert isinstance(err.value.__cause__, ValueError)
+    assert mock_mmap.call_count == 2
+
+
 def test_load_json_os_error() -> None:
     """Test trying to load JSON data from a directory."""
     fname = "/"